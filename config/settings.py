@@ -28,6 +28,7 @@ class APIConfig:
     openalex_base_url: str = 'https://api.openalex.org/'
     openalex_email: str = field(default_factory=lambda: os.getenv('OPENALEX_EMAIL', ''))
     openalex_rate_limit: float = 0.1  # 10 requests/sec for polite pool
+    openalex_from_date: str = '2020-01-01'  # Only works published since
     
     # Crossref API (free, for publication metadata)
     crossref_base_url: str = 'https://api.crossref.org/'
@@ -41,6 +42,12 @@ class APIConfig:
     # ClinicalTrials.gov API (free)
     clinicaltrials_base_url: str = 'https://clinicaltrials.gov/api/v2/'
     clinicaltrials_rate_limit: float = 0.5
+    
+    # On-disk response cache for PubMed, NIH RePORTER and OpenAlex, in seconds
+    # (0 disables). Handy during development re-runs.
+    response_cache_ttl: float = field(
+        default_factory=lambda: float(os.getenv('BIOLEADS_API_CACHE_TTL', '0'))
+    )
 
 
 @dataclass
@@ -13,6 +13,18 @@ from typing import List, Dict, Optional
 import streamlit as st
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pandas parses CSV on multiple threads with the pyarrow engine
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _CSV_ENGINE = 'c'
+
 # Fix imports for both module and direct execution
 if __name__ == "__main__":
     # Add parent directories to path when running directly
@@ -92,31 +104,52 @@ def create_app():
         render_export(filtered_leads)
 
 
+def _parse_json(data: bytes):
+    """
+    Decode JSON, with orjson when available.
+    
+    main.py writes leads with ``json.dump``, which emits ``NaN`` for
+    missing floats; orjson rejects that, so such files fall back to json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+@st.cache_data(show_spinner=False)
+def _read_leads_csv(path: str, mtime: float) -> List[Dict]:
+    """Parse a leads CSV; ``mtime`` is part of the cache key so edits are picked up."""
+    return pd.read_csv(path, engine=_CSV_ENGINE).to_dict('records')
+
+
+@st.cache_data(show_spinner=False)
+def _read_leads_json(path: str, mtime: float) -> List[Dict]:
+    """Parse a leads JSON file; ``mtime`` is part of the cache key so edits are picked up."""
+    return _parse_json(Path(path).read_bytes())
+
+
 def load_leads() -> List[Dict]:
     """Load leads from the output directory."""
-    # Try to load from session state first
+    # Sample or uploaded leads chosen in this session take precedence
     if 'leads' in st.session_state and st.session_state.leads:
         return st.session_state.leads
     
-    # Try to load from file
+    # Try to load from file (parsed once per file version, across reruns)
     try:
         base_path = Path(__file__).parent.parent / 'data' / 'output'
         
         # Try JSON first
         json_path = base_path / 'leads.json'
         if json_path.exists():
-            with open(json_path, 'r') as f:
-                leads = json.load(f)
-                st.session_state.leads = leads
-                return leads
+            return _read_leads_json(str(json_path), json_path.stat().st_mtime)
         
         # Try CSV
         csv_path = base_path / 'leads.csv'
         if csv_path.exists():
-            df = pd.read_csv(csv_path)
-            leads = df.to_dict('records')
-            st.session_state.leads = leads
-            return leads
+            return _read_leads_csv(str(csv_path), csv_path.stat().st_mtime)
     except Exception as e:
         st.error(f"Error loading leads: {e}")
     
@@ -244,7 +277,7 @@ def render_empty_state():
         if uploaded_file:
             try:
                 if uploaded_file.name.endswith('.json'):
-                    leads = json.load(uploaded_file)
+                    leads = _parse_json(uploaded_file.getvalue())
                 else:
                     df = pd.read_csv(uploaded_file)
                     leads = df.to_dict('records')
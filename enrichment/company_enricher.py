@@ -236,7 +236,7 @@ class CompanyEnricher:
                     )
                     
         except Exception as e:
-            self.logger.debug(f"OpenAlex lookup failed for {institution_name}: {e}")
+            self.logger.debug("OpenAlex lookup failed for %s: %s", institution_name, e)
         
         return None
     
@@ -11,6 +11,8 @@ from dataclasses import dataclass
 
 import requests
 
+_INVALID_LOCAL_CHARS = re.compile(r'[^a-z0-9._-]')
+
 
 @dataclass
 class EmailPattern:
@@ -19,23 +21,17 @@ class EmailPattern:
     pattern: str  # e.g., "{first}.{last}", "{f}{last}"
     confidence: float  # 0.0 - 1.0
     
+    def fill(self, first: str, last: str) -> str:
+        """Substitute (already lowercased) names into the pattern."""
+        # Patterns use str.format field names, so this is one pass
+        return self.pattern.format(first=first, last=last, f=first[:1], l=last[:1])
+    
     def generate(self, first_name: str, last_name: str, domain: str) -> str:
         """Generate email from pattern."""
-        first = first_name.lower().strip()
-        last = last_name.lower().strip()
-        f = first[0] if first else ''
-        l = last[0] if last else ''
-        
-        email_local = (
-            self.pattern
-            .replace('{first}', first)
-            .replace('{last}', last)
-            .replace('{f}', f)
-            .replace('{l}', l)
-        )
+        email_local = self.fill(first_name.lower().strip(), last_name.lower().strip())
         
         # Clean up any special characters
-        email_local = re.sub(r'[^a-z0-9._-]', '', email_local)
+        email_local = _INVALID_LOCAL_CHARS.sub('', email_local)
         
         return f"{email_local}@{domain}"
 
@@ -52,6 +48,31 @@ COMMON_PATTERNS = [
     EmailPattern('firstl', '{first}{l}', 0.45),
 ]
 
+# Known institution domains, matched by substring in this order
+KNOWN_DOMAINS = {
+    'harvard': 'harvard.edu',
+    'mit': 'mit.edu',
+    'stanford': 'stanford.edu',
+    'yale': 'yale.edu',
+    'nih': 'nih.gov',
+    'fda': 'fda.gov',
+    'johns hopkins': 'jhu.edu',
+    'university of california': 'ucla.edu',
+    'columbia': 'columbia.edu',
+    'oxford': 'ox.ac.uk',
+    'cambridge': 'cam.ac.uk',
+    'pfizer': 'pfizer.com',
+    'novartis': 'novartis.com',
+    'roche': 'roche.com',
+    'merck': 'merck.com',
+    'johnson & johnson': 'jnj.com',
+    'genentech': 'gene.com',
+    'amgen': 'amgen.com',
+    'abbvie': 'abbvie.com',
+    'gilead': 'gilead.com',
+    'biogen': 'biogen.com',
+}
+
 
 class EmailFinder:
     """
@@ -150,7 +171,7 @@ class EmailFinder:
                     return emails[0].get('email')
                     
         except Exception as e:
-            self.logger.debug(f"ORCID lookup failed for {orcid}: {e}")
+            self.logger.debug("ORCID lookup failed for %s: %s", orcid, e)
         
         return None
     
@@ -170,31 +191,7 @@ class EmailFinder:
         institution_lower = institution.lower()
         
         # Known institution domains
-        known_domains = {
-            'harvard': 'harvard.edu',
-            'mit': 'mit.edu',
-            'stanford': 'stanford.edu',
-            'yale': 'yale.edu',
-            'nih': 'nih.gov',
-            'fda': 'fda.gov',
-            'johns hopkins': 'jhu.edu',
-            'university of california': 'ucla.edu',
-            'columbia': 'columbia.edu',
-            'oxford': 'ox.ac.uk',
-            'cambridge': 'cam.ac.uk',
-            'pfizer': 'pfizer.com',
-            'novartis': 'novartis.com',
-            'roche': 'roche.com',
-            'merck': 'merck.com',
-            'johnson & johnson': 'jnj.com',
-            'genentech': 'gene.com',
-            'amgen': 'amgen.com',
-            'abbvie': 'abbvie.com',
-            'gilead': 'gilead.com',
-            'biogen': 'biogen.com',
-        }
-        
-        for key, domain in known_domains.items():
+        for key, domain in KNOWN_DOMAINS.items():
             if key in institution_lower:
                 return domain
         
@@ -285,21 +282,15 @@ class EmailFinder:
             
             # Detect which pattern matches
             for pattern in COMMON_PATTERNS:
-                expected_local = (
-                    pattern.pattern
-                    .replace('{first}', first)
-                    .replace('{last}', last)
-                    .replace('{f}', first[0] if first else '')
-                    .replace('{l}', last[0] if last else '')
-                )
+                expected_local = pattern.fill(first, last)
                 
                 if local == expected_local:
                     self._domain_patterns[domain] = pattern
-                    self.logger.info(f"Learned pattern '{pattern.name}' for domain {domain}")
+                    self.logger.info("Learned pattern '%s' for domain %s", pattern.name, domain)
                     break
                     
         except Exception as e:
-            self.logger.debug(f"Could not learn pattern from {email}: {e}")
+            self.logger.debug("Could not learn pattern from %s: %s", email, e)
     
     def batch_find_emails(self, leads: List[Dict]) -> List[Dict]:
         """
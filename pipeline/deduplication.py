@@ -4,9 +4,21 @@ Merge and deduplicate leads from multiple sources.
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import re
+import string
+
+import numpy as np
+
+try:
+    from rapidfuzz import fuzz as rapidfuzz_fuzz
+    from rapidfuzz import process as rapidfuzz_process
+except ImportError:
+    rapidfuzz_fuzz = rapidfuzz_process = None
 
 try:
     from fuzzywuzzy import fuzz
@@ -14,14 +26,154 @@ except ImportError:
     fuzz = None
 
 
+def _rapidfuzz_ratio(s1: str, s2: str) -> int:
+    """fuzzywuzzy's ``fuzz.ratio`` (rounded to an int) on rapidfuzz's C core."""
+    return int(round(rapidfuzz_fuzz.ratio(s1, s2)))
+
+
+# Similarity ratio (0-100) for names and institutions, or None for
+# exact matching only. rapidfuzz computes the same Indel ratio as
+# fuzzywuzzy with python-Levenshtein, without the Python wrappers.
+if rapidfuzz_fuzz is not None:
+    _ratio = _rapidfuzz_ratio
+elif fuzz is not None:
+    _ratio = fuzz.ratio
+else:
+    _ratio = None
+
+
+# Below this many candidate pairs across all buckets, process start-up
+# and pickling cost more than the fuzzy matching they would spread out
+PARALLEL_MIN_PAIRS = 200000
+
+# Buckets this large are scored as one rapidfuzz cdist matrix; below it
+# the pair loop wins, since it skips leads as soon as they are merged
+MATRIX_MIN_BUCKET = 20
+
+# Titles and suffixes dropped from names, with an optional trailing period
+_TITLE_RE = re.compile(r'\b(?:Dr|Prof|PhD|MD|Jr|Sr|III|II)\b\.?', re.I)
+
+# Punctuation left after title removal separates name parts ("Smith, J.");
+# apostrophes belong to the name (O'Neil)
+_PUNCTUATION_TO_SPACE = str.maketrans({c: ' ' for c in string.punctuation if c != "'"})
+
+
 @dataclass
 class MatchResult:
     """Result of a deduplication match."""
     is_match: bool
     confidence: float
     match_type: str  # exact, fuzzy_name, email, orcid
+
+
+def _resolve_bucket(
+    indices: List[int],
+    names: List[str],
+    insts: List[str],
+    name_threshold: int,
+    institution_threshold: int,
+) -> List[Tuple[int, int]]:
+    """
+    Resolve fuzzy name/institution matches inside one name bucket.
+    
+    Works on pre-normalized names and institutions so the pair loop only
+    calls the scorer. Email/ORCID matches are settled before this runs.
+    
+    Args:
+        indices: Lead indices in the bucket (none already merged)
+        names: Normalized name per lead index (list or dict)
+        insts: Lowercased institution per lead index (list or dict)
+        name_threshold: Fuzzy match threshold for names
+        institution_threshold: Fuzzy match threshold for institutions
+        
+    Returns:
+        List of (secondary_idx, primary_idx) merge pairs
+    """
+    if rapidfuzz_process is not None and len(indices) >= MATRIX_MIN_BUCKET:
+        return _resolve_bucket_matrix(
+            indices, names, insts, name_threshold, institution_threshold,
+        )
+    
+    pairs = []
+    merged = set()
+    ratio = _ratio
     
+    for i, primary in enumerate(indices):
+        if primary in merged:
+            continue
+        name_i = names[primary]
+        inst_i = insts[primary]
+        
+        for secondary in indices[i + 1:]:
+            if secondary in merged:
+                continue
+            name_j = names[secondary]
+            
+            if ratio is None:
+                # Basic matching without a fuzzy matcher
+                is_match = name_i == name_j
+            else:
+                is_match = False
+                name_score = ratio(name_i, name_j)
+                if name_score >= name_threshold:
+                    inst_j = insts[secondary]
+                    if inst_i and inst_j:
+                        is_match = ratio(inst_i, inst_j) >= institution_threshold
+                    else:
+                        # Very high name match without institution
+                        is_match = name_score >= 95
+            
+            if is_match:
+                merged.add(secondary)
+                pairs.append((secondary, primary))
     
+    return pairs
+
+
+def _resolve_bucket_matrix(
+    indices: List[int],
+    names: List[str],
+    insts: List[str],
+    name_threshold: int,
+    institution_threshold: int,
+) -> List[Tuple[int, int]]:
+    """
+    ``_resolve_bucket`` for large buckets, with all ratios from rapidfuzz cdist.
+    
+    Applies the same rules and the same greedy merge order as the pair
+    loop; only the scoring moves into rapidfuzz's batch C code.
+    """
+    bucket_names = [names[idx] for idx in indices]
+    bucket_insts = [insts[idx] for idx in indices]
+    
+    # Rounded like _rapidfuzz_ratio, so thresholds compare the same way
+    score = partial(rapidfuzz_process.cdist, scorer=rapidfuzz_fuzz.ratio, dtype=np.float64)
+    if len(set(bucket_names)) == 1:
+        # Buckets share a normalized name, so this is the usual case
+        name_scores = np.full((len(indices), len(indices)), 100.0)
+    else:
+        name_scores = np.rint(score(bucket_names, bucket_names))
+    inst_scores = np.rint(score(bucket_insts, bucket_insts))
+    has_inst = np.array([bool(inst) for inst in bucket_insts])
+    both_insts = np.logical_and.outer(has_inst, has_inst)
+    
+    # Very high name match without institution
+    matches = (name_scores >= name_threshold) & np.where(
+        both_insts, inst_scores >= institution_threshold, name_scores >= 95,
+    )
+    
+    pairs = []
+    merged = np.zeros(len(indices), dtype=bool)
+    for i, primary in enumerate(indices):
+        if merged[i]:
+            continue
+        hits = np.flatnonzero(matches[i, i + 1:] & ~merged[i + 1:]) + i + 1
+        merged[hits] = True
+        pairs.extend((indices[j], primary) for j in hits.tolist())
+    
+    return pairs
+
+
 class Deduplicator:
     """
     Merge leads from multiple sources and remove duplicates.
@@ -36,6 +188,8 @@ class Deduplicator:
         self,
         name_threshold: int = 85,
         institution_threshold: int = 70,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize deduplicator.
@@ -43,13 +197,18 @@ class Deduplicator:
         Args:
             name_threshold: Fuzzy match threshold for names (0-100)
             institution_threshold: Fuzzy match threshold for institutions
+            parallel: Score name buckets in worker processes when there is
+                more than one CPU and enough pairwise work to pay for it
+            max_workers: Maximum worker processes (None = CPU count)
         """
         self.name_threshold = name_threshold
         self.institution_threshold = institution_threshold
+        self.parallel = parallel
+        self.max_workers = max_workers
         self.logger = logging.getLogger('bioleads.pipeline.deduplication')
         
-        if fuzz is None:
-            self.logger.warning("fuzzywuzzy not installed. Using basic matching only.")
+        if _ratio is None:
+            self.logger.warning("Neither rapidfuzz nor fuzzywuzzy installed. Using basic matching only.")
     
     def deduplicate(self, leads: List[Dict]) -> List[Dict]:
         """
@@ -64,13 +223,17 @@ class Deduplicator:
         if not leads:
             return []
         
-        self.logger.info(f"Deduplicating {len(leads)} leads...")
+        self.logger.info("Deduplicating %s leads...", len(leads))
         
         # Group leads by various keys for faster matching
         email_index: Dict[str, List[int]] = {}
         orcid_index: Dict[str, List[int]] = {}
         name_index: Dict[str, List[int]] = {}
         
+        # Normalized keys per lead, computed once for the fuzzy phase
+        names: List[str] = []
+        insts: List[str] = []
+        
         for i, lead in enumerate(leads):
             # Index by email
             email = self._normalize_email(lead.get('email'))
@@ -89,6 +252,8 @@ class Deduplicator:
             
             # Index by normalized name
             name_key = self._normalize_name(lead.get('name', ''))
+            names.append(name_key)
+            insts.append((lead.get('institution', '') or '').lower())
             if name_key:
                 if name_key not in name_index:
                     name_index[name_key] = []
@@ -113,22 +278,20 @@ class Deduplicator:
                         merged_into[secondary] = primary
         
         # Phase 2: Fuzzy name matching within same institution
+        buckets = []
         for name_key, indices in name_index.items():
+            # Leads already merged by email/ORCID never need fuzzy checks
+            indices = [idx for idx in indices if idx not in merged_into]
             if len(indices) > 1:
-                # Check institution similarity
-                for i in range(len(indices)):
-                    if indices[i] in merged_into:
-                        continue
-                    for j in range(i + 1, len(indices)):
-                        if indices[j] in merged_into:
-                            continue
-                        
-                        lead_i = leads[indices[i]]
-                        lead_j = leads[indices[j]]
-                        
-                        match = self._check_match(lead_i, lead_j)
-                        if match.is_match:
-                            merged_into[indices[j]] = indices[i]
+                buckets.append(indices)
+        
+        for secondary, primary in self._resolve_buckets(buckets, names, insts):
+            merged_into[secondary] = primary
+        
+        # Group merged leads under their target, in merge order
+        merge_groups: Dict[int, List[int]] = {}
+        for source, target in merged_into.items():
+            merge_groups.setdefault(target, []).append(source)
         
         # Build final list with merged data
         result = []
@@ -140,9 +303,7 @@ class Deduplicator:
             
             # Find all leads to merge into this one
             to_merge = [i]
-            for source, target in merged_into.items():
-                if target == i:
-                    to_merge.append(source)
+            to_merge.extend(merge_groups.get(i, ()))
             
             # Merge all matching leads
             if len(to_merge) > 1:
@@ -153,9 +314,52 @@ class Deduplicator:
             result.append(merged_lead)
             processed.update(to_merge)
         
-        self.logger.info(f"Deduplicated to {len(result)} unique leads")
+        self.logger.info("Deduplicated to %s unique leads", len(result))
         return result
     
+    def _resolve_buckets(
+        self,
+        buckets: List[List[int]],
+        names: List[str],
+        insts: List[str],
+    ) -> List[Tuple[int, int]]:
+        """
+        Resolve fuzzy matches for all name buckets.
+        
+        Buckets are disjoint, so with ``parallel`` on, several CPUs and at
+        least ``PARALLEL_MIN_PAIRS`` candidate pairs they are scored in a
+        process pool and the merge pairs are combined afterwards. Buckets
+        share a normalized name and are usually tiny, so most inputs stay
+        serial however many leads they hold.
+        """
+        resolve = partial(
+            _resolve_bucket,
+            name_threshold=self.name_threshold,
+            institution_threshold=self.institution_threshold,
+        )
+        
+        if self._use_pool(buckets):
+            # Ship each worker only the keys of its own bucket
+            bucket_names = [{idx: names[idx] for idx in b} for b in buckets]
+            bucket_insts = [{idx: insts[idx] for idx in b} for b in buckets]
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    results = executor.map(
+                        resolve, buckets, bucket_names, bucket_insts, chunksize=32,
+                    )
+                    return [pair for pairs in results for pair in pairs]
+            except Exception as e:
+                self.logger.warning("Parallel matching failed, running serially: %s", e)
+        
+        return [pair for b in buckets for pair in resolve(b, names, insts)]
+    
+    def _use_pool(self, buckets: List[List[int]]) -> bool:
+        """Whether the buckets are worth spreading over worker processes."""
+        if not self.parallel or len(buckets) < 2 or (os.cpu_count() or 1) < 2:
+            return False
+        pairs = sum(len(b) * (len(b) - 1) // 2 for b in buckets)
+        return pairs >= PARALLEL_MIN_PAIRS
+    
     def _normalize_email(self, email: Optional[str]) -> Optional[str]:
         """Normalize email for comparison."""
         if not email:
@@ -166,10 +370,9 @@ class Deduplicator:
         """Normalize name for indexing."""
         if not name:
             return ''
-        # Remove titles, lowercase, remove extra spaces
-        name = re.sub(r'\b(Dr|Prof|PhD|MD|Jr|Sr|III|II)\.?\b', '', name, flags=re.I)
-        name = ' '.join(name.lower().split())
-        return name
+        # Remove titles and punctuation, lowercase, remove extra spaces
+        name = _TITLE_RE.sub('', name).translate(_PUNCTUATION_TO_SPACE)
+        return ' '.join(name.lower().split())
     
     def _check_match(self, lead1: Dict, lead2: Dict) -> MatchResult:
         """Check if two leads are the same person."""
@@ -192,8 +395,8 @@ class Deduplicator:
         if not name1 or not name2:
             return MatchResult(False, 0, 'none')
         
-        if fuzz:
-            name_score = fuzz.ratio(name1, name2)
+        if _ratio:
+            name_score = _ratio(name1, name2)
             
             if name_score >= self.name_threshold:
                 # Also check institution
@@ -201,14 +404,14 @@ class Deduplicator:
                 inst2 = (lead2.get('institution', '') or '').lower()
                 
                 if inst1 and inst2:
-                    inst_score = fuzz.ratio(inst1, inst2)
+                    inst_score = _ratio(inst1, inst2)
                     if inst_score >= self.institution_threshold:
                         confidence = (name_score + inst_score) / 200
                         return MatchResult(True, confidence, 'fuzzy_name_institution')
                 elif name_score >= 95:  # Very high name match without institution
                     return MatchResult(True, name_score / 100, 'fuzzy_name')
         else:
-            # Basic matching without fuzzywuzzy
+            # Basic matching without a fuzzy matcher
             if name1 == name2:
                 return MatchResult(True, 0.9, 'exact_name')
         
@@ -222,6 +425,10 @@ class Deduplicator:
         merged = leads[0].copy()
         sources = [leads[0].get('source', 'unknown')]
         
+        # List fields are collected here and combined once at the end,
+        # rather than re-concatenated for every duplicate
+        combined_lists: Dict[str, List] = {}
+        
         for lead in leads[1:]:
             sources.append(lead.get('source', 'unknown'))
             
@@ -233,17 +440,14 @@ class Deduplicator:
             # Merge lists
             for key in ['research_focus', 'grants']:
                 if lead.get(key):
-                    existing = merged.get(key, [])
-                    if isinstance(existing, list):
-                        # Handle lists that may contain dicts (unhashable)
-                        combined = existing + lead[key]
-                        # For simple strings, dedupe; for dicts, just combine
-                        if combined and isinstance(combined[0], dict):
-                            merged[key] = combined  # Keep all grants
-                        else:
-                            merged[key] = list(set(str(x) for x in combined))  # Dedupe strings
-                    else:
-                        merged[key] = lead[key]
+                    combined = combined_lists.get(key)
+                    if combined is None:
+                        existing = merged.get(key, [])
+                        if not isinstance(existing, list):
+                            merged[key] = lead[key]
+                            continue
+                        combined = combined_lists[key] = list(existing)
+                    combined.extend(lead[key])
             
             # Sum counts
             if lead.get('publications'):
@@ -260,6 +464,13 @@ class Deduplicator:
             if lead.get('source') and lead.get('raw_data'):
                 merged['raw_data_sources'][lead['source']] = lead['raw_data']
         
+        for key, combined in combined_lists.items():
+            # Lists may contain dicts (unhashable): keep all grants, dedupe strings
+            if isinstance(combined[0], dict):
+                merged[key] = combined
+            else:
+                merged[key] = list(set(str(x) for x in combined))
+        
         merged['sources'] = list(set(sources))
         merged['source_count'] = len(merged['sources'])
         
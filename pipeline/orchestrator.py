@@ -77,12 +77,12 @@ class PipelineOrchestrator:
         self.logger.info("Stage 1: Scraping sources...")
         self.raw_leads = self._run_scrapers(sources, max_results_per_source)
         self._trigger_callbacks('on_scrape_complete', self.raw_leads)
-        self.logger.info(f"Collected {len(self.raw_leads)} raw leads")
+        self.logger.info("Collected %s raw leads", len(self.raw_leads))
         
         # Stage 2: Deduplication
         self.logger.info("Stage 2: Deduplicating leads...")
         self.deduplicated_leads = self._run_deduplication(self.raw_leads)
-        self.logger.info(f"Deduplicated to {len(self.deduplicated_leads)} leads")
+        self.logger.info("Deduplicated to %s leads", len(self.deduplicated_leads))
         
         # Stage 3: Enrichment
         if not skip_enrichment:
@@ -100,11 +100,11 @@ class PipelineOrchestrator:
         
         # Stage 5: Export
         if output_path:
-            self.logger.info(f"Stage 5: Exporting to {output_path}")
+            self.logger.info("Stage 5: Exporting to %s", output_path)
             self.export(output_path)
         
         duration = (datetime.now() - start_time).total_seconds()
-        self.logger.info(f"Pipeline complete in {duration:.1f}s. {len(self.scored_leads)} leads generated.")
+        self.logger.info("Pipeline complete in %.1fs. %s leads generated.", duration, len(self.scored_leads))
         
         self._trigger_callbacks('on_pipeline_complete', self.scored_leads)
         
@@ -116,14 +116,8 @@ class PipelineOrchestrator:
         max_results: int,
     ) -> List[Dict]:
         """Run all scrapers and collect leads."""
-        from ..scrapers import (
-            PubMedScraper,
-            NIHReporterScraper,
-            OpenAlexScraper,
-            ClinicalTrialsScraper,
-        )
-        from ..config.keywords import keywords
-        
+        # Scraper classes are imported by the per-source helpers below so
+        # that only the requested sources are loaded.
         all_leads = []
         
         # Define available scrapers
@@ -153,18 +147,18 @@ class PipelineOrchestrator:
                     try:
                         leads = future.result()
                         all_leads.extend(leads)
-                        self.logger.info(f"Scraper '{name}' returned {len(leads)} leads")
+                        self.logger.info("Scraper '%s' returned %s leads", name, len(leads))
                     except Exception as e:
-                        self.logger.error(f"Scraper '{name}' failed: {e}")
+                        self.logger.error("Scraper '%s' failed: %s", name, e)
         else:
             # Run sequentially
             for name, func in scrapers_to_run.items():
                 try:
                     leads = func()
                     all_leads.extend(leads)
-                    self.logger.info(f"Scraper '{name}' returned {len(leads)} leads")
+                    self.logger.info("Scraper '%s' returned %s leads", name, len(leads))
                 except Exception as e:
-                    self.logger.error(f"Scraper '{name}' failed: {e}")
+                    self.logger.error("Scraper '%s' failed: %s", name, e)
         
         return all_leads
     
@@ -174,10 +168,10 @@ class PipelineOrchestrator:
         from ..config.keywords import keywords
         
         scraper = PubMedScraper()
-        return scraper.run(
+        return list(scraper.run(
             queries=keywords.pubmed_queries[:3],  # Top 3 queries
             max_results_per_query=max_results // 3,
-        )
+        ))
     
     def _run_nih_scraper(self, max_results: int) -> List[Dict]:
         """Run NIH Reporter scraper."""
@@ -198,7 +192,7 @@ class PipelineOrchestrator:
         from ..scrapers import ClinicalTrialsScraper
         
         scraper = ClinicalTrialsScraper()
-        return scraper.run_with_keywords(max_results_per_query=max_results // 5)
+        return list(scraper.run_with_keywords(max_results_per_query=max_results // 5))
     
     def _run_deduplication(self, leads: List[Dict]) -> List[Dict]:
         """Run deduplication."""
@@ -297,7 +291,7 @@ class PipelineOrchestrator:
             filepath = output_path.with_suffix('.csv')
             df.to_csv(filepath, index=False)
         
-        self.logger.info(f"Exported {len(export_data)} leads to {filepath}")
+        self.logger.info("Exported %s leads to %s", len(export_data), filepath)
         return filepath
     
     def get_summary(self) -> Dict:
@@ -307,15 +301,22 @@ class PipelineOrchestrator:
         
         tiers = {'hot': 0, 'warm': 0, 'cold': 0, 'ice': 0}
         sources = {}
+        total_score = 0
+        with_email = 0
         
+        # Single pass over the leads for all counters
         for lead in self.scored_leads:
             tier = lead.get('tier', 'ice')
             tiers[tier] = tiers.get(tier, 0) + 1
             
             for source in lead.get('sources', [lead.get('source', 'unknown')]):
                 sources[source] = sources.get(source, 0) + 1
+            
+            total_score += lead.get('score', 0)
+            if lead.get('email'):
+                with_email += 1
         
-        avg_score = sum(l.get('score', 0) for l in self.scored_leads) / len(self.scored_leads)
+        avg_score = total_score / len(self.scored_leads)
         
         return {
             'total_leads': len(self.scored_leads),
@@ -324,7 +325,7 @@ class PipelineOrchestrator:
             'tiers': tiers,
             'sources': sources,
             'average_score': round(avg_score, 1),
-            'leads_with_email': sum(1 for l in self.scored_leads if l.get('email')),
+            'leads_with_email': with_email,
         }
     
     def add_callback(self, event: str, callback: Callable):
@@ -338,4 +339,4 @@ class PipelineOrchestrator:
             try:
                 callback(data)
             except Exception as e:
-                self.logger.error(f"Callback error for {event}: {e}")
+                self.logger.error("Callback error for %s: %s", event, e)
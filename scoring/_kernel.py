@@ -0,0 +1,90 @@
+# BioLeads Scoring Kernel
+"""
+Numba-compiled batch scoring kernel.
+
+Imported lazily by ``PropensityEngine`` the first time a batch is scored
+with the kernel; importing this module requires Numba.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def _rung(thresholds, value, inclusive):
+    """
+    Index of ``value`` in a sorted ladder (bisect_right if inclusive).
+    
+    Counts the thresholds passed instead of breaking early, so the
+    compiled loop has no data-dependent branch and every ladder shares
+    this one classifier.
+    """
+    rung = 0
+    if inclusive:
+        for t in thresholds:
+            rung += value >= t
+    else:
+        for t in thresholds:
+            rung += value > t
+    return rung
+
+
+@njit(parallel=True, cache=True)
+def score_kernel(pubs, grant_total, has_grants, active_grants, has_trial,
+                 industry_trial, cited_by, has_conf, keynote, years_ago,
+                 role, inst, topic, W, T, pub_thresh, pub_pct,
+                 grant_thresh, grant_pct, cit_thresh, cit_pct,
+                 rec_years, rec_pct):
+    """
+    Numeric core of lead scoring over pre-extracted columns.
+    
+    ``W`` is ``ScoringWeights._weights_vec`` (publication, grant, clinical
+    trial, citation, conference and recency weights first) and ``T`` is
+    ``ScoringWeights._tier_thresholds`` (cold, warm, hot).
+    Returns uncapped totals and tier codes (0=hot, 1=warm, 2=cold, 3=ice).
+    """
+    n = pubs.shape[0]
+    totals = np.empty(n)
+    tiers = np.empty(n, dtype=np.int64)
+    for i in prange(n):
+        pub_score = pub_pct[_rung(pub_thresh, pubs[i], True)] * W[0]
+        
+        grant_score = 0.0
+        if has_grants[i]:
+            grant_score = grant_pct[_rung(grant_thresh, grant_total[i], True)] * W[1]
+            if active_grants[i] >= 2:
+                grant_score = min(grant_score * 1.2, W[1])
+        
+        trial_score = 0.0
+        if has_trial[i]:
+            trial_score = W[2] if industry_trial[i] else W[2] * 0.5
+        
+        citation_score = cit_pct[_rung(cit_thresh, cited_by[i], True)] * W[3]
+        
+        conf_score = 0.0
+        if has_conf[i]:
+            conf_score = W[4] if keynote[i] else W[4] * 0.7
+        
+        recency_score = rec_pct[_rung(rec_years, years_ago[i], False)] * W[5]
+        
+        total = (
+            pub_score +
+            grant_score +
+            trial_score +
+            citation_score +
+            conf_score +
+            recency_score +
+            role[i] +
+            inst[i] +
+            topic[i]
+        )
+        totals[i] = total
+        if total >= T[2]:
+            tiers[i] = 0
+        elif total >= T[1]:
+            tiers[i] = 1
+        elif total >= T[0]:
+            tiers[i] = 2
+        else:
+            tiers[i] = 3
+    return totals, tiers
@@ -3,17 +3,212 @@
 Main scoring algorithm for lead propensity-to-buy calculation.
 """
 
+import hashlib
+import heapq
+import json
 import logging
-from typing import Dict, List, Optional, Tuple
+import os
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import lru_cache, partial
+from itertools import repeat
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .weights import ScoringWeights, default_weights
 
+# Fixed threshold ladders, lowest rung first. The score fraction for a
+# value is PCT[bisect_right(THRESHOLDS, value)].
+_CITATION_THRESHOLDS = (50, 100, 500, 1000)
+_CITATION_PCT = (0, 0.25, 0.5, 0.75, 1.0)
+
+# Recency uses "at most N years ago", so it is indexed with bisect_left
+_RECENCY_YEARS = (1, 2, 3)
+_RECENCY_PCT = (1.0, 0.75, 0.5, 0)
+
+# Array forms of the fixed ladders for the batch scorer
+_CITATION_LADDER = (
+    np.asarray(_CITATION_THRESHOLDS, dtype=np.float64),
+    np.asarray(_CITATION_PCT, dtype=np.float64),
+)
+_RECENCY_LADDER = (
+    np.asarray(_RECENCY_YEARS, dtype=np.int64),
+    np.asarray(_RECENCY_PCT, dtype=np.float64),
+)
+
+# Lead fields that feed the score; used to key the score cache
+SCORING_FIELDS = (
+    'publications', 'grants', 'clinical_trial', 'sponsor_class',
+    'cited_by_count', 'conference_presentation', 'pub_date',
+    'publication_date', 'title', 'institution', 'research_focus',
+    'icp_score', 'company_info',
+)
+
+# Below this batch size, process startup costs more than it saves
+PARALLEL_MIN_LEADS = 1000
+
+# From this batch size, scores without breakdowns are computed column-wise
+VECTORIZED_MIN_LEADS = 100
+
+# Breakdowns kept per engine; the least recently used are dropped first
+SCORE_CACHE_SIZE = 65536
+
+# Date formats accepted for grant end dates
+_END_DATE_FORMATS = ('%Y-%m-%d', '%Y/%m/%d', '%Y')
+
+
+@lru_cache(maxsize=4096)
+def _parse_end_date(value: str) -> Optional[datetime]:
+    """Parse a grant end date, or None if no known format matches."""
+    for fmt in _END_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=None)
+def _load_score_kernel():
+    """
+    The Numba batch scoring kernel, or None when Numba is not installed.
+    
+    Numba is imported on first use rather than with this module, so
+    importing the scoring package (dashboard, CLI) does not pay for it.
+    """
+    try:
+        from ._kernel import score_kernel
+    except ImportError:
+        return None
+    return score_kernel
+
+
+_TIER_NAMES = ('hot', 'warm', 'cold', 'ice')
+
+# Tier names by the codes stored in score arrays (lowest tier first)
+SCORE_TIERS = ('ice', 'cold', 'warm', 'hot')
+_TIERS_ASCENDING = np.array(SCORE_TIERS, dtype=object)
+
+# One row per lead for bulk scoring, see PropensityEngine.score_array
+SCORE_DTYPE = np.dtype([
+    ('total', 'f8'),
+    ('publication', 'f8'),
+    ('grant', 'f8'),
+    ('clinical_trial', 'f8'),
+    ('citation', 'f8'),
+    ('conference', 'f8'),
+    ('recency', 'f8'),
+    ('role_fit', 'f8'),
+    ('institution_fit', 'f8'),
+    ('topic_relevance', 'f8'),
+    ('tier', 'u1'),
+])
+
 
-@dataclass
+# Institution fit by company type
+_INSTITUTION_TYPE_SCORES = {
+    'pharma': 1.0,
+    'biotech': 0.9,
+    'cro': 0.8,
+    'medical_center': 0.6,
+    'academic': 0.5,
+    'government': 0.4,
+}
+
+
+# Display text for scoring factors. Factors are recorded as
+# (code, *args) tuples and only formatted when a breakdown is serialized.
+FACTOR_TEMPLATES = {
+    'HIGHLY_ACTIVE': "Highly active researcher ({}+ publications)",
+    'ACTIVE': "Active researcher ({} publications)",
+    'MAJOR_FUNDING': "Major funding: ${:,.0f}",
+    'SIGNIFICANT_FUNDING': "Significant funding: ${:,.0f}",
+    'ACTIVE_GRANTS': "{} active grants",
+    'INDUSTRY_TRIAL': "Industry-sponsored clinical trial",
+    'CLINICAL_TRIAL': "Clinical trial involvement",
+    'CONFERENCE': "Presented at {}",
+    'KEYNOTE': "Keynote/symposium at {}",
+    'RECENT_ACTIVITY': "Recent research activity",
+    'DECISION_MAKER': "Decision-maker role: {}",
+    'INSTITUTION_FIT': "Strong institution fit: {}",
+    'TOPIC_RELEVANCE': "Highly relevant research focus",
+}
+
+
+def format_factor(factor: Tuple) -> str:
+    """Render a (code, *args) scoring factor as display text."""
+    code, *args = factor
+    return FACTOR_TEMPLATES[code].format(*args)
+
+
+def _score_chunk(
+    leads: List[Dict],
+    weights: 'ScoringWeights',
+    include_breakdown: bool,
+    now: datetime,
+) -> Tuple[List[Tuple[float, str, Optional[Dict]]], int]:
+    """
+    Score a chunk of leads in a worker process.
+    
+    Returns (score, tier, breakdown) per lead, in input order, and the
+    number of fast-path hits, so only results travel back to the parent.
+    """
+    engine = PropensityEngine(weights)
+    engine._now = now
+    results = []
+    for lead in leads:
+        score_breakdown = engine.score_lead(lead)
+        results.append((
+            score_breakdown.total_score,
+            score_breakdown.tier,
+            score_breakdown.to_dict() if include_breakdown else None,
+        ))
+    return results, engine.fast_path_hits
+
+
+class _LeadView(NamedTuple):
+    """Scoring inputs pulled out of a lead dictionary in a single pass."""
+    pub_count: int
+    grant_count: int
+    grant_total: float
+    active_grants: int
+    clinical_trial: Dict
+    sponsor_class: str
+    cited_by: int
+    conference: Dict
+    years_ago: Optional[int]
+    title: Optional[str]
+    institution: Optional[str]
+    research_focus: List[str]
+    icp_score: float
+    institution_type: str
+
+
+@dataclass(frozen=True)
 class ScoreBreakdown:
-    """Detailed breakdown of a lead's score."""
+    """
+    Detailed breakdown of a lead's score.
+    
+    Immutable, since identical leads share one cached instance.
+    """
+    __slots__ = (
+        'total_score', 'tier', 'publication_score', 'grant_score',
+        'clinical_trial_score', 'citation_score', 'conference_score',
+        'recency_score', 'role_score', 'institution_score', 'topic_score',
+        'factors',
+    )
+    
     total_score: float
     tier: str  # hot, warm, cold
     publication_score: float
@@ -25,28 +220,32 @@ class ScoreBreakdown:
     role_score: float
     institution_score: float
     topic_score: float
-    factors: List[str]  # Key scoring factors
+    factors: Tuple[Tuple, ...]  # Key scoring factors as (code, *args)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
+        # Fetch and round all sub-scores in one C-level pass
+        scores = map(round, _get_sub_scores(self), repeat(2))
         return {
             'total_score': round(self.total_score, 1),
             'tier': self.tier,
-            'breakdown': {
-                'publication': round(self.publication_score, 2),
-                'grant': round(self.grant_score, 2),
-                'clinical_trial': round(self.clinical_trial_score, 2),
-                'citation': round(self.citation_score, 2),
-                'conference': round(self.conference_score, 2),
-                'recency': round(self.recency_score, 2),
-                'role_fit': round(self.role_score, 2),
-                'institution_fit': round(self.institution_score, 2),
-                'topic_relevance': round(self.topic_score, 2),
-            },
-            'key_factors': self.factors,
+            'breakdown': dict(zip(_BREAKDOWN_KEYS, scores)),
+            'key_factors': [format_factor(f) for f in self.factors],
         }
 
 
+# Serialized breakdown keys and the ScoreBreakdown fields behind them
+_BREAKDOWN_KEYS = (
+    'publication', 'grant', 'clinical_trial', 'citation', 'conference',
+    'recency', 'role_fit', 'institution_fit', 'topic_relevance',
+)
+_get_sub_scores = attrgetter(
+    'publication_score', 'grant_score', 'clinical_trial_score',
+    'citation_score', 'conference_score', 'recency_score', 'role_score',
+    'institution_score', 'topic_score',
+)
+
+
 class PropensityEngine:
     """
     Lead scoring engine that calculates propensity-to-buy scores.
@@ -57,68 +256,168 @@ class PropensityEngine:
     - Fit: role match, institution type, research focus
     """
     
-    def __init__(self, weights: Optional[ScoringWeights] = None):
+    def __init__(
+        self,
+        weights: Optional[ScoringWeights] = None,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+    ):
         """
         Initialize propensity engine.
         
         Args:
             weights: Custom scoring weights (uses defaults if not provided)
+            parallel: Score large batches in a process pool
+            max_workers: Worker processes for parallel scoring (CPU count if None)
         """
-        self.weights = weights or default_weights
+        self.parallel = parallel
+        self.max_workers = max_workers
         self.logger = logging.getLogger('bioleads.scoring.propensity')
+        
+        # Leads scored without any grant, trial, conference or dated activity
+        self.fast_path_hits = 0
+        
+        # Breakdowns keyed by a hash of the scoring fields, bounded to
+        # SCORE_CACHE_SIZE. Grant activity and recency depend on the date,
+        # so the cache is dropped daily, and on every weights change.
+        self._score_cache: 'OrderedDict[bytes, ScoreBreakdown]' = OrderedDict()
+        self._score_cache_date = None
+        
+        # Reference time shared by every lead of the batch being scored
+        self._now: Optional[datetime] = None
+        
+        self.weights = weights or default_weights
+    
+    @property
+    def weights(self) -> ScoringWeights:
+        """Scoring weights; assigning new ones takes effect immediately."""
+        return self._weights
+    
+    @weights.setter
+    def weights(self, weights: ScoringWeights):
+        self._weights = weights
+        self._specialize_weights()
+    
+    def _specialize_weights(self):
+        """
+        Precompute the score of every ladder rung for the current weights.
+        
+        Each sub-score then becomes a single table lookup instead of a
+        fraction times a weight attribute. Run by the ``weights`` setter;
+        cached breakdowns are dropped.
+        """
+        self._score_cache.clear()
+        w = self.weights
+        self._pub_scores = tuple(pct * w.publication_weight for pct in w._pub_pct)
+        self._grant_scores = tuple(pct * w.grant_weight for pct in w._grant_pct)
+        self._citation_scores = tuple(pct * w.citation_weight for pct in _CITATION_PCT)
+        self._recency_scores = tuple(pct * w.recent_activity_weight for pct in _RECENCY_PCT)
+        self._trial_scores = (w.clinical_trial_weight * 0.5, w.clinical_trial_weight)
+        self._conference_scores = (w.conference_weight * 0.7, w.conference_weight)
+        self._institution_scores = {
+            inst_type: pct * w.institution_fit_weight
+            for inst_type, pct in _INSTITUTION_TYPE_SCORES.items()
+        }
+        self._institution_default = 0.3 * w.institution_fit_weight
+    
+    def _score_key(self, lead: Dict) -> bytes:
+        """Hash the scoring-relevant fields of a lead."""
+        fields = {k: lead.get(k) for k in SCORING_FIELDS}
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(fields, option=orjson.OPT_SORT_KEYS, default=str)
+            except TypeError:
+                payload = json.dumps(fields, sort_keys=True, default=str).encode()
+        else:
+            payload = json.dumps(fields, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(payload, digest_size=16).digest()
     
     def score_lead(self, lead: Dict) -> ScoreBreakdown:
         """
         Calculate propensity score for a single lead.
         
+        Identical leads, including re-runs of an earlier batch, reuse
+        the cached breakdown.
+        
         Args:
             lead: Lead dictionary with enriched data
             
         Returns:
             ScoreBreakdown with detailed scoring
         """
+        now = self._now or datetime.now()
+        if self._score_cache_date != now.date():
+            self._score_cache.clear()
+            self._score_cache_date = now.date()
+        
+        key = self._score_key(lead)
+        cached = self._score_cache.get(key)
+        if cached is not None:
+            self._score_cache.move_to_end(key)
+            return cached
+        
+        breakdown = self._compute_score(lead, now)
+        self._score_cache[key] = breakdown
+        if len(self._score_cache) > SCORE_CACHE_SIZE:
+            self._score_cache.popitem(last=False)
+        return breakdown
+    
+    def _compute_score(self, lead: Dict, now: datetime) -> ScoreBreakdown:
+        """Score a lead from scratch (see ``score_lead``)."""
         factors = []
+        view = self._lead_view(lead, now)
+        
+        # Most leads carry no grant, trial, conference or dated activity;
+        # those four scores are then zero and need not be computed
+        inactive = not (
+            view.grant_count or view.clinical_trial or view.conference or
+            view.years_ago is not None
+        )
+        if inactive:
+            self.fast_path_hits += 1
         
         # 1. Publication Score
-        pub_score, pub_factors = self._score_publications(lead)
+        pub_score, pub_factors = self._score_publications(view)
         factors.extend(pub_factors)
         
-        # 2. Grant Score
-        grant_score, grant_factors = self._score_grants(lead)
-        factors.extend(grant_factors)
-        
-        # 3. Clinical Trial Score
-        trial_score, trial_factors = self._score_clinical_trials(lead)
-        factors.extend(trial_factors)
+        if inactive:
+            grant_score = trial_score = conf_score = recency_score = 0
+        else:
+            # 2. Grant Score
+            grant_score, grant_factors = self._score_grants(view)
+            factors.extend(grant_factors)
+            
+            # 3. Clinical Trial Score
+            trial_score, trial_factors = self._score_clinical_trials(view)
+            factors.extend(trial_factors)
         
         # 4. Citation Score
-        citation_score = self._score_citations(lead)
-        
-        # 5. Conference Score
-        conf_score, conf_factors = self._score_conference(lead)
-        factors.extend(conf_factors)
+        citation_score = self._score_citations(view)
         
-        # 6. Recency Score
-        recency_score = self._score_recency(lead)
-        if recency_score > 5:
-            factors.append("Recent research activity")
+        if not inactive:
+            # 5. Conference Score
+            conf_score, conf_factors = self._score_conference(view)
+            factors.extend(conf_factors)
+            
+            # 6. Recency Score
+            recency_score = self._score_recency(view)
+            if recency_score > 5:
+                factors.append(('RECENT_ACTIVITY',))
         
         # 7. Role Fit Score
-        role_score = self.weights.get_role_score(lead.get('title', ''))
+        role_score = self.weights.get_role_score(view.title)
         if role_score > 5:
-            factors.append(f"Decision-maker role: {lead.get('title')}")
+            factors.append(('DECISION_MAKER', view.title))
         
         # 8. Institution Fit Score
-        inst_score = self._score_institution(lead)
+        inst_score = self._score_institution(view)
         if inst_score > 5:
-            factors.append(f"Strong institution fit: {lead.get('institution')}")
+            factors.append(('INSTITUTION_FIT', view.institution))
         
         # 9. Topic Relevance Score
-        topic_score = self.weights.get_topic_relevance_score(
-            lead.get('research_focus', [])
-        )
+        topic_score = self.weights.get_topic_relevance_score(view.research_focus)
         if topic_score > 5:
-            factors.append("Highly relevant research focus")
+            factors.append(('TOPIC_RELEVANCE',))
         
         # Calculate total
         total_score = (
@@ -148,147 +447,165 @@ class PropensityEngine:
             role_score=role_score,
             institution_score=inst_score,
             topic_score=topic_score,
-            factors=factors[:5],  # Top 5 factors
+            factors=tuple(factors[:5]),  # Top 5 factors
         )
     
-    def _score_publications(self, lead: Dict) -> Tuple[float, List[str]]:
+    def _lead_view(self, lead: Dict, now: datetime) -> _LeadView:
+        """
+        Extract every scoring input from a lead in one pass.
+        
+        Grant totals and active-grant counts are computed here so the
+        grant scorer does not walk the grant list again.
+        
+        Args:
+            lead: Lead dictionary
+            now: Reference time for grant activity and recency
+        """
+        grants = lead.get('grants', [])
+        grant_total = 0
+        active_grants = 0
+        if grants:
+            grant_total = sum(g.get('award_amount', 0) for g in grants)
+            active_grants = sum(1 for g in grants if self._is_grant_active(g, now))
+        
+        company_info = lead.get('company_info') or {}
+        
+        return _LeadView(
+            pub_count=lead.get('publications', 0),
+            grant_count=len(grants) if grants else 0,
+            grant_total=grant_total,
+            active_grants=active_grants,
+            clinical_trial=lead.get('clinical_trial', {}),
+            sponsor_class=lead.get('sponsor_class', ''),
+            cited_by=lead.get('cited_by_count', 0),
+            conference=lead.get('conference_presentation', {}),
+            years_ago=self._years_since_activity(lead, now.year),
+            title=lead.get('title', ''),
+            institution=lead.get('institution'),
+            research_focus=lead.get('research_focus', []),
+            icp_score=lead.get('icp_score', 0),
+            institution_type=company_info.get('type', ''),
+        )
+    
+    def _score_publications(self, view: _LeadView) -> Tuple[float, List[Tuple]]:
         """Score based on publication activity."""
         factors = []
-        pub_count = lead.get('publications', 0)
-        
-        # Get thresholds from weights
-        thresholds = self.weights.pub_score_thresholds
+        pub_count = view.pub_count
         
         # Calculate score as percentage of weight
-        if pub_count >= thresholds['excellent']:
-            score_pct = 1.0
-            factors.append(f"Highly active researcher ({pub_count}+ publications)")
-        elif pub_count >= thresholds['good']:
-            score_pct = 0.75
-            factors.append(f"Active researcher ({pub_count} publications)")
-        elif pub_count >= thresholds['moderate']:
-            score_pct = 0.5
-        elif pub_count >= thresholds['minimal']:
-            score_pct = 0.25
-        else:
-            score_pct = 0
+        rung = bisect_right(self.weights._pub_thresh, pub_count)
+        if rung == 4:
+            factors.append(('HIGHLY_ACTIVE', pub_count))
+        elif rung == 3:
+            factors.append(('ACTIVE', pub_count))
         
-        score = score_pct * self.weights.publication_weight
+        score = self._pub_scores[rung]
         
         return score, factors
     
-    def _score_grants(self, lead: Dict) -> Tuple[float, List[str]]:
+    def _score_grants(self, view: _LeadView) -> Tuple[float, List[Tuple]]:
         """Score based on grant funding."""
         factors = []
-        grants = lead.get('grants', [])
         
-        if not grants:
+        if not view.grant_count:
             return 0, factors
         
-        total_amount = sum(g.get('award_amount', 0) for g in grants)
-        thresholds = self.weights.grant_amount_thresholds
+        total_amount = view.grant_total
         
         # Score based on total funding
-        if total_amount >= thresholds['major']:
-            score_pct = 1.0
-            factors.append(f"Major funding: ${total_amount:,.0f}")
-        elif total_amount >= thresholds['significant']:
-            score_pct = 0.75
-            factors.append(f"Significant funding: ${total_amount:,.0f}")
-        elif total_amount >= thresholds['moderate']:
-            score_pct = 0.5
-        elif total_amount >= thresholds['seed']:
-            score_pct = 0.25
-        else:
-            score_pct = 0.1
+        rung = bisect_right(self.weights._grant_thresh, total_amount)
+        if rung == 4:
+            factors.append(('MAJOR_FUNDING', total_amount))
+        elif rung == 3:
+            factors.append(('SIGNIFICANT_FUNDING', total_amount))
         
-        score = score_pct * self.weights.grant_weight
+        score = self._grant_scores[rung]
         
         # Bonus for active grants
-        active_grants = [g for g in grants if self._is_grant_active(g)]
-        if len(active_grants) >= 2:
+        if view.active_grants >= 2:
             score = min(score * 1.2, self.weights.grant_weight)
-            factors.append(f"{len(active_grants)} active grants")
+            factors.append(('ACTIVE_GRANTS', view.active_grants))
         
         return score, factors
     
-    def _is_grant_active(self, grant: Dict) -> bool:
-        """Check if a grant is currently active."""
+    def _is_grant_active(self, grant: Dict, now: Optional[datetime] = None) -> bool:
+        """
+        Check if a grant is currently active.
+        
+        Args:
+            grant: Grant dictionary
+            now: Reference time (defaults to the current time)
+        """
         end_date = grant.get('end_date')
-        if not end_date:
-            return True  # Assume active if no end date
+        if not end_date or not isinstance(end_date, str):
+            return True  # Assume active if no usable end date
         
-        try:
-            if isinstance(end_date, str):
-                # Parse various date formats
-                for fmt in ['%Y-%m-%d', '%Y/%m/%d', '%Y']:
-                    try:
-                        end_dt = datetime.strptime(end_date[:10], fmt)
-                        return end_dt > datetime.now()
-                    except ValueError:
-                        continue
-        except Exception:
-            pass
+        # Parse various date formats (cached, end dates repeat across leads)
+        end_dt = _parse_end_date(end_date[:10])
+        if end_dt is None:
+            return True
         
-        return True
+        return end_dt > (now or datetime.now())
     
-    def _score_clinical_trials(self, lead: Dict) -> Tuple[float, List[str]]:
+    def _score_clinical_trials(self, view: _LeadView) -> Tuple[float, List[Tuple]]:
         """Score based on clinical trial involvement."""
         factors = []
         
-        trial_info = lead.get('clinical_trial', {})
-        if not trial_info:
+        if not view.clinical_trial:
             return 0, factors
         
-        # Base score for having clinical trial involvement
-        score = self.weights.clinical_trial_weight * 0.5
-        
-        # Bonus for industry-sponsored trials
-        sponsor_class = lead.get('sponsor_class', '')
-        if sponsor_class == 'INDUSTRY':
-            score = self.weights.clinical_trial_weight
-            factors.append("Industry-sponsored clinical trial")
+        # Base score for having clinical trial involvement, full weight
+        # for industry-sponsored trials
+        if view.sponsor_class == 'INDUSTRY':
+            score = self._trial_scores[1]
+            factors.append(('INDUSTRY_TRIAL',))
         else:
-            factors.append("Clinical trial involvement")
+            score = self._trial_scores[0]
+            factors.append(('CLINICAL_TRIAL',))
         
         return score, factors
     
-    def _score_citations(self, lead: Dict) -> float:
+    def _score_citations(self, view: _LeadView) -> float:
         """Score based on citation impact."""
-        cited_by = lead.get('cited_by_count', 0)
-        
-        if cited_by >= 1000:
-            return self.weights.citation_weight
-        elif cited_by >= 500:
-            return self.weights.citation_weight * 0.75
-        elif cited_by >= 100:
-            return self.weights.citation_weight * 0.5
-        elif cited_by >= 50:
-            return self.weights.citation_weight * 0.25
-        
-        return 0
+        rung = bisect_right(_CITATION_THRESHOLDS, view.cited_by)
+        return self._citation_scores[rung]
     
-    def _score_conference(self, lead: Dict) -> Tuple[float, List[str]]:
+    def _score_conference(self, view: _LeadView) -> Tuple[float, List[Tuple]]:
         """Score based on conference presentation."""
         factors = []
         
-        conf_info = lead.get('conference_presentation', {})
+        conf_info = view.conference
         if not conf_info:
             return 0, factors
         
-        score = self.weights.conference_weight * 0.7
-        factors.append(f"Presented at {conf_info.get('conference', 'conference')}")
+        score = self._conference_scores[0]
+        code = 'CONFERENCE'
         
         # Bonus for keynote/symposium
         session_type = conf_info.get('session_type', '')
         if session_type in ['keynote', 'symposium']:
-            score = self.weights.conference_weight
-            factors[-1] = f"Keynote/symposium at {conf_info.get('conference', 'conference')}"
+            score = self._conference_scores[1]
+            code = 'KEYNOTE'
+        factors.append((code, conf_info.get('conference', 'conference')))
         
         return score, factors
     
-    def _score_recency(self, lead: Dict) -> float:
+    def _score_recency(self, view: _LeadView) -> float:
         """Score based on how recent the activity is."""
+        years_ago = view.years_ago
+        if years_ago is None:
+            return 0
+        
+        rung = bisect_left(_RECENCY_YEARS, years_ago)
+        return self._recency_scores[rung]
+    
+    def _years_since_activity(self, lead: Dict, current_year: int) -> Optional[int]:
+        """
+        Years since the lead's most relevant dated activity.
+        
+        Returns the age of the first date field that falls within the
+        3-year recency window, or None if no field qualifies.
+        """
         # Check various date fields
         date_fields = ['pub_date', 'publication_date']
         
@@ -297,43 +614,23 @@ class PropensityEngine:
             if date_val:
                 try:
                     if isinstance(date_val, str):
-                        year = int(date_val[:4])
-                        current_year = datetime.now().year
-                        years_ago = current_year - year
-                        
-                        if years_ago <= 1:
-                            return self.weights.recent_activity_weight
-                        elif years_ago <= 2:
-                            return self.weights.recent_activity_weight * 0.75
-                        elif years_ago <= 3:
-                            return self.weights.recent_activity_weight * 0.5
+                        years_ago = current_year - int(date_val[:4])
+                        if years_ago <= 3:
+                            return years_ago
                 except (ValueError, IndexError):
                     continue
         
-        return 0
+        return None
     
-    def _score_institution(self, lead: Dict) -> float:
+    def _score_institution(self, view: _LeadView) -> float:
         """Score based on institution fit."""
         # Use ICP score if available from company enricher
-        icp_score = lead.get('icp_score', 0)
+        icp_score = view.icp_score
         if icp_score:
             return (icp_score / 70) * self.weights.institution_fit_weight
         
         # Fallback: analyze institution type from company_info
-        company_info = lead.get('company_info', {})
-        inst_type = company_info.get('type', '')
-        
-        type_scores = {
-            'pharma': 1.0,
-            'biotech': 0.9,
-            'cro': 0.8,
-            'medical_center': 0.6,
-            'academic': 0.5,
-            'government': 0.4,
-        }
-        
-        score_pct = type_scores.get(inst_type, 0.3)
-        return score_pct * self.weights.institution_fit_weight
+        return self._institution_scores.get(view.institution_type, self._institution_default)
     
     def _determine_tier(self, score: float) -> str:
         """Determine lead tier based on score."""
@@ -346,27 +643,349 @@ class PropensityEngine:
         else:
             return 'ice'
     
-    def score_batch(self, leads: List[Dict]) -> List[Dict]:
+    def score_batch(self, leads: List[Dict], include_breakdown: bool = True) -> List[Dict]:
         """
         Score a batch of leads and add score information.
         
         Args:
             leads: List of lead dictionaries
+            include_breakdown: Store the serialized breakdown on each lead.
+                Turn off for large batches (scores are then computed
+                column-wise) and call ``get_breakdown`` only for the leads
+                that are displayed or exported.
             
         Returns:
             Leads with added score information
         """
-        for lead in leads:
-            score_breakdown = self.score_lead(lead)
-            lead['score'] = score_breakdown.total_score
-            lead['tier'] = score_breakdown.tier
-            lead['score_breakdown'] = score_breakdown.to_dict()
+        start = time.perf_counter()
+        self._score_all(leads, include_breakdown)
         
         # Sort by score descending
         leads.sort(key=lambda x: x.get('score', 0), reverse=True)
         
+        self.logger.info("Scored %d leads in %.3fs", len(leads), time.perf_counter() - start)
         return leads
     
+    def top_k(self, leads: List[Dict], k: int, include_breakdown: bool = True) -> List[Dict]:
+        """
+        Score a batch of leads and return only the k highest scoring.
+        
+        Uses a bounded heap instead of sorting the whole batch; ties keep
+        their input order, as with ``score_batch``.
+        
+        Args:
+            leads: List of lead dictionaries (scored in place)
+            k: Number of leads to return
+            include_breakdown: Store the serialized breakdown on the
+                returned leads only
+            
+        Returns:
+            Top k leads, sorted by score descending
+        """
+        self._score_all(leads, include_breakdown=False)
+        top = heapq.nlargest(k, leads, key=lambda x: x.get('score', 0))
+        
+        if include_breakdown:
+            for lead in top:
+                lead['score_breakdown'] = self.get_breakdown(lead)
+        
+        return top
+    
+    def _score_all(self, leads: List[Dict], include_breakdown: bool):
+        """Add score, tier and optionally the breakdown to each lead, unsorted."""
+        if not include_breakdown and len(leads) >= VECTORIZED_MIN_LEADS:
+            # Scores alone come from the columnar path. The NumPy version
+            # is used: loading the compiled kernel takes longer than it saves.
+            self._score_columns(leads, use_kernel=False)
+            return
+        
+        scored = (
+            self.parallel and len(leads) >= PARALLEL_MIN_LEADS and
+            self._score_parallel(leads, include_breakdown)
+        )
+        
+        if not scored:
+            # The batch is scored as of a single instant
+            self._now = datetime.now()
+            try:
+                for lead in leads:
+                    score_breakdown = self.score_lead(lead)
+                    lead['score'] = score_breakdown.total_score
+                    lead['tier'] = score_breakdown.tier
+                    if include_breakdown:
+                        lead['score_breakdown'] = score_breakdown.to_dict()
+            finally:
+                self._now = None
+    
+    def _score_parallel(self, leads: List[Dict], include_breakdown: bool) -> bool:
+        """
+        Score leads in a process pool, one contiguous chunk per worker.
+        
+        Returns:
+            True if all leads were scored, False if the pool failed
+        """
+        workers = self.max_workers or os.cpu_count() or 1
+        chunk_size = -(-len(leads) // workers)
+        chunks = [leads[i:i + chunk_size] for i in range(0, len(leads), chunk_size)]
+        score = partial(
+            _score_chunk,
+            weights=self.weights,
+            include_breakdown=include_breakdown,
+            now=datetime.now(),
+        )
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunk_results = list(executor.map(score, chunks))
+        except Exception as e:
+            self.logger.warning("Parallel scoring failed, running serially: %s", e)
+            return False
+        
+        results = (r for chunk, _ in chunk_results for r in chunk)
+        for lead, (total_score, tier, breakdown) in zip(leads, results):
+            lead['score'] = total_score
+            lead['tier'] = tier
+            if include_breakdown:
+                lead['score_breakdown'] = breakdown
+        self.fast_path_hits += sum(hits for _, hits in chunk_results)
+        return True
+    
+    def get_breakdown(self, lead: Dict) -> Dict:
+        """
+        Build the serialized score breakdown for a single lead on demand.
+        
+        Args:
+            lead: Lead dictionary
+            
+        Returns:
+            Breakdown dictionary, as stored by ``score_batch``
+        """
+        breakdown = lead.get('score_breakdown')
+        if breakdown is None:
+            breakdown = self.score_lead(lead).to_dict()
+        return breakdown
+    
+    def _extract_columns(self, leads: List[Dict], now: datetime) -> Dict[str, np.ndarray]:
+        """Pull every scoring input of a batch into its own array, in one pass."""
+        w = self.weights
+        n = len(leads)
+        
+        pubs = np.zeros(n)
+        grant_total = np.zeros(n)
+        has_grants = np.zeros(n, dtype=bool)
+        active_grants = np.zeros(n, dtype=np.int64)
+        has_trial = np.zeros(n, dtype=bool)
+        industry_trial = np.zeros(n, dtype=bool)
+        cited_by = np.zeros(n)
+        has_conf = np.zeros(n, dtype=bool)
+        keynote = np.zeros(n, dtype=bool)
+        years_ago = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+        role = np.zeros(n)
+        inst = np.zeros(n)
+        topic = np.zeros(n)
+        
+        for i, lead in enumerate(leads):
+            view = self._lead_view(lead, now)
+            pubs[i] = view.pub_count or 0
+            
+            if view.grant_count:
+                has_grants[i] = True
+                grant_total[i] = view.grant_total
+                active_grants[i] = view.active_grants
+            
+            if view.clinical_trial:
+                has_trial[i] = True
+                industry_trial[i] = view.sponsor_class == 'INDUSTRY'
+            
+            cited_by[i] = view.cited_by or 0
+            
+            if view.conference:
+                has_conf[i] = True
+                keynote[i] = view.conference.get('session_type', '') in ['keynote', 'symposium']
+            
+            if view.years_ago is not None:
+                years_ago[i] = view.years_ago
+            
+            role[i] = w.get_role_score(view.title)
+            inst[i] = self._score_institution(view)
+            topic[i] = w.get_topic_relevance_score(view.research_focus)
+        
+        return {
+            'pubs': pubs,
+            'grant_total': grant_total,
+            'has_grants': has_grants,
+            'active_grants': active_grants,
+            'has_trial': has_trial,
+            'industry_trial': industry_trial,
+            'cited_by': cited_by,
+            'has_conf': has_conf,
+            'keynote': keynote,
+            'years_ago': years_ago,
+            'role': role,
+            'inst': inst,
+            'topic': topic,
+        }
+    
+    def _activity_scores(self, cols: Dict[str, np.ndarray]) -> Tuple[np.ndarray, ...]:
+        """
+        Vectorized publication, grant, trial, citation, conference and
+        recency scores for extracted columns.
+        """
+        # Threshold ladders become a single searchsorted per column
+        w = self.weights
+        W = w._weights_vec
+        pub_thresh, pub_pct = w._pub_ladder
+        grant_thresh, grant_pct = w._grant_ladder
+        cit_thresh, cit_pct = _CITATION_LADDER
+        rec_years, rec_pct = _RECENCY_LADDER
+        
+        pub_score = pub_pct[np.searchsorted(pub_thresh, cols['pubs'], side='right')] * W[0]
+        
+        grant_score = grant_pct[
+            np.searchsorted(grant_thresh, cols['grant_total'], side='right')
+        ] * W[1]
+        grant_score = np.where(
+            cols['active_grants'] >= 2, np.minimum(grant_score * 1.2, W[1]), grant_score,
+        )
+        grant_score = np.where(cols['has_grants'], grant_score, 0.0)
+        
+        trial_score = np.where(cols['industry_trial'], W[2], W[2] * 0.5)
+        trial_score = np.where(cols['has_trial'], trial_score, 0.0)
+        
+        citation_score = cit_pct[
+            np.searchsorted(cit_thresh, cols['cited_by'], side='right')
+        ] * W[3]
+        
+        conf_score = np.where(cols['keynote'], W[4], W[4] * 0.7)
+        conf_score = np.where(cols['has_conf'], conf_score, 0.0)
+        
+        recency_score = rec_pct[
+            np.searchsorted(rec_years, cols['years_ago'], side='left')
+        ] * W[5]
+        
+        return pub_score, grant_score, trial_score, citation_score, conf_score, recency_score
+    
+    def score_batch_vectorized(self, leads: List[Dict]) -> List[Dict]:
+        """
+        Score a batch of leads using columnar NumPy arrays.
+        
+        Produces the same ``score`` and ``tier`` as ``score_batch`` but
+        skips the per-lead breakdown, so it suits ranking large batches.
+        
+        Args:
+            leads: List of lead dictionaries
+            
+        Returns:
+            Leads with added score and tier, sorted by score descending
+        """
+        if not leads:
+            return leads
+        
+        capped = self._score_columns(leads, use_kernel=True)
+        
+        # Sort by score descending (stable, like list.sort)
+        order = np.argsort(-capped, kind='stable')
+        leads[:] = [leads[i] for i in order]
+        
+        return leads
+    
+    def _score_columns(self, leads: List[Dict], use_kernel: bool) -> np.ndarray:
+        """
+        Set score and tier on each lead (unsorted) from columnar arrays.
+        
+        Args:
+            leads: Non-empty list of lead dictionaries
+            use_kernel: Use the compiled kernel when numba is available
+            
+        Returns:
+            Capped total score per lead, in input order
+        """
+        w = self.weights
+        cols = self._extract_columns(leads, datetime.now())
+        
+        score_kernel = _load_score_kernel() if use_kernel else None
+        if score_kernel is not None:
+            totals, tier_codes = score_kernel(
+                cols['pubs'], cols['grant_total'], cols['has_grants'],
+                cols['active_grants'], cols['has_trial'], cols['industry_trial'],
+                cols['cited_by'], cols['has_conf'], cols['keynote'],
+                cols['years_ago'], cols['role'], cols['inst'], cols['topic'],
+                w._weights_vec, w._tier_thresholds,
+                *w._pub_ladder, *w._grant_ladder,
+                *_CITATION_LADDER, *_RECENCY_LADDER,
+            )
+            tiers = [_TIER_NAMES[code] for code in tier_codes]
+        else:
+            pub, grant, trial, citation, conf, recency = self._activity_scores(cols)
+            totals = (
+                pub +
+                grant +
+                trial +
+                citation +
+                conf +
+                recency +
+                cols['role'] +
+                cols['inst'] +
+                cols['topic']
+            )
+            tier_idx = np.digitize(totals, w._tier_thresholds)
+            tiers = _TIERS_ASCENDING[tier_idx].tolist()
+        
+        capped = np.minimum(totals, 100)
+        
+        for i, lead in enumerate(leads):
+            lead['score'] = float(capped[i])
+            lead['tier'] = tiers[i]
+        
+        return capped
+    
+    def score_array(self, leads: List[Dict]) -> np.ndarray:
+        """
+        Score a batch of leads into a structured array of breakdowns.
+        
+        One row per lead, in input order, with the capped total, every
+        sub-score and the tier as an index into ``SCORE_TIERS``. Leads
+        are not modified; use ``get_breakdown`` for the full breakdown
+        (with key factors) of individual leads.
+        
+        Args:
+            leads: List of lead dictionaries
+            
+        Returns:
+            Array of dtype ``SCORE_DTYPE``
+        """
+        scores = np.zeros(len(leads), dtype=SCORE_DTYPE)
+        if not leads:
+            return scores
+        
+        cols = self._extract_columns(leads, datetime.now())
+        pub, grant, trial, citation, conf, recency = self._activity_scores(cols)
+        totals = (
+            pub +
+            grant +
+            trial +
+            citation +
+            conf +
+            recency +
+            cols['role'] +
+            cols['inst'] +
+            cols['topic']
+        )
+        
+        scores['total'] = np.minimum(totals, 100)
+        scores['publication'] = pub
+        scores['grant'] = grant
+        scores['clinical_trial'] = trial
+        scores['citation'] = citation
+        scores['conference'] = conf
+        scores['recency'] = recency
+        scores['role_fit'] = cols['role']
+        scores['institution_fit'] = cols['inst']
+        scores['topic_relevance'] = cols['topic']
+        scores['tier'] = np.digitize(totals, self.weights._tier_thresholds)
+        
+        return scores
+    
     def get_tier_summary(self, leads: List[Dict]) -> Dict:
         """Get summary of leads by tier."""
         tiers = {'hot': 0, 'warm': 0, 'cold': 0, 'ice': 0}
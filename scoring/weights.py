@@ -3,8 +3,56 @@
 Configurable weight system for lead scoring.
 """
 
+import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _build_automaton(table: Dict[str, int]):
+    """
+    Build an Aho-Corasick automaton over the keys of a score table.
+    
+    Each key maps to (position in table, score) so callers can recover
+    both the dictionary order and the score of every match.
+    Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None or not table:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for i, (key, score) in enumerate(table.items()):
+        automaton.add_word(key, (i, score))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_trie(table: Dict[str, int]) -> Dict:
+    """
+    Build a character trie over the keys of a score table.
+    
+    Nodes are dicts keyed by character; the empty-string key of a node
+    holds the score of the keyword ending there.
+    """
+    root: Dict = {}
+    for key, score in table.items():
+        node = root
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[''] = score
+    return root
+
+
+# Distinct titles and topics memoized per weights instance
+MATCH_CACHE_SIZE = 8192
 
 
 @dataclass
@@ -119,6 +167,95 @@ class ScoringWeights:
         'biomarker': 40,
     })
     
+    def __post_init__(self):
+        """
+        Precompute lookup tables used by the scoring hot path.
+        
+        Tables and caches are derived from the values given at
+        construction; create a new instance to score with other weights.
+        """
+        # Ladder thresholds, lowest rung first, for bisect lookups. The
+        # score fraction for a value is pct[bisect_right(thresh, value)].
+        pub = self.pub_score_thresholds
+        self._pub_thresh = [pub['minimal'], pub['moderate'], pub['good'], pub['excellent']]
+        self._pub_pct = [0, 0.25, 0.5, 0.75, 1.0]
+        
+        grant = self.grant_amount_thresholds
+        self._grant_thresh = [grant['seed'], grant['moderate'], grant['significant'], grant['major']]
+        self._grant_pct = [0.1, 0.25, 0.5, 0.75, 1.0]
+        
+        # Array forms for the batch scorer, so it reads weights by index
+        # instead of looking up nine attributes per call
+        self._pub_ladder = (
+            np.asarray(self._pub_thresh, dtype=np.float64),
+            np.asarray(self._pub_pct, dtype=np.float64),
+        )
+        self._grant_ladder = (
+            np.asarray(self._grant_thresh, dtype=np.float64),
+            np.asarray(self._grant_pct, dtype=np.float64),
+        )
+        self._weights_vec = np.array([
+            self.publication_weight,
+            self.grant_weight,
+            self.clinical_trial_weight,
+            self.citation_weight,
+            self.conference_weight,
+            self.recent_activity_weight,
+            self.role_fit_weight,
+            self.institution_fit_weight,
+            self.research_focus_weight,
+        ], dtype=np.float64)
+        self._tier_thresholds = np.array(
+            [self.cold_threshold, self.warm_threshold, self.hot_threshold],
+            dtype=np.float64,
+        )
+        
+        # Memoized matches keyed by the raw string, so repeated titles and
+        # topics skip lowercasing as well as matching. Both are free text,
+        # so the caches are bounded LRUs.
+        self._init_match_caches()
+        
+        # Multi-pattern matchers: one pass over a string finds every keyword
+        self._title_automaton = _build_automaton(self.target_titles_priority)
+        self._title_trie = _build_trie(self.target_titles_priority)
+        self._topic_automaton = _build_automaton(self.topic_relevance)
+        
+        # Topic keywords joined into one string so "topic is part of a
+        # keyword" is a single find(); offsets map a hit back to its keyword
+        self._topic_keywords = list(self.topic_relevance)
+        self._topic_blob = '\0'.join(self._topic_keywords)
+        self._topic_offsets = []
+        offset = 0
+        for keyword in self._topic_keywords:
+            self._topic_offsets.append(offset)
+            offset += len(keyword) + 1
+        
+        # Without pyahocorasick, one compiled alternation finds the keywords
+        # in a topic. The lookahead tries every start position, and listing
+        # keywords in table order makes each hit the earliest one there.
+        self._topic_index = {k: i for i, k in enumerate(self._topic_keywords)}
+        self._topic_re = None
+        if self._topic_keywords:
+            self._topic_re = re.compile(
+                '(?=(' + '|'.join(re.escape(k) for k in self._topic_keywords) + '))'
+            )
+    
+    def _init_match_caches(self):
+        """Create the per-instance role and topic LRU caches."""
+        self._role_score = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._match_role)
+        self._topic_relevance = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._match_topic_raw)
+    
+    def __getstate__(self) -> Dict:
+        # The caches wrap bound methods and cannot be pickled; workers
+        # build their own
+        state = self.__dict__.copy()
+        del state['_role_score'], state['_topic_relevance']
+        return state
+    
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._init_match_caches()
+    
     def validate(self) -> bool:
         """Validate that all weights sum appropriately."""
         total = (
@@ -138,14 +275,28 @@ class ScoringWeights:
         """Get role fit score for a job title."""
         if not title:
             return 0.0
-        
+        return self._role_score(title)
+    
+    def _match_role(self, title: str) -> float:
+        """Role fit score of a title, uncached (see ``get_role_score``)."""
         title_lower = title.lower()
         
         # Check for exact or partial matches
         best_score = 0
-        for target, score in self.target_titles_priority.items():
-            if target in title_lower:
+        if self._title_automaton is not None:
+            for _, (_, score) in self._title_automaton.iter(title_lower):
                 best_score = max(best_score, score)
+        else:
+            # Walk the trie from every position to find all contained titles
+            trie = self._title_trie
+            for start in range(len(title_lower)):
+                node = trie
+                for ch in title_lower[start:]:
+                    node = node.get(ch)
+                    if node is None:
+                        break
+                    if '' in node:
+                        best_score = max(best_score, node[''])
         
         # Normalize to weight
         return (best_score / 100) * self.role_fit_weight
@@ -157,16 +308,49 @@ class ScoringWeights:
         
         total_relevance = 0
         for topic in topics:
-            topic_lower = topic.lower()
-            for keyword, score in self.topic_relevance.items():
-                if keyword in topic_lower or topic_lower in keyword:
-                    total_relevance += score
-                    break
+            total_relevance += self._get_topic_relevance(topic)
         
         # Normalize: average relevance capped at max weight
         avg_relevance = total_relevance / len(topics) if topics else 0
         return min((avg_relevance / 100) * self.research_focus_weight, self.research_focus_weight)
     
+    def _get_topic_relevance(self, topic: str) -> int:
+        """Get relevance of a single topic (first matching keyword)."""
+        return self._topic_relevance(topic)
+    
+    def _match_topic_raw(self, topic: str) -> int:
+        """Relevance of a topic as given, uncached."""
+        if not self._topic_keywords:
+            return 0
+        return self._match_topic(topic.lower())
+    
+    def _match_topic(self, topic_lower: str) -> int:
+        """Score of the first keyword (in table order) related to the topic."""
+        first: Optional[int] = None
+        
+        # Keywords contained in the topic
+        if self._topic_automaton is not None:
+            for _, (i, _) in self._topic_automaton.iter(topic_lower):
+                if first is None or i < first:
+                    first = i
+        else:
+            for match in self._topic_re.finditer(topic_lower):
+                i = self._topic_index[match.group(1)]
+                if first is None or i < first:
+                    first = i
+        
+        # Topic contained in a keyword; the earliest hit is the first keyword
+        if '\0' not in topic_lower:
+            pos = self._topic_blob.find(topic_lower)
+            if pos >= 0:
+                i = bisect_right(self._topic_offsets, pos) - 1
+                if first is None or i < first:
+                    first = i
+        
+        if first is None:
+            return 0
+        return self.topic_relevance[self._topic_keywords[first]]
+    
     def to_dict(self) -> Dict:
         """Convert weights to dictionary."""
         return {
@@ -7,6 +7,7 @@ from .nih_reporter_scraper import NIHReporterScraper
 from .openalex_scraper import OpenAlexScraper
 from .clinicaltrials_scraper import ClinicalTrialsScraper
 from .conference_scraper import ConferenceScraper
+from .lead import Lead, TrialInfo, TrialLead
 
 __all__ = [
     'BaseScraper',
@@ -15,4 +16,7 @@ __all__ = [
     'OpenAlexScraper',
     'ClinicalTrialsScraper',
     'ConferenceScraper',
+    'Lead',
+    'TrialInfo',
+    'TrialLead',
 ]
@@ -0,0 +1,81 @@
+# BioLeads HTTP Session Pool
+"""
+Shared HTTP session for all scrapers.
+
+One session per retry policy means scrapers hitting the same hosts
+reuse keep-alive connections instead of each opening its own pool.
+"""
+
+import threading
+import weakref
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+# Connection pool sizing: hosts kept per adapter, connections per host
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Content codings urllib3 can decode in this environment: gzip and deflate,
+# plus br/zstd when the optional Brotli/zstandard packages are installed.
+# Never advertise a coding we could not decompress.
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'BioLeads/1.0 (Research Lead Generation; Contact: your-email@example.com)',
+    'Accept': 'application/json',
+    'Accept-Encoding': ACCEPT_ENCODING,
+}
+
+_sessions: Dict[int, requests.Session] = {}
+_lock = threading.Lock()
+
+
+def get_session(max_retries: int = 3) -> requests.Session:
+    """
+    Get the shared session for a retry policy, creating it on first use.
+    
+    The session is shared across scrapers and threads; callers should
+    pass per-request headers rather than modifying ``session.headers``.
+    
+    Args:
+        max_retries: Maximum retry attempts for failed requests
+        
+    Returns:
+        Shared requests session
+    """
+    with _lock:
+        session = _sessions.get(max_retries)
+        if session is None:
+            session = _create_session(max_retries)
+            _sessions[max_retries] = session
+        return session
+
+
+def _create_session(max_retries: int) -> requests.Session:
+    """Create a pooled session with retry configuration."""
+    session = requests.Session()
+    
+    retry_strategy = Retry(
+        total=max_retries,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST"],
+    )
+    
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry_strategy,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    
+    # Close pooled connections on interpreter shutdown
+    weakref.finalize(session, session.close)
+    
+    return session
@@ -3,33 +3,146 @@
 Abstract base class for all scrapers with common functionality.
 """
 
+import hashlib
+import itertools
 import json
 import logging
+import os
+import random
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import wraps
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Generator
+from typing import Any, Callable, Dict, Iterable, List, Optional, Generator
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+from ._http import get_session
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# ijson events that carry a complete value
+_SCALAR_EVENTS = frozenset(('null', 'boolean', 'integer', 'double', 'number', 'string'))
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON, with orjson when available."""
+    if orjson is not None:
+        try:
+            # Keep numpy scalars/arrays as JSON numbers rather than their str()
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+    return json.dumps(data, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def iter_result_items(events: Iterable, meta: Dict) -> Generator[Dict, None, None]:
+    """
+    Build each ``results`` item of a list response from ijson ``parse`` events.
+    
+    Scalar fields of the top-level ``meta`` object are copied into ``meta``
+    as they go by, so paging state comes out of the same single pass.
+    """
+    for prefix, event, value in events:
+        if event in _SCALAR_EVENTS and prefix.startswith('meta.') and prefix.count('.') == 1:
+            meta[prefix[5:]] = value
+        elif prefix == 'results.item' and event == 'start_map':
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            for prefix, event, value in events:
+                builder.event(event, value)
+                if prefix == 'results.item' and event == 'end_map':
+                    break
+            yield builder.value
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    
+    Holds up to ``capacity`` tokens, refilled at ``rate`` tokens per
+    second. Callers reserve tokens under a short lock and sleep outside
+    it, so threads with credit never wait on each other.
+    """
+    
+    def __init__(self, capacity: float, rate: float, jitter: float = 0.1):
+        """
+        Initialize the bucket (full).
+        
+        Args:
+            capacity: Maximum burst size in tokens
+            rate: Refill rate in tokens per second (<= 0 disables limiting)
+            jitter: Extra random wait, as a fraction of one refill interval,
+                to keep waiting threads from waking in lockstep
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.jitter = jitter
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, n: float = 1) -> float:
+        """
+        Take ``n`` tokens, going into debt if needed.
+        
+        Returns:
+            Seconds to wait before the reserved tokens are available
+        """
+        if self.rate <= 0:
+            return 0.0
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last_refill) * self.rate,
+            )
+            self._last_refill = now
+            self._tokens -= n
+            deficit = -self._tokens
+        
+        if deficit <= 0:
+            return 0.0
+        return deficit / self.rate + random.uniform(0, self.jitter / self.rate)
+    
+    def consume(self, n: float = 1) -> float:
+        """
+        Take ``n`` tokens, sleeping until they are available.
+        
+        Returns:
+            Seconds slept
+        """
+        wait = self.reserve(n)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
 
 
 def rate_limit(min_interval: float):
     """Decorator to enforce rate limiting between API calls."""
-    last_call = [0.0]
+    bucket = TokenBucket(capacity=1, rate=1 / min_interval if min_interval > 0 else 0)
     
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            elapsed = time.time() - last_call[0]
-            if elapsed < min_interval:
-                time.sleep(min_interval - elapsed)
-            result = func(*args, **kwargs)
-            last_call[0] = time.time()
-            return result
+            bucket.consume()
+            return func(*args, **kwargs)
         return wrapper
     return decorator
 
@@ -45,6 +158,12 @@ class BaseScraper(ABC):
     - Logging
     """
     
+    # Sequence number for raw file names, unique across scrapers in a process
+    _save_counter = itertools.count(1)
+    
+    # How long a cached file-name timestamp is reused, in seconds
+    SAVE_STAMP_TTL = 60.0
+    
     def __init__(
         self,
         name: str,
@@ -53,6 +172,9 @@ class BaseScraper(ABC):
         timeout: int = 30,
         max_retries: int = 3,
         storage_path: Optional[Path] = None,
+        max_concurrency: int = 8,
+        rate_limit_burst: int = 1,
+        cache_ttl: Optional[float] = None,
     ):
         """
         Initialize the scraper.
@@ -64,12 +186,19 @@ class BaseScraper(ABC):
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for failed requests
             storage_path: Path to save raw data (uses default if not provided)
+            max_concurrency: Maximum requests in flight at once
+            rate_limit_burst: Requests allowed back to back before the
+                rate limit applies
+            cache_ttl: Seconds a successful response is reused from the
+                on-disk response cache (None or 0 disables caching)
         """
         self.name = name
         self.base_url = base_url.rstrip('/')
         self.rate_limit_seconds = rate_limit_seconds
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.cache_ttl = cache_ttl
         self.logger = logging.getLogger(f"bioleads.scrapers.{name}")
         
         # Set up storage path
@@ -78,42 +207,32 @@ class BaseScraper(ABC):
             storage_path = settings.storage.raw_path
         self.storage_path = storage_path / name
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.cache_path = self.storage_path / 'api_cache'
         
-        # Track last request time for rate limiting
-        self._last_request_time = 0.0
+        # Token bucket shared by all threads of this scraper
+        self._bucket = TokenBucket(
+            capacity=rate_limit_burst,
+            rate=1 / rate_limit_seconds if rate_limit_seconds > 0 else 0,
+        )
+        self._in_flight = threading.Semaphore(max_concurrency)
         
-        # Set up session with retry logic
+        # Shared session with retry logic and connection pooling
         self.session = self._create_session()
+        self._encoding_logged = False
+        
+        # (monotonic time, formatted stamp) reused for raw file names
+        self._cached_stamp: Optional[tuple] = None
     
     def _create_session(self) -> requests.Session:
-        """Create a requests session with retry configuration."""
-        session = requests.Session()
-        
-        retry_strategy = Retry(
-            total=self.max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"],
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        # Set default headers
-        session.headers.update({
-            'User-Agent': 'BioLeads/1.0 (Research Lead Generation; Contact: your-email@example.com)',
-            'Accept': 'application/json',
-        })
-        
-        return session
+        """Get the shared, pooled session for this scraper's retry policy."""
+        return get_session(self.max_retries)
     
     def _rate_limit_wait(self):
-        """Wait if needed to respect rate limits."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_seconds:
-            sleep_time = self.rate_limit_seconds - elapsed
-            self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+        """Wait if needed to respect rate limits (safe across threads)."""
+        sleep_time = self._bucket.reserve()
+        if sleep_time > 0:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Rate limiting: sleeping for %.2fs", sleep_time)
             time.sleep(sleep_time)
     
     def fetch(
@@ -124,10 +243,15 @@ class BaseScraper(ABC):
         data: Optional[Dict] = None,
         json_data: Optional[Dict] = None,
         headers: Optional[Dict] = None,
+        force_refresh: bool = False,
     ) -> Optional[Dict]:
         """
         Make an HTTP request with rate limiting and error handling.
         
+        With ``cache_ttl`` set, identical requests (same URL, method,
+        parameters and body) made within the TTL are answered from the
+        on-disk response cache without touching the network.
+        
         Args:
             endpoint: API endpoint (appended to base_url)
             method: HTTP method (GET, POST)
@@ -135,41 +259,190 @@ class BaseScraper(ABC):
             data: Form data for POST
             json_data: JSON body for POST
             headers: Additional headers
+            force_refresh: Skip the response cache lookup (the fresh
+                response is still stored)
             
         Returns:
             JSON response as dict, or None if request failed
         """
-        self._rate_limit_wait()
-        
         url = f"{self.base_url}/{endpoint.lstrip('/')}" if endpoint else self.base_url
         
+        cache_key = None
+        if self.cache_ttl:
+            cache_key = self._cache_key(method, url, params, data, json_data)
+            if not force_refresh:
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    return cached
+        
+        self._rate_limit_wait()
+        
         try:
-            self.logger.info(f"Fetching: {url}")
+            self.logger.info("Fetching: %s", url)
             
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                data=data,
-                json=json_data,
-                headers=headers,
-                timeout=self.timeout,
-            )
+            body = self._encode_json_body(json_data)
+            if body is not None:
+                data, json_data = body, None
+                headers = {**(headers or {}), 'Content-Type': 'application/json'}
             
-            self._last_request_time = time.time()
+            with self._in_flight:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    data=data,
+                    json=json_data,
+                    headers=headers,
+                    timeout=self.timeout,
+                )
             
             response.raise_for_status()
             
+            if not self._encoding_logged:
+                # Confirm once which content coding the server negotiated
+                self._encoding_logged = True
+                self.logger.debug(
+                    "Response Content-Encoding: %s",
+                    response.headers.get('Content-Encoding', 'identity'),
+                )
+            
             # Try to parse JSON, return raw text if not JSON
-            try:
-                return response.json()
-            except json.JSONDecodeError:
-                return {'raw_content': response.text}
+            result = self._parse_json(response)
+            if cache_key is not None:
+                self._cache_put(cache_key, result)
+            return result
                 
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Request failed for {url}: {e}")
+            self.logger.error("Request failed for %s: %s", url, e)
             return None
     
+    def fetch_stream(
+        self,
+        endpoint: str = '',
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        method: str = 'GET',
+        data: Optional[Dict] = None,
+        json_data: Optional[Dict] = None,
+    ) -> Optional[requests.Response]:
+        """
+        Make a rate-limited request whose body is left unread for streaming.
+        
+        The caller reads ``response.raw`` (content coding already undone)
+        and must close the response. The response cache is not consulted.
+        
+        Returns:
+            The open response, or None if the request failed
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}" if endpoint else self.base_url
+        
+        self._rate_limit_wait()
+        
+        response = None
+        try:
+            self.logger.info("Fetching: %s", url)
+            
+            body = self._encode_json_body(json_data)
+            if body is not None:
+                data, json_data = body, None
+                headers = {**(headers or {}), 'Content-Type': 'application/json'}
+            
+            with self._in_flight:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    data=data,
+                    json=json_data,
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=True,
+                )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            self.logger.error("Request failed for %s: %s", url, e)
+            if response is not None:
+                response.close()
+            return None
+        
+        response.raw.decode_content = True
+        return response
+    
+    def _cache_key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        data: Optional[Dict],
+        json_data: Optional[Dict],
+    ) -> str:
+        """Content address of a request: hash of its canonical JSON form."""
+        payload = json.dumps(
+            [method.upper(), url, params, data, json_data],
+            sort_keys=True, default=str,
+        )
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """Cached response for a key, or None if missing or older than the TTL."""
+        path = self.cache_path / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > self.cache_ttl:
+                return None
+            content = path.read_bytes()
+        except OSError:
+            return None
+        
+        try:
+            return orjson.loads(content) if orjson is not None else json.loads(content)
+        except ValueError:
+            return None
+    
+    def _cache_put(self, key: str, value: Any) -> None:
+        """Store a response in the cache (written atomically)."""
+        path = self.cache_path / f"{key}.json"
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            self.cache_path.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(_dumps(value))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.debug("Could not cache response: %s", e)
+    
+    @staticmethod
+    def _encode_json_body(json_data: Optional[Dict]) -> Optional[bytes]:
+        """
+        Encode a JSON request body with orjson, when available.
+        
+        Returns None to leave encoding to requests (no body, no orjson, or
+        a body orjson rejects, e.g. integers beyond 64 bits).
+        """
+        if json_data is None or orjson is None:
+            return None
+        try:
+            return orjson.dumps(json_data)
+        except TypeError:
+            return None
+    
+    def _parse_json(self, response: requests.Response) -> Dict:
+        """
+        Parse a JSON response body.
+        
+        Uses orjson on the raw bytes when available, which skips decoding
+        the body to str first. Falls back to requests' own decoding for
+        non-UTF-8 bodies, and to the raw text if the body is not JSON.
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                pass
+        
+        try:
+            return response.json()
+        except json.JSONDecodeError:
+            return {'raw_content': response.text}
+    
     def fetch_all(
         self,
         endpoint: str,
@@ -183,6 +456,11 @@ class BaseScraper(ABC):
         """
         Fetch all pages of results from a paginated API.
         
+        The first page is fetched alone to learn the total. Once the caller
+        has consumed it, the remaining pages are requested concurrently, at
+        most ``max_concurrency`` ahead of the caller, and yielded in page
+        order.
+        
         Args:
             endpoint: API endpoint
             params: Base query parameters
@@ -195,20 +473,31 @@ class BaseScraper(ABC):
         Yields:
             Individual result items
         """
-        offset = 0
-        total_fetched = 0
-        
-        while True:
+        def fetch_page(offset: int) -> Optional[Dict]:
             page_params = {**params, page_param: offset, 'limit': page_size}
-            response = self.fetch(endpoint, params=page_params)
-            
-            if not response:
-                break
-            
-            results = response.get(results_key, [])
-            if not results:
-                break
-            
+            return self.fetch(endpoint, params=page_params)
+        
+        # Prime with the first page to learn the total
+        response = fetch_page(0)
+        if not response:
+            return
+        
+        results = response.get(results_key, [])
+        if not results:
+            return
+        
+        total = response.get(total_key, 0)
+        if max_results:
+            total = min(total, max_results)
+        offsets = list(range(page_size, total, page_size))
+        
+        # Later pages are requested only once the caller is done with page
+        # one, so stopping there costs no extra requests; after that, up to
+        # max_concurrency pages are in flight while the caller works
+        pages = self._imap_concurrent(fetch_page, offsets)
+        
+        total_fetched = 0
+        try:
             for item in results:
                 yield item
                 total_fetched += 1
@@ -216,11 +505,23 @@ class BaseScraper(ABC):
                 if max_results and total_fetched >= max_results:
                     return
             
-            total = response.get(total_key, 0)
-            offset += page_size
-            
-            if offset >= total:
-                break
+            for response in pages:
+                if not response:
+                    break
+                
+                results = response.get(results_key, [])
+                if not results:
+                    break
+                
+                for item in results:
+                    yield item
+                    total_fetched += 1
+                    
+                    if max_results and total_fetched >= max_results:
+                        return
+        finally:
+            # Drop pages not yet requested if the caller stops early
+            pages.close()
     
     def save_raw(self, data: Any, filename: str, timestamp: bool = True) -> Path:
         """
@@ -234,18 +535,87 @@ class BaseScraper(ABC):
         Returns:
             Path to saved file
         """
-        if timestamp:
-            ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"{filename}_{ts}"
+        filepath = self._raw_filepath(filename, timestamp, 'json')
         
-        filepath = self.storage_path / f"{filename}.json"
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(data))
+        
+        self.logger.info("Saved raw data to %s", filepath)
+        return filepath
+    
+    def save_raw_ndjson(self, items: Iterable[Any], filename: str, timestamp: bool = True) -> Path:
+        """
+        Stream items to storage as newline-delimited JSON.
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        Items are written as they arrive (e.g. straight from ``fetch_all``),
+        so memory stays flat and a partial run still leaves valid lines.
         
-        self.logger.info(f"Saved raw data to {filepath}")
+        Args:
+            items: Items to save, one JSON document per line
+            filename: Base filename (without extension)
+            timestamp: Whether to append timestamp to filename
+            
+        Returns:
+            Path to saved file (not created if there were no items)
+        """
+        filepath = self._raw_filepath(filename, timestamp, 'ndjson')
+        for _ in self.stream_raw_ndjson(items, filepath):
+            pass
         return filepath
     
+    def stream_raw_ndjson(self, items: Iterable[Any], filepath: Path) -> Generator[Any, None, None]:
+        """
+        Write items to an NDJSON file while passing them through.
+        
+        Lets a lead generator save its raw records on the way past without
+        holding them all in memory first.
+        
+        Args:
+            items: Items to save, one JSON document per line
+            filepath: Destination file
+            
+        The file is only created once the first item arrives, so an empty
+        run leaves nothing behind.
+        
+        Yields:
+            Each item, after it has been written
+        """
+        count = 0
+        f = None
+        try:
+            for item in items:
+                if f is None:
+                    f = open(filepath, 'wb')
+                f.write(_dumps(item) + b'\n')
+                count += 1
+                yield item
+        finally:
+            if f is not None:
+                f.close()
+        
+        if count:
+            self.logger.info("Saved %s raw records to %s", count, filepath)
+    
+    def _raw_filepath(self, filename: str, timestamp: bool, extension: str) -> Path:
+        """Build the storage path for a raw data file."""
+        if timestamp:
+            filename = f"{filename}_{self._save_stamp()}_{next(self._save_counter)}"
+        return self.storage_path / f"{filename}.{extension}"
+    
+    def _save_stamp(self) -> str:
+        """
+        Timestamp for raw file names, refreshed at most once a minute.
+        
+        The stamp only orders files roughly in time; the sequence number
+        appended after it keeps names unique when saves share a second.
+        """
+        now = time.monotonic()
+        cached = self._cached_stamp
+        if cached is None or now - cached[0] >= self.SAVE_STAMP_TTL:
+            cached = (now, datetime.now().strftime('%Y%m%d_%H%M%S'))
+            self._cached_stamp = cached
+        return cached[1]
+    
     @abstractmethod
     def search(self, query: str, max_results: int = 100) -> List[Dict]:
         """
@@ -260,6 +630,18 @@ class BaseScraper(ABC):
         """
         pass
     
+    def result_key(self, raw_data: Dict) -> Optional[Any]:
+        """
+        Identify a raw search result across queries.
+        
+        Results with the same key are parsed only once per run. The
+        default returns None, which disables de-duplication.
+        
+        Args:
+            raw_data: Raw data from API
+        """
+        return None
+    
     @abstractmethod
     def parse_lead(self, raw_data: Dict) -> Dict:
         """
@@ -290,36 +672,125 @@ class BaseScraper(ABC):
         queries: List[str],
         max_results_per_query: int = 100,
         save_raw: bool = True,
-    ) -> List[Dict]:
+        dedupe_key: Optional[Callable[[Dict], Any]] = None,
+    ) -> Generator[Dict, None, None]:
         """
         Run the scraper for multiple queries.
         
+        Queries run concurrently (up to ``max_concurrency`` ahead of the
+        caller); the shared token bucket keeps the combined request rate
+        within the limit. Leads are yielded in query order as each query is
+        parsed, and a query's results are dropped once its leads are
+        handed out; wrap in ``list()`` when the full result set is needed.
+        
         Args:
             queries: List of search queries
             max_results_per_query: Maximum results per query
             save_raw: Whether to save raw data
+            dedupe_key: Function of a raw result (defaults to ``result_key``);
+                results whose key was already seen in an earlier query are
+                skipped before parsing
             
-        Returns:
-            List of all parsed lead records
+        Yields:
+            Parsed lead records
         """
-        all_leads = []
-        
-        for i, query in enumerate(queries):
-            self.logger.info(f"Processing query {i+1}/{len(queries)}: {query[:50]}...")
-            
+        def search_query(i: int, query: str) -> Optional[List[Dict]]:
+            self.logger.info("Processing query %s/%s: %s...", i+1, len(queries), query[:50])
             try:
-                results = self.search(query, max_results=max_results_per_query)
-                
-                if save_raw and results:
-                    self.save_raw(results, f"search_{i+1}")
-                
-                leads = [self.parse_lead(r) for r in results if r]
-                all_leads.extend([l for l in leads if l])
+                return self.search(query, max_results=max_results_per_query)
+            except Exception as e:
+                self.logger.error("Error processing query '%s': %s", query, e)
+                return None
+        
+        dedupe_key = dedupe_key or self.result_key
+        
+        # Searches run concurrently; parsing happens in query order as each
+        # search is consumed, so duplicates across queries are skipped
+        # deterministically
+        all_results = self._imap_concurrent(search_query, range(len(queries)), queries)
+        
+        total = 0
+        seen = set()
+        try:
+            for i, (query, results) in enumerate(zip(queries, all_results)):
+                if results is None:
+                    continue
                 
-                self.logger.info(f"Found {len(leads)} leads from query")
+                try:
+                    unique = []
+                    for r in results:
+                        key = dedupe_key(r) if r else None
+                        if key is not None:
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                        unique.append(r)
+                    results = unique
+                    
+                    if save_raw and results:
+                        self.save_raw(results, f"search_{i+1}")
+                    
+                    leads = [self.parse_lead(r) for r in results if r]
+                    self.logger.info("Found %s leads from query", len(leads))
+                    
+                except Exception as e:
+                    self.logger.error("Error processing query '%s': %s", query, e)
+                    continue
                 
-            except Exception as e:
-                self.logger.error(f"Error processing query '{query}': {e}")
+                # Release the raw results before handing out this query's leads
+                del results, unique
+                for lead in leads:
+                    if lead:
+                        total += 1
+                        yield lead
+        finally:
+            # Cancel searches not yet started if the caller stops early
+            all_results.close()
         
-        self.logger.info(f"Total leads found: {len(all_leads)}")
-        return all_leads
+        self.logger.info("Total leads found: %s", total)
+    
+    def search_many(self, queries: List[str], max_results: int = 100) -> Generator[List[Dict], None, None]:
+        """
+        Run several searches concurrently.
+        
+        Searches run at most ``max_concurrency`` ahead of the caller, so
+        only a bounded number of result lists is held at once.
+        
+        Args:
+            queries: List of search queries
+            max_results: Maximum results per query
+            
+        Yields:
+            Search results per query, in query order
+        """
+        yield from self._imap_concurrent(
+            lambda query: self.search(query, max_results=max_results), queries,
+        )
+    
+    def _map_concurrent(self, func, *iterables):
+        """Map ``func`` over the iterables in a thread pool, in order."""
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            return list(executor.map(func, *iterables))
+    
+    def _imap_concurrent(self, func, *iterables) -> Generator[Any, None, None]:
+        """
+        Lazily map ``func`` over the iterables in a thread pool, in order.
+        
+        Nothing is submitted until the first result is requested; from then
+        on at most ``max_concurrency`` calls run ahead of the consumer, so
+        results never pile up behind a slow caller. Closing the generator
+        cancels the calls not yet started.
+        """
+        args = zip(*iterables)
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        try:
+            window = deque(
+                executor.submit(func, *a) for a in itertools.islice(args, self.max_concurrency)
+            )
+            while window:
+                result = window.popleft().result()
+                for a in itertools.islice(args, 1):
+                    window.append(executor.submit(func, *a))
+                yield result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
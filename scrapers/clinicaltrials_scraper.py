@@ -5,10 +5,28 @@ Finds clinical trials using 3D in-vitro models or organoids.
 Free, public API.
 """
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Generator, List, Optional
 from datetime import datetime
 
 from .base_scraper import BaseScraper
+from .lead import TrialInfo, TrialLead
+
+# Largest page the v2 API serves; bigger pages mean fewer round trips
+MAX_PAGE_SIZE = 1000
+
+# Shared read-only default for missing nested modules, so walking a sparse
+# trial record does not allocate a fresh empty dict per lookup
+_EMPTY = MappingProxyType({})
+
+
+@lru_cache(maxsize=4096)
+def _join_location(city: Optional[str], state: Optional[str], country: Optional[str]) -> str:
+    """Join the non-empty location parts; sites repeat across a sponsor's trials."""
+    if city and state and country:
+        return f'{city}, {state}, {country}'
+    return ', '.join(filter(None, (city, state, country)))
 
 
 class ClinicalTrialsScraper(BaseScraper):
@@ -21,8 +39,16 @@ class ClinicalTrialsScraper(BaseScraper):
     API Documentation: https://clinicaltrials.gov/data-api/api
     """
     
-    def __init__(self):
-        """Initialize ClinicalTrials.gov scraper."""
+    def __init__(self, include_raw_data: bool = False):
+        """
+        Initialize ClinicalTrials.gov scraper.
+        
+        Args:
+            include_raw_data: Attach the full trial record to each lead as
+                ``raw_data``. Off by default: trial protocols are large, and
+                the raw records are saved once by ``run_with_keywords``
+                (look them up by ``source_id``, the NCT id).
+        """
         from ..config.settings import settings
         
         super().__init__(
@@ -30,6 +56,7 @@ class ClinicalTrialsScraper(BaseScraper):
             base_url=settings.api.clinicaltrials_base_url,
             rate_limit_seconds=settings.api.clinicaltrials_rate_limit,
         )
+        self.include_raw_data = include_raw_data
     
     def search(self, query: str, max_results: int = 100) -> List[Dict]:
         """
@@ -42,16 +69,18 @@ class ClinicalTrialsScraper(BaseScraper):
         Returns:
             List of trial dictionaries
         """
-        self.logger.info(f"Searching ClinicalTrials.gov: {query[:50]}...")
+        self.logger.info("Searching ClinicalTrials.gov: %s...", query[:50])
         
         all_trials = []
         page_token = None
-        page_size = min(100, max_results)
         
+        # The API pages by opaque cursor (nextPageToken) only, so pages
+        # cannot be requested in parallel; instead ask for everything still
+        # needed in as few pages as possible.
         while len(all_trials) < max_results:
             params = {
                 'query.term': query,
-                'pageSize': page_size,
+                'pageSize': min(MAX_PAGE_SIZE, max_results - len(all_trials)),
                 'format': 'json',
                 'fields': ','.join([
                     'NCTId', 'BriefTitle', 'OfficialTitle',
@@ -87,7 +116,7 @@ class ClinicalTrialsScraper(BaseScraper):
             if not page_token:
                 break
         
-        self.logger.info(f"Found {len(all_trials)} trials")
+        self.logger.info("Found %s trials", len(all_trials))
         return all_trials[:max_results]
     
     def search_by_sponsor(self, sponsor_name: str, max_results: int = 50) -> List[Dict]:
@@ -123,45 +152,49 @@ class ClinicalTrialsScraper(BaseScraper):
         response = self.fetch(f'studies/{nct_id}', params={'format': 'json'})
         return response
     
+    def result_key(self, raw_data: Dict) -> Optional[str]:
+        """Identify a raw study record by its NCT identifier."""
+        if not raw_data:
+            return None
+        return raw_data.get('protocolSection', {}).get('identificationModule', {}).get('nctId')
+    
     def parse_lead(self, raw_data: Dict) -> Optional[Dict]:
         """
         Parse trial data into lead format.
         
         Extracts Principal Investigator or Responsible Party as lead.
         """
+        record = self.parse_record(raw_data)
+        return record.to_dict() if record else None
+    
+    def parse_record(self, raw_data: Dict) -> Optional[TrialLead]:
+        """Parse trial data into a compact lead record."""
         if not raw_data:
             return None
         
         # Extract from nested protocol section
-        protocol = raw_data.get('protocolSection', {})
-        id_module = protocol.get('identificationModule', {})
-        sponsor_module = protocol.get('sponsorCollaboratorsModule', {})
-        contacts_module = protocol.get('contactsLocationsModule', {})
-        description_module = protocol.get('descriptionModule', {})
-        conditions_module = protocol.get('conditionsModule', {})
+        protocol = raw_data.get('protocolSection') or _EMPTY
+        id_module = protocol.get('identificationModule') or _EMPTY
+        contacts_module = protocol.get('contactsLocationsModule') or _EMPTY
+        conditions_module = protocol.get('conditionsModule') or _EMPTY
         
         nct_id = id_module.get('nctId', '')
         
         # Get lead sponsor
-        lead_sponsor = sponsor_module.get('leadSponsor', {})
+        lead_sponsor = (protocol.get('sponsorCollaboratorsModule') or _EMPTY).get('leadSponsor') or _EMPTY
         sponsor_name = lead_sponsor.get('name', '')
         sponsor_class = lead_sponsor.get('class', '')  # INDUSTRY, NETWORK, etc.
         
         # Get overall officials (Principal Investigators)
-        overall_officials = contacts_module.get('overallOfficials', [])
-        pi_name = ''
-        pi_affiliation = ''
-        pi_role = ''
-        
-        if overall_officials:
-            pi = overall_officials[0]
-            pi_name = pi.get('name', '')
-            pi_affiliation = pi.get('affiliation', '')
-            pi_role = pi.get('role', '')
+        overall_officials = contacts_module.get('overallOfficials')
+        pi = overall_officials[0] if overall_officials else _EMPTY
+        pi_name = pi.get('name', '')
+        pi_affiliation = pi.get('affiliation', '')
+        pi_role = pi.get('role', '')
         
         # Get locations
-        locations = contacts_module.get('locations', [])
-        primary_location = locations[0] if locations else {}
+        locations = contacts_module.get('locations')
+        primary_location = locations[0] if locations else _EMPTY
         
         # Get conditions/keywords for research focus
         conditions = conditions_module.get('conditions', [])
@@ -176,46 +209,45 @@ class ClinicalTrialsScraper(BaseScraper):
             lead_name = sponsor_name
             lead_institution = sponsor_name
         
-        return {
-            'source': 'clinicaltrials',
-            'source_id': nct_id,
-            'name': lead_name,
-            'email': None,  # Not exposed in API
-            'title': pi_role or 'Principal Investigator',
-            'institution': lead_institution,
-            'department': None,
-            'location': self._format_location(primary_location),
-            'research_focus': research_focus[:10],
-            'publications': 0,
-            'grants': [],
-            'clinical_trial': {
-                'nct_id': nct_id,
-                'title': id_module.get('officialTitle') or id_module.get('briefTitle', ''),
-                'brief_summary': description_module.get('briefSummary', ''),
-                'phase': protocol.get('designModule', {}).get('phases', []),
-                'status': protocol.get('statusModule', {}).get('overallStatus', ''),
-                'sponsor': sponsor_name,
-                'sponsor_class': sponsor_class,
-                'conditions': conditions,
-            },
-            'sponsor_class': sponsor_class,  # Useful for filtering (INDUSTRY = pharma)
-            'raw_data': raw_data,
-        }
+        return TrialLead(
+            source='clinicaltrials',
+            source_id=nct_id,
+            name=lead_name,
+            email=None,  # Not exposed in API
+            title=pi_role or 'Principal Investigator',
+            institution=lead_institution,
+            department=None,
+            location=self._format_location(primary_location),
+            research_focus=research_focus[:10],
+            publications=0,
+            grants=[],
+            clinical_trial=TrialInfo(
+                nct_id=nct_id,
+                title=id_module.get('officialTitle') or id_module.get('briefTitle', ''),
+                brief_summary=(protocol.get('descriptionModule') or _EMPTY).get('briefSummary', ''),
+                phase=(protocol.get('designModule') or _EMPTY).get('phases', []),
+                status=(protocol.get('statusModule') or _EMPTY).get('overallStatus', ''),
+                sponsor=sponsor_name,
+                sponsor_class=sponsor_class,
+                conditions=conditions,
+            ),
+            sponsor_class=sponsor_class,
+            raw_data=raw_data if self.include_raw_data else None,
+        )
     
     def _format_location(self, location: Dict) -> str:
         """Format location from trial location data."""
-        parts = filter(None, [
+        return _join_location(
             location.get('city'),
             location.get('state'),
             location.get('country'),
-        ])
-        return ', '.join(parts)
+        )
     
     def run_with_keywords(
         self,
         max_results_per_query: int = 30,
         save_raw: bool = True,
-    ) -> List[Dict]:
+    ) -> Generator[Dict, None, None]:
         """
         Run scraper using pre-configured keywords.
         
@@ -223,8 +255,8 @@ class ClinicalTrialsScraper(BaseScraper):
             max_results_per_query: Max results per query
             save_raw: Whether to save raw data
             
-        Returns:
-            List of parsed lead records
+        Yields:
+            Parsed lead records, as each trial is parsed
         """
         # Queries relevant to 3D in-vitro models in clinical settings
         queries = [
@@ -236,19 +268,25 @@ class ClinicalTrialsScraper(BaseScraper):
             'patient-derived model',
         ]
         
-        all_leads = []
-        all_trials = []
-        
-        for query in queries:
-            trials = self.search(query, max_results=max_results_per_query)
-            all_trials.extend(trials)
-            
-            for trial in trials:
-                lead = self.parse_lead(trial)
-                if lead:
-                    all_leads.append(lead)
+        def unique_trials():
+            seen = set()
+            for trials in self.search_many(queries, max_results=max_results_per_query):
+                for trial in trials:
+                    # Keywords overlap; parse each trial only once
+                    nct_id = self.result_key(trial)
+                    if nct_id:
+                        if nct_id in seen:
+                            continue
+                        seen.add(nct_id)
+                    yield trial
         
-        if save_raw and all_trials:
-            self.save_raw(all_trials, 'all_trials')
+        trials = unique_trials()
+        if save_raw:
+            trials = self.stream_raw_ndjson(
+                trials, self._raw_filepath('all_trials', True, 'ndjson'),
+            )
         
-        return all_leads
+        for trial in trials:
+            lead = self.parse_lead(trial)
+            if lead:
+                yield lead
@@ -4,13 +4,164 @@ Scraper for scientific conferences related to 3D in-vitro models.
 Focuses on Society of Toxicology (SOT) and similar conferences.
 """
 
-import re
-from typing import Dict, List, Optional
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+import requests
 
 from .base_scraper import BaseScraper
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _class_xpath(scope: str, tags: List[str], pattern: str) -> etree.XPath:
+    """Compile an XPath selecting ``tags`` whose class matches ``pattern`` (ignoring case)."""
+    tag_test = ' or '.join(f'self::{tag}' for tag in tags)
+    return etree.XPath(
+        f"{scope}*[{tag_test}][re:test(@class, '{pattern}', 'i')]",
+        namespaces={'re': 'http://exslt.org/regular-expressions'},
+    )
+
+
+# Program page selectors, compiled once
+_XP_SESSIONS = _class_xpath('//', ['div', 'article'], 'session|abstract|presentation|talk|poster')
+_XP_DESC = _class_xpath('.//', ['p', 'div'], 'desc|abstract|content')
+_XP_AUTHOR = _class_xpath('.//', ['span', 'div', 'p'], 'author|presenter|speaker')
+_XP_AFFIL = _class_xpath('.//', ['span', 'div', 'p'], 'affil|org|instit')
+_XP_TITLE = etree.XPath('.//*[self::h1 or self::h2 or self::h3 or self::h4 or self::a]')
+
+# Visible text nodes (comments are not text nodes; skip script/style)
+_XP_TEXT = etree.XPath('.//text()[not(parent::script or parent::style)]')
+
+_logger = logging.getLogger('bioleads.scrapers.conference')
+
+
+# A parsed session: (session dict, searchable text, matches a target keyword)
+_ProgramEntry = Tuple[Dict, str, bool]
+
+
+def _first(xpath: etree.XPath, element):
+    """First match of an XPath in document order, or None."""
+    matches = xpath(element)
+    return matches[0] if matches else None
+
+
+def _get_text(element, strip: bool = False) -> str:
+    """Text of an element; with strip, each text node is stripped and joined."""
+    if element is None:
+        return ''
+    texts = _XP_TEXT(element)
+    if strip:
+        return ''.join(t.strip() for t in texts if t.strip())
+    return ''.join(texts)
+
+
+@lru_cache(maxsize=32)
+def _keyword_automaton(keywords: Tuple[str, ...]):
+    """
+    Build an Aho-Corasick automaton over lowercased keywords, so one pass
+    finds any of them. Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None or not keywords:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+def _has_keyword(text: str, keywords: Tuple[str, ...]) -> bool:
+    """Whether lowercased text contains any of the lowercased keywords."""
+    automaton = _keyword_automaton(keywords)
+    if automaton is not None:
+        return next(automaton.iter(text), None) is not None
+    return any(kw in text for kw in keywords)
+
+
+def _detect_session_type(text: str) -> str:
+    """Detect whether this is a poster, talk, symposium, etc. (text lowercased)."""
+    if 'poster' in text:
+        return 'poster'
+    elif 'symposium' in text:
+        return 'symposium'
+    elif 'workshop' in text:
+        return 'workshop'
+    elif 'keynote' in text:
+        return 'keynote'
+    else:
+        return 'presentation'
+
+
+def _extract_session(element, conference_name: str) -> Optional[Tuple[Dict, str]]:
+    """Extract session information and its searchable text from an HTML element."""
+    try:
+        # Get title
+        title = _get_text(_first(_XP_TITLE, element), strip=True)
+        
+        # Get description/abstract
+        description = _get_text(_first(_XP_DESC, element), strip=True)
+        
+        # Text checked for relevance
+        text = f"{title} {description}".lower()
+        
+        # Try to extract presenter info
+        presenter = _get_text(_first(_XP_AUTHOR, element), strip=True)
+        
+        # Try to extract affiliation
+        affiliation = _get_text(_first(_XP_AFFIL, element), strip=True)
+        
+        session = {
+            'title': title,
+            'description': description,
+            'presenter': presenter,
+            'affiliation': affiliation,
+            'conference': conference_name,
+            'session_type': _detect_session_type(_get_text(element).lower()),
+        }
+        return session, text
+        
+    except Exception as e:
+        _logger.debug("Error extracting session: %s", e)
+        return None
+
+
+def _parse_program_html(
+    html: str,
+    conference_name: str,
+    keywords: Tuple[str, ...],
+) -> Optional[List[_ProgramEntry]]:
+    """
+    Parse every session on a program page, ahead of any query filter.
+    
+    Returns:
+        Parsed sessions, or None if the page is not parseable HTML
+    """
+    try:
+        tree = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+    
+    # Look for session/abstract containers (common patterns)
+    # This needs to be adapted for each conference site
+    sessions = []
+    for elem in _XP_SESSIONS(tree):
+        extracted = _extract_session(elem, conference_name)
+        if extracted:
+            session, text = extracted
+            sessions.append((session, text, _has_keyword(text, keywords)))
+    
+    return sessions
+
 
 class ConferenceScraper(BaseScraper):
     """
@@ -42,12 +193,14 @@ class ConferenceScraper(BaseScraper):
         },
     }
     
-    def __init__(self, conference: str = 'sot'):
+    def __init__(self, conference: str = 'sot', include_raw_data: bool = False):
         """
         Initialize conference scraper.
         
         Args:
             conference: Conference key (e.g., 'sot', 'isscr')
+            include_raw_data: Attach the scraped session to each lead as
+                ``raw_data`` (the session is already saved by ``run``)
         """
         config = self.CONFERENCES.get(conference, self.CONFERENCES['sot'])
         
@@ -58,8 +211,15 @@ class ConferenceScraper(BaseScraper):
         )
         
         self.conference_name = config['name']
+        # Built once so every lead shares one source string
+        self._lead_source = f'conference_{self.conference_name}'
         self.sessions_path = config['sessions_path']
         self.target_keywords = config['keywords']
+        self._target_keywords_lower = tuple(k.lower() for k in self.target_keywords)
+        self.include_raw_data = include_raw_data
+        
+        # Parsed program page: (body digest, sessions)
+        self._program: Optional[Tuple[bytes, List[_ProgramEntry]]] = None
     
     def search(self, query: str, max_results: int = 100) -> List[Dict]:
         """
@@ -72,90 +232,118 @@ class ConferenceScraper(BaseScraper):
         Returns:
             List of session/abstract dictionaries
         """
-        self.logger.info(f"Searching conference {self.conference_name}: {query}")
+        self.logger.info("Searching conference %s: %s", self.conference_name, query)
         
         # Try to fetch the program page
-        response = self.fetch(self.sessions_path)
+        program = self._fetch_program()
         
-        if not response:
-            self.logger.warning(f"Could not fetch conference page")
+        if program is None:
+            self.logger.warning("Could not fetch conference page")
             return []
         
-        if 'raw_content' in response:
-            return self._parse_html_program(response['raw_content'], query)
-        
-        return []
+        return self._filter_sessions(program, query)
     
-    def _parse_html_program(self, html: str, query: str) -> List[Dict]:
-        """Parse HTML conference program page."""
-        soup = BeautifulSoup(html, 'lxml')
-        sessions = []
+    def _fetch_program(self) -> Optional[List[_ProgramEntry]]:
+        """
+        Fetch the program page and return its parsed sessions.
         
-        # Look for session/abstract containers (common patterns)
-        # This needs to be adapted for each conference site
-        session_elements = soup.find_all(['div', 'article'], class_=re.compile(
-            r'session|abstract|presentation|talk|poster', re.I
-        ))
+        The page body is kept on disk with its ETag/Last-Modified
+        validators, so an unchanged page costs a 304 instead of a full
+        download. Parsing is memoized on the body digest, so every query
+        against the same page reuses one parse.
         
-        for elem in session_elements:
-            session = self._extract_session(elem, query)
-            if session:
-                sessions.append(session)
+        Returns:
+            Parsed sessions, or None if the fetch failed
+        """
+        url = f"{self.base_url}/{self.sessions_path.lstrip('/')}"
+        body_path, meta_path = self._http_cache_paths(url)
+        
+        validators = {}
+        if body_path.exists():
+            try:
+                validators = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                validators = {}
+        
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        
+        self._rate_limit_wait()
         
-        return sessions
-    
-    def _extract_session(self, element, query: str) -> Optional[Dict]:
-        """Extract session information from HTML element."""
         try:
-            # Get title
-            title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'a'])
-            title = title_elem.get_text(strip=True) if title_elem else ''
-            
-            # Get description/abstract
-            desc_elem = element.find(['p', 'div'], class_=re.compile(r'desc|abstract|content', re.I))
-            description = desc_elem.get_text(strip=True) if desc_elem else ''
-            
-            # Check relevance
-            text = f"{title} {description}".lower()
-            if not any(kw.lower() in text for kw in self.target_keywords):
-                if query.lower() not in text:
-                    return None
-            
-            # Try to extract presenter info
-            author_elem = element.find(['span', 'div', 'p'], class_=re.compile(r'author|presenter|speaker', re.I))
-            presenter = author_elem.get_text(strip=True) if author_elem else ''
-            
-            # Try to extract affiliation
-            affil_elem = element.find(['span', 'div', 'p'], class_=re.compile(r'affil|org|instit', re.I))
-            affiliation = affil_elem.get_text(strip=True) if affil_elem else ''
-            
-            return {
-                'title': title,
-                'description': description,
-                'presenter': presenter,
-                'affiliation': affiliation,
-                'conference': self.conference_name,
-                'session_type': self._detect_session_type(element),
-            }
-            
-        except Exception as e:
-            self.logger.debug(f"Error extracting session: {e}")
+            self.logger.info("Fetching: %s", url)
+            with self._in_flight:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            self.logger.error("Request failed for %s: %s", url, e)
             return None
-    
-    def _detect_session_type(self, element) -> str:
-        """Detect whether this is a poster, talk, symposium, etc."""
-        text = element.get_text().lower()
-        
-        if 'poster' in text:
-            return 'poster'
-        elif 'symposium' in text:
-            return 'symposium'
-        elif 'workshop' in text:
-            return 'workshop'
-        elif 'keynote' in text:
-            return 'keynote'
+        
+        if response.status_code == 304:
+            try:
+                html = body_path.read_text(encoding='utf-8')
+            except OSError as e:
+                self.logger.error("Cached program page missing for %s: %s", url, e)
+                return None
         else:
-            return 'presentation'
+            html = response.text
+            self._store_http_cache(body_path, meta_path, html, response.headers)
+        
+        digest = hashlib.blake2b(html.encode('utf-8'), digest_size=16).digest()
+        if self._program is None or self._program[0] != digest:
+            self._program = (digest, self._parse_program(html))
+        return self._program[1]
+    
+    def _http_cache_paths(self, url: str) -> Tuple[Path, Path]:
+        """Paths of the cached body and its validators for a URL."""
+        cache_dir = self.storage_path / 'http_cache'
+        key = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+        return cache_dir / f"{key}.html", cache_dir / f"{key}.json"
+    
+    def _store_http_cache(self, body_path: Path, meta_path: Path, html: str, headers) -> None:
+        """Save a page body with its validators, if the server sent any."""
+        validators = {
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+        }
+        if not any(validators.values()):
+            return
+        
+        try:
+            body_path.parent.mkdir(parents=True, exist_ok=True)
+            body_path.write_text(html, encoding='utf-8')
+            meta_path.write_text(json.dumps(validators))
+        except OSError as e:
+            self.logger.debug("Could not cache program page: %s", e)
+    
+    def _parse_html_program(self, html: str, query: str) -> List[Dict]:
+        """Parse HTML conference program page."""
+        return self._filter_sessions(self._parse_program(html), query)
+    
+    def _parse_program(self, html: str) -> List[_ProgramEntry]:
+        """Parse every session on a program page, ahead of any query filter."""
+        sessions = _parse_program_html(html, self.conference_name, self._target_keywords_lower)
+        if sessions is None:
+            self.logger.warning("Could not parse conference page")
+            return []
+        return sessions
+    
+    def _filter_sessions(self, program: List[_ProgramEntry], query: str) -> List[Dict]:
+        """Keep sessions matching a target keyword or the query."""
+        query_lower = query.lower()
+        return [
+            dict(session) for session, text, targeted in program
+            if targeted or query_lower in text
+        ]
+    
+    def result_key(self, raw_data: Dict) -> Optional[tuple]:
+        """Identify a session by its title and presenter."""
+        if not raw_data:
+            return None
+        return (raw_data.get('title'), raw_data.get('presenter'))
     
     def parse_lead(self, raw_data: Dict) -> Optional[Dict]:
         """
@@ -164,8 +352,8 @@ class ConferenceScraper(BaseScraper):
         if not raw_data or not raw_data.get('presenter'):
             return None
         
-        return {
-            'source': f'conference_{self.conference_name}',
+        lead = {
+            'source': self._lead_source,
             'source_id': f"{self.conference_name}_{raw_data.get('title', '')[:50]}",
             'name': raw_data.get('presenter', ''),
             'email': None,
@@ -182,8 +370,10 @@ class ConferenceScraper(BaseScraper):
                 'abstract': raw_data.get('description', ''),
                 'session_type': raw_data.get('session_type', ''),
             },
-            'raw_data': raw_data,
         }
+        if self.include_raw_data:
+            lead['raw_data'] = raw_data
+        return lead
     
     def create_synthetic_leads_from_keywords(self) -> List[Dict]:
         """
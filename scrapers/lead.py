@@ -0,0 +1,105 @@
+# BioLeads Lead Records
+"""
+Compact, typed lead records.
+
+The pipeline passes leads around as dicts, because deduplication,
+enrichment and scoring add keys in place. Parsers can build one of
+these slotted records first and convert it with ``to_dict()`` at that
+boundary.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class Lead:
+    """Fields every scraper fills in for a lead."""
+    __slots__ = (
+        'source', 'source_id', 'name', 'email', 'title', 'institution',
+        'department', 'location', 'research_focus', 'publications', 'grants',
+        'raw_data',
+    )
+    
+    source: str
+    source_id: str
+    name: str
+    email: Optional[str]
+    title: Optional[str]
+    institution: Optional[str]
+    department: Optional[str]
+    location: Optional[str]
+    research_focus: List[str]
+    publications: int
+    grants: List[Dict]
+    raw_data: Optional[Dict]  # Omitted from to_dict() when None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the lead dict the pipeline consumes."""
+        lead = {
+            'source': self.source,
+            'source_id': self.source_id,
+            'name': self.name,
+            'email': self.email,
+            'title': self.title,
+            'institution': self.institution,
+            'department': self.department,
+            'location': self.location,
+            'research_focus': self.research_focus,
+            'publications': self.publications,
+            'grants': self.grants,
+        }
+        lead.update(self._extra_fields())
+        if self.raw_data is not None:
+            lead['raw_data'] = self.raw_data
+        return lead
+    
+    def _extra_fields(self) -> Dict[str, Any]:
+        """Source-specific keys, placed after the common ones."""
+        return {}
+
+
+@dataclass
+class TrialInfo:
+    """Clinical trial details attached to a trial lead."""
+    __slots__ = (
+        'nct_id', 'title', 'brief_summary', 'phase', 'status', 'sponsor',
+        'sponsor_class', 'conditions',
+    )
+    
+    nct_id: str
+    title: str
+    brief_summary: str
+    phase: List[str]
+    status: str
+    sponsor: str
+    sponsor_class: str  # INDUSTRY, NETWORK, etc.
+    conditions: List[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'nct_id': self.nct_id,
+            'title': self.title,
+            'brief_summary': self.brief_summary,
+            'phase': self.phase,
+            'status': self.status,
+            'sponsor': self.sponsor,
+            'sponsor_class': self.sponsor_class,
+            'conditions': self.conditions,
+        }
+
+
+@dataclass
+class TrialLead(Lead):
+    """Lead found through a clinical trial."""
+    __slots__ = ('clinical_trial', 'sponsor_class')
+    
+    clinical_trial: TrialInfo
+    sponsor_class: str  # Useful for filtering (INDUSTRY = pharma)
+    
+    def _extra_fields(self) -> Dict[str, Any]:
+        return {
+            'clinical_trial': self.clinical_trial.to_dict(),
+            'sponsor_class': self.sponsor_class,
+        }
@@ -5,10 +5,25 @@ Finds grants related to 3D in-vitro models, organoids, and drug discovery.
 Free API - no API key required.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Generator, List, Optional, Tuple
 from datetime import datetime
 
-from .base_scraper import BaseScraper
+import requests
+
+from .base_scraper import BaseScraper, iter_result_items
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Stop paging a term once no more than this share of a page is new grants
+MIN_NEW_RATIO = 0.2
+
+# Keyset position for a paged search: (start-date upper bound, rows to
+# skip under that bound). Without a bound, the skip is a plain offset.
+_Cursor = Tuple[Optional[str], int]
+_FIRST_PAGE: _Cursor = (None, 0)
 
 
 class NIHReporterScraper(BaseScraper):
@@ -21,15 +36,25 @@ class NIHReporterScraper(BaseScraper):
     API Documentation: https://api.reporter.nih.gov/
     """
     
-    def __init__(self):
-        """Initialize NIH RePORTER scraper."""
+    def __init__(self, include_raw_data: bool = True):
+        """
+        Initialize NIH RePORTER scraper.
+        
+        Args:
+            include_raw_data: Attach the grant record to each lead as
+                ``raw_data``. On by default because location enrichment
+                reads the ``organization`` block from it; turn it off for
+                large runs whose leads skip that step.
+        """
         from ..config.settings import settings
         
         super().__init__(
             name='nih_reporter',
             base_url=settings.api.nih_reporter_base_url,
             rate_limit_seconds=settings.api.nih_reporter_rate_limit,
+            cache_ttl=settings.api.response_cache_ttl,
         )
+        self.include_raw_data = include_raw_data
     
     def search(self, query: str, max_results: int = 100) -> List[Dict]:
         """
@@ -42,81 +67,207 @@ class NIHReporterScraper(BaseScraper):
         Returns:
             List of grant dictionaries
         """
-        from ..config.keywords import keywords
-        
-        self.logger.info(f"Searching NIH RePORTER: {query[:50]}...")
+        self.logger.info("Searching NIH RePORTER: %s...", query[:50])
         
         all_grants = []
-        offset = 0
+        cursor = _FIRST_PAGE
         limit = min(500, max_results)  # API max is 500 per request
+        fiscal_years = self._fiscal_years()
         
         while len(all_grants) < max_results:
-            # Build search criteria
-            criteria = {
-                'criteria': {
-                    'advanced_text_search': {
-                        'operator': 'and',
-                        'search_field': 'all',
-                        'search_text': query,
-                    },
-                    # Focus on recent active grants
-                    'fiscal_years': list(range(datetime.now().year - 3, datetime.now().year + 1)),
-                    # Prioritize certain activity codes
-                    'activity_codes': keywords.nih_priority_activity_codes,
-                    # Exclude expired projects
-                    'is_active': True,
-                },
-                'offset': offset,
-                'limit': limit,
-                'sort_field': 'project_start_date',
-                'sort_order': 'desc',
-            }
-            
-            response = self.fetch(
-                'projects/search',
-                method='POST',
-                json_data=criteria,
-            )
-            
-            if not response:
-                break
-            
-            results = response.get('results', [])
-            if not results:
+            page = self._search_page(query, cursor, limit, fiscal_years)
+            if page is None:
                 break
             
+            results, total = page
             all_grants.extend(results)
-            offset += limit
             
             # Check if we've gotten all results
-            total = response.get('meta', {}).get('total', 0)
-            if offset >= total:
+            if cursor[1] + limit >= total:
+                break
+            cursor = self._next_cursor(cursor, results)
+            if cursor is None:
                 break
         
-        self.logger.info(f"Found {len(all_grants)} grants")
+        self.logger.info("Found %s grants", len(all_grants))
         return all_grants[:max_results]
     
+    @staticmethod
+    def _fiscal_years() -> List[int]:
+        """The current fiscal year and the three before it."""
+        current_year = datetime.now().year
+        return list(range(current_year - 3, current_year + 1))
+    
+    def _search_page(
+        self,
+        query: str,
+        cursor: _Cursor,
+        limit: int,
+        fiscal_years: List[int],
+    ) -> Optional[Tuple[List[Dict], int]]:
+        """
+        Fetch one page of search results.
+        
+        Pages after the first are keyset-paginated on the sort key: they
+        ask for grants starting no later than the last one seen, so the
+        server never walks a deep offset.
+        
+        ``fiscal_years`` is fixed by the caller for the whole scan, so a
+        run that crosses New Year keeps paging the same result set.
+        
+        Returns:
+            (results, total matches under the cursor's bound), or None if
+            the request failed or the page was empty
+        """
+        from ..config.keywords import keywords
+        
+        # Build search criteria
+        criteria = {
+            'criteria': {
+                'advanced_text_search': {
+                    'operator': 'and',
+                    'search_field': 'all',
+                    'search_text': query,
+                },
+                # Focus on recent active grants
+                'fiscal_years': fiscal_years,
+                # Prioritize certain activity codes
+                'activity_codes': keywords.nih_priority_activity_codes,
+                # Exclude expired projects
+                'is_active': True,
+            },
+            'offset': cursor[1],
+            'limit': limit,
+            'sort_field': 'project_start_date',
+            'sort_order': 'desc',
+        }
+        
+        if cursor[0]:
+            criteria['criteria']['project_start_date'] = {'to_date': cursor[0]}
+        
+        meta = {}
+        results = list(self._iter_search(criteria, meta))
+        if not results:
+            return None
+        
+        return results, meta.get('total', 0)
+    
+    def _iter_search(self, criteria: Dict, meta: Dict) -> Generator[Dict, None, None]:
+        """
+        Yield the grants of one search request, filling ``meta`` from its meta block.
+        
+        With ijson installed, grants are decoded one at a time from the
+        response stream, so a 500-grant page is never held as raw bytes and
+        a decoded document at once. The response cache needs whole bodies,
+        so cached scrapers always take the plain fetch path.
+        """
+        if ijson is None or self.cache_ttl:
+            response = self.fetch(
+                'projects/search',
+                method='POST',
+                json_data=criteria,
+            )
+            if not response:
+                return
+            meta.update(response.get('meta') or {})
+            yield from response.get('results', [])
+            return
+        
+        response = self.fetch_stream('projects/search', method='POST', json_data=criteria)
+        if response is None:
+            return
+        
+        try:
+            yield from iter_result_items(ijson.parse(response.raw, use_float=True), meta)
+        except (ijson.JSONError, requests.exceptions.RequestException) as e:
+            self.logger.error("Could not read response from %s: %s", response.url, e)
+        finally:
+            response.close()
+    
+    @staticmethod
+    def _next_cursor(cursor: _Cursor, results: List[Dict]) -> Optional[_Cursor]:
+        """
+        Cursor for the page after ``results``, or None if paging cannot
+        continue safely.
+        
+        Results are sorted by start date, newest first, and the date bound
+        is inclusive, so grants sharing the last date are skipped by count.
+        If the first page ends on a grant without a start date, paging
+        stays on plain offsets from then on.
+        """
+        bound, skip = cursor
+        if bound is None and skip:
+            return None, skip + len(results)
+        
+        last_day = (results[-1].get('project_start_date') or '')[:10]
+        if not last_day:
+            # Undated grants fall outside any date bound
+            return (None, len(results)) if bound is None else None
+        
+        ties = sum(1 for g in results if (g.get('project_start_date') or '')[:10] == last_day)
+        if last_day == bound and ties == len(results):
+            # Whole page shares the bound's date: keep skipping past it
+            return bound, skip + ties
+        return last_day, ties
+    
     def search_by_terms(self, terms: List[str], max_results: int = 100) -> List[Dict]:
         """
         Search using multiple terms (OR logic).
         
+        Terms are paged in rounds: each round fetches the next page of
+        every still-productive term concurrently, then merges the pages
+        in term order, deduplicating by project number. A term stops once
+        it runs out of results or a page of it yields mostly grants already
+        found, and the search stops as soon as ``max_results`` unique
+        grants are in hand, so overlapping synonyms cost few requests.
+        
         Args:
             terms: List of search terms
-            max_results: Maximum results per term
+            max_results: Maximum unique grants in total
             
         Returns:
             Combined list of unique grants
         """
         all_grants = {}  # Use dict for deduplication by project number
+        if not terms:
+            return []
         
-        for term in terms:
-            grants = self.search(term, max_results=max_results // len(terms))
-            for grant in grants:
-                project_num = grant.get('project_num', '')
-                if project_num and project_num not in all_grants:
-                    all_grants[project_num] = grant
+        # First round matches the old even split; later rounds go to the
+        # terms still finding new grants
+        limit = max(1, min(500, max_results // len(terms)))
+        cursors = dict.fromkeys(terms, _FIRST_PAGE)
+        fiscal_years = self._fiscal_years()
         
-        return list(all_grants.values())
+        while cursors and len(all_grants) < max_results:
+            active = list(cursors)
+            pages = self._map_concurrent(
+                lambda term: self._search_page(term, cursors[term], limit, fiscal_years),
+                active,
+            )
+            
+            for term, page in zip(active, pages):
+                if page is None:
+                    del cursors[term]
+                    continue
+                
+                results, total = page
+                new = 0
+                for grant in results:
+                    project_num = grant.get('project_num', '')
+                    if project_num and project_num not in all_grants:
+                        all_grants[project_num] = grant
+                        new += 1
+                
+                cursor = None
+                if cursors[term][1] + limit < total and new > MIN_NEW_RATIO * len(results):
+                    cursor = self._next_cursor(cursors[term], results)
+                
+                if cursor is None:
+                    del cursors[term]
+                else:
+                    cursors[term] = cursor
+        
+        return list(all_grants.values())[:max_results]
     
     def get_project_details(self, project_number: str) -> Optional[Dict]:
         """
@@ -186,57 +337,62 @@ class NIHReporterScraper(BaseScraper):
         if not raw_data:
             return None
         
+        get = raw_data.get
+        
         # Get PI information
-        pi_list = raw_data.get('principal_investigators', [])
+        pi_list = get('principal_investigators')
         if not pi_list:
             return None
         
         pi = pi_list[0]  # Primary PI
         
         # Organization info
-        org = raw_data.get('organization', {})
+        org = get('organization', {})
         
-        # Extract award amount
-        award_amount = raw_data.get('award_amount', 0)
+        # Research terms (top 10)
+        terms = get('terms')
+        if terms:
+            research_focus = list(filter(None, map(str.strip, terms.split(';'))))[:10]
+        else:
+            research_focus = []
         
-        # Research terms
-        terms = raw_data.get('terms', '') or ''
-        research_focus = [t.strip() for t in terms.split(';') if t.strip()]
+        project_num = get('project_num', '')
         
-        return {
+        lead = {
             'source': 'nih_reporter',
-            'source_id': raw_data.get('project_num', ''),
+            'source_id': project_num,
             'name': pi.get('full_name', ''),
             'email': pi.get('email'),
             'title': pi.get('title', 'Principal Investigator'),
             'institution': org.get('org_name', ''),
-            'department': org.get('org_dept') or raw_data.get('dept_type'),
+            'department': org.get('org_dept') or get('dept_type'),
             'location': self._format_location(org),
-            'research_focus': research_focus[:10],  # Limit to top 10 terms
+            'research_focus': research_focus,
             'publications': 0,  # Will be enriched later
             'grants': [{
-                'project_number': raw_data.get('project_num', ''),
-                'title': raw_data.get('project_title', ''),
-                'abstract': raw_data.get('abstract_text', ''),
-                'award_amount': award_amount,
-                'start_date': raw_data.get('project_start_date'),
-                'end_date': raw_data.get('project_end_date'),
-                'activity_code': raw_data.get('activity_code'),
-                'funding_mechanism': raw_data.get('funding_mechanism'),
-                'nih_institute': raw_data.get('agency_ic_admin', {}).get('name', ''),
+                'project_number': project_num,
+                'title': get('project_title', ''),
+                'abstract': get('abstract_text', ''),
+                'award_amount': get('award_amount', 0),
+                'start_date': get('project_start_date'),
+                'end_date': get('project_end_date'),
+                'activity_code': get('activity_code'),
+                'funding_mechanism': get('funding_mechanism'),
+                'nih_institute': get('agency_ic_admin', {}).get('name', ''),
             }],
             'orcid': pi.get('orcid'),
-            'raw_data': raw_data,
         }
+        if self.include_raw_data:
+            lead['raw_data'] = raw_data
+        return lead
     
     def _format_location(self, org: Dict) -> str:
         """Format organization location."""
-        parts = filter(None, [
-            org.get('org_city'),
-            org.get('org_state'),
-            org.get('org_country'),
-        ])
-        return ', '.join(parts)
+        get = org.get
+        city, state, country = get('org_city'), get('org_state'), get('org_country')
+        if city and state and country:
+            return f'{city}, {state}, {country}'
+        return ', '.join(filter(None, (city, state, country)))
     
     def run_with_keywords(
         self,
@@ -5,11 +5,23 @@ Free, open-source alternative to paid academic databases.
 Provides author, institution, and publication data.
 """
 
-from typing import Dict, List, Optional
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Generator, List, Optional, Tuple
 from datetime import datetime
 import urllib.parse
 
-from .base_scraper import BaseScraper
+import requests
+
+from .base_scraper import BaseScraper, iter_result_items
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 
 class OpenAlexScraper(BaseScraper):
@@ -22,153 +34,310 @@ class OpenAlexScraper(BaseScraper):
     API Documentation: https://docs.openalex.org/
     """
     
-    def __init__(self, email: Optional[str] = None):
+    def __init__(self, email: Optional[str] = None, include_raw_data: bool = False):
         """
         Initialize OpenAlex scraper.
         
         Args:
             email: Email for polite pool (faster rate limits)
+            include_raw_data: Attach the work/author record to each lead as
+                ``raw_data``. Off by default: works carry authorships and
+                inverted-index abstracts, and ``run_with_keywords`` already
+                saves them once.
         """
+        from ..config.keywords import keywords
         from ..config.settings import settings
         
         super().__init__(
             name='openalex',
             base_url=settings.api.openalex_base_url,
             rate_limit_seconds=settings.api.openalex_rate_limit,
+            cache_ttl=settings.api.response_cache_ttl,
         )
         
         self.email = email or settings.api.openalex_email
-        
-        # Add email to session headers for polite pool
+        self.from_publication_date = settings.api.openalex_from_date
+        self.include_raw_data = include_raw_data
+        # Bare concept ids (works reference them as https://openalex.org/C...)
+        self._relevant_concepts = frozenset(keywords.openalex_concepts)
+        
+        # Identify with the email on every request for the polite pool. The
+        # session is shared with other scrapers, so its headers stay as-is.
+        self._headers = None
         if self.email:
-            self.session.headers['User-Agent'] = f'BioLeads/1.0 (mailto:{self.email})'
+            self._headers = {'User-Agent': f'BioLeads/1.0 (mailto:{self.email})'}
+    
+    def fetch(
+        self,
+        endpoint: str = '',
+        method: str = 'GET',
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        json_data: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        force_refresh: bool = False,
+    ) -> Optional[Dict]:
+        """Make a request with the polite-pool headers added."""
+        if self._headers:
+            headers = {**self._headers, **(headers or {})}
+        return super().fetch(endpoint, method, params, data, json_data, headers, force_refresh)
     
-    def search(self, query: str, max_results: int = 100) -> List[Dict]:
+    def search(
+        self,
+        query: str,
+        max_results: int = 100,
+        cursor_state_path: Optional[str] = None,
+    ) -> List[Dict]:
         """
         Search for works in OpenAlex.
         
         Args:
             query: Search query
             max_results: Maximum number of results
+            cursor_state_path: Optional file used to resume an interrupted scan
             
         Returns:
             List of work dictionaries
         """
-        self.logger.info(f"Searching OpenAlex works: {query[:50]}...")
+        works = list(self.search_stream(query, max_results, cursor_state_path))
+        self.logger.info("Found %s works", len(works))
+        return works
+    
+    def search_stream(
+        self,
+        query: str,
+        max_results: int = 100,
+        cursor_state_path: Optional[str] = None,
+    ) -> Generator[Dict, None, None]:
+        """
+        Search for works in OpenAlex, yielding each work as it is decoded.
         
-        all_works = []
-        cursor = '*'  # OpenAlex uses cursor pagination
-        per_page = min(200, max_results)  # Max 200 per request
+        With ijson installed (and the response cache off), every page is
+        decoded incrementally from the response stream, so a multi-megabyte
+        page of authorships and abstracts is never held as one document.
         
-        while len(all_works) < max_results:
-            params = {
-                'search': query,
-                'per_page': per_page,
-                'cursor': cursor,
-                'filter': f'from_publication_date:2020-01-01',  # Recent works
-                'select': 'id,doi,title,publication_date,authorships,concepts,cited_by_count,abstract_inverted_index',
-            }
-            
-            if self.email:
-                params['mailto'] = self.email
-            
-            response = self.fetch('works', params=params)
-            
-            if not response:
-                break
-            
-            results = response.get('results', [])
-            if not results:
-                break
-            
-            all_works.extend(results)
+        Args:
+            query: Search query
+            max_results: Maximum number of results
+            cursor_state_path: Optional file used to resume an interrupted scan
             
-            # Get next cursor
-            cursor = response.get('meta', {}).get('next_cursor')
-            if not cursor:
-                break
+        Yields:
+            Work dictionaries
+        """
+        self.logger.info("Searching OpenAlex works: %s...", query[:50])
         
-        self.logger.info(f"Found {len(all_works)} works")
-        return all_works[:max_results]
+        params = {
+            'search': query,
+            'filter': f'from_publication_date:{self.from_publication_date}',  # Recent works
+            'select': 'id,doi,title,publication_date,authorships,concepts,cited_by_count,abstract_inverted_index',
+        }
+        yield from self._paginate('works', params, max_results, cursor_state_path)
     
-    def search_authors(self, query: str, max_results: int = 100) -> List[Dict]:
+    def search_authors(
+        self,
+        query: str,
+        max_results: int = 100,
+        cursor_state_path: Optional[str] = None,
+    ) -> List[Dict]:
         """
         Search for authors/researchers.
         
         Args:
             query: Search query (name or topic)
             max_results: Maximum number of results
+            cursor_state_path: Optional file used to resume an interrupted scan
             
         Returns:
             List of author dictionaries
         """
-        self.logger.info(f"Searching OpenAlex authors: {query[:50]}...")
+        self.logger.info("Searching OpenAlex authors: %s...", query[:50])
+        
+        params = {
+            'search': query,
+            'filter': 'works_count:>5',  # Active researchers
+            'select': 'id,orcid,display_name,works_count,cited_by_count,affiliations,last_known_institutions,x_concepts',
+        }
+        all_authors = list(self._paginate('authors', params, max_results, cursor_state_path))
         
-        all_authors = []
-        cursor = '*'
-        per_page = min(200, max_results)
+        self.logger.info("Found %s authors", len(all_authors))
+        return all_authors
+    
+    def _paginate(
+        self,
+        endpoint: str,
+        base_params: Dict,
+        max_results: int,
+        cursor_state_path: Optional[str] = None,
+    ) -> Generator[Dict, None, None]:
+        """
+        Walk an OpenAlex list endpoint with cursor pagination.
         
-        while len(all_authors) < max_results:
-            params = {
-                'search': query,
-                'per_page': per_page,
-                'cursor': cursor,
-                'filter': 'works_count:>5',  # Active researchers
-                'select': 'id,orcid,display_name,works_count,cited_by_count,affiliations,last_known_institutions,x_concepts',
-            }
+        With ``cursor_state_path`` set, the next cursor is saved after every
+        completed page, and a later call with the same request picks up
+        from there instead of '*'. The file is removed once the scan ends;
+        a failed request leaves it in place so the next run can resume.
+        """
+        cursor = '*'  # OpenAlex uses cursor pagination
+        per_page = min(200, max_results)  # Max 200 per request
+        count = 0
+        
+        state_path = Path(cursor_state_path) if cursor_state_path else None
+        request_hash = None
+        if state_path:
+            request_hash = self._request_hash(endpoint, base_params)
+            saved = self._load_cursor_state(state_path, request_hash)
+            if saved:
+                cursor, count = saved
+                self.logger.info("Resuming %s scan after %s results", endpoint, count)
+        
+        while count < max_results:
+            params = {**base_params, 'per_page': per_page, 'cursor': cursor}
             
             if self.email:
                 params['mailto'] = self.email
             
-            response = self.fetch('authors', params=params)
-            
-            if not response:
-                break
+            meta = {}
+            page_count = 0
+            for item in self._iter_page(endpoint, params, meta):
+                yield item
+                page_count += 1
+                count += 1
+                if count >= max_results:
+                    break
             
-            results = response.get('results', [])
-            if not results:
+            if not page_count:
+                if 'next_cursor' not in meta:
+                    # Request failed; keep the saved cursor for the next run
+                    return
                 break
             
-            all_authors.extend(results)
-            
-            cursor = response.get('meta', {}).get('next_cursor')
+            # Get next cursor
+            cursor = meta.get('next_cursor')
             if not cursor:
                 break
+            
+            if state_path:
+                self._save_cursor_state(state_path, request_hash, base_params, cursor, count)
+        
+        if state_path:
+            state_path.unlink(missing_ok=True)
+    
+    def _iter_page(self, endpoint: str, params: Dict, meta: Dict) -> Generator[Dict, None, None]:
+        """
+        Yield the results of one list page, filling ``meta`` from its meta block.
+        
+        Streams with ijson when available; the response cache needs whole
+        bodies, so cached scrapers always take the plain fetch path.
+        """
+        if ijson is None or self.cache_ttl:
+            response = self.fetch(endpoint, params=params)
+            if not response:
+                return
+            meta.update(response.get('meta') or {})
+            yield from response.get('results', [])
+            return
+        
+        response = self.fetch_stream(endpoint, params=params, headers=self._headers)
+        if response is None:
+            return
+        
+        try:
+            yield from iter_result_items(ijson.parse(response.raw, use_float=True), meta)
+        except (ijson.JSONError, requests.exceptions.RequestException) as e:
+            self.logger.error("Could not read response from %s: %s", response.url, e)
+        finally:
+            response.close()
+    
+    @staticmethod
+    def _request_hash(endpoint: str, params: Dict) -> str:
+        """Stable hash of a list request, used to spot stale cursor state."""
+        payload = json.dumps({'endpoint': endpoint, 'params': params}, sort_keys=True)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _load_cursor_state(self, path: Path, request_hash: str) -> Optional[Tuple[str, int]]:
+        """Return the saved (cursor, count) if it belongs to this request."""
+        try:
+            state = json.loads(path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable cursor state %s: %s", path, e)
+            return None
         
-        self.logger.info(f"Found {len(all_authors)} authors")
-        return all_authors[:max_results]
+        if state.get('hash') != request_hash or not state.get('cursor'):
+            self.logger.info("Cursor state in %s is for another query, starting over", path)
+            return None
+        return state['cursor'], int(state.get('count', 0))
     
-    def search_by_concepts(self, concept_ids: List[str], max_results: int = 100) -> List[Dict]:
+    def _save_cursor_state(
+        self,
+        path: Path,
+        request_hash: str,
+        params: Dict,
+        cursor: str,
+        count: int,
+    ) -> None:
+        """Write the cursor state atomically."""
+        state = {
+            'hash': request_hash,
+            'query': params.get('search'),
+            'cursor': cursor,
+            'count': count,
+        }
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(state), encoding='utf-8')
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning("Could not save cursor state to %s: %s", path, e)
+    
+    def search_by_concepts(
+        self,
+        concept_ids: List[str],
+        max_results: int = 100,
+        batch_size: int = 20,
+    ) -> List[Dict]:
         """
         Search works by OpenAlex concept IDs.
         
+        Concepts are OR-ed together in batches of ``batch_size``
+        (``concepts.id:C1|C2|...``), so a batch costs one cursor scan
+        instead of one request per concept. Each batch gets a budget of
+        ``max_results`` per concept and returns the most cited works of
+        the whole batch; use ``batch_size=1`` for a strict top-N per
+        concept. Batches are queried concurrently (up to
+        ``max_concurrency``) and works are merged in batch order.
+        
         Args:
             concept_ids: List of OpenAlex concept IDs (e.g., 'C203014093' for Organoid)
             max_results: Maximum results per concept
+            batch_size: Concepts per request (OpenAlex allows up to 100 OR values)
             
         Returns:
             List of work dictionaries
         """
-        all_works = {}
+        batches = [
+            concept_ids[i:i + batch_size]
+            for i in range(0, len(concept_ids), batch_size)
+        ]
+        date_filter = f'from_publication_date:{self.from_publication_date}'
         
-        for concept_id in concept_ids:
+        def fetch_batch(batch: List[str]) -> List[Dict]:
             params = {
-                'filter': f'concepts.id:{concept_id},from_publication_date:2020-01-01',
-                'per_page': min(200, max_results),
+                'filter': f"concepts.id:{'|'.join(batch)},{date_filter}",
                 'select': 'id,doi,title,publication_date,authorships,concepts,cited_by_count',
                 'sort': 'cited_by_count:desc',
             }
-            
-            if self.email:
-                params['mailto'] = self.email
-            
-            response = self.fetch('works', params=params)
-            
-            if response:
-                for work in response.get('results', []):
-                    work_id = work.get('id', '')
-                    if work_id not in all_works:
-                        all_works[work_id] = work
+            return list(self._paginate('works', params, max_results * len(batch)))
+        
+        all_works = {}
+        
+        for works in self._map_concurrent(fetch_batch, batches):
+            for work in works:
+                work_id = work.get('id', '')
+                if work_id not in all_works:
+                    all_works[work_id] = work
         
         return list(all_works.values())
     
@@ -213,6 +382,12 @@ class OpenAlexScraper(BaseScraper):
         response = self.fetch(f'institutions/{institution_id}', params=params)
         return response
     
+    def result_key(self, raw_data: Dict) -> Optional[str]:
+        """Identify a work by its OpenAlex id (its abstract is rebuilt once per run)."""
+        if not raw_data:
+            return None
+        return raw_data.get('id')
+    
     def parse_lead(self, raw_data: Dict) -> Optional[Dict]:
         """
         Parse work data into lead format.
@@ -234,14 +409,21 @@ class OpenAlexScraper(BaseScraper):
         institutions = primary_auth.get('institutions', [])
         institution = institutions[0] if institutions else {}
         
-        # Get research concepts
+        # Get research concepts, target concepts first (stable, so each group
+        # keeps OpenAlex's score order)
         concepts = raw_data.get('concepts', [])
+        relevant = self._relevant_concepts
+        if relevant and concepts:
+            concepts = sorted(
+                concepts,
+                key=lambda c: (c.get('id') or '').rpartition('/')[2] not in relevant,
+            )
         research_focus = [c.get('display_name', '') for c in concepts[:10]]
         
         # Reconstruct abstract if inverted index available
         abstract = self._reconstruct_abstract(raw_data.get('abstract_inverted_index'))
         
-        return {
+        lead = {
             'source': 'openalex',
             'source_id': raw_data.get('id', ''),
             'name': author_info.get('display_name', ''),
@@ -259,8 +441,10 @@ class OpenAlexScraper(BaseScraper):
             'publication_title': raw_data.get('title', ''),
             'doi': raw_data.get('doi'),
             'publication_date': raw_data.get('publication_date'),
-            'raw_data': raw_data,
         }
+        if self.include_raw_data:
+            lead['raw_data'] = raw_data
+        return lead
     
     def parse_author_lead(self, raw_data: Dict) -> Optional[Dict]:
         """
@@ -277,7 +461,7 @@ class OpenAlexScraper(BaseScraper):
         concepts = raw_data.get('x_concepts', [])
         research_focus = [c.get('display_name', '') for c in concepts[:10]]
         
-        return {
+        lead = {
             'source': 'openalex',
             'source_id': raw_data.get('id', ''),
             'name': raw_data.get('display_name', ''),
@@ -292,18 +476,18 @@ class OpenAlexScraper(BaseScraper):
             'orcid': raw_data.get('orcid'),
             'openalex_author_id': raw_data.get('id'),
             'cited_by_count': raw_data.get('cited_by_count', 0),
-            'raw_data': raw_data,
         }
+        if self.include_raw_data:
+            lead['raw_data'] = raw_data
+        return lead
     
     def _get_location(self, institution: Dict) -> Optional[str]:
         """Extract location from institution data."""
         geo = institution.get('geo', {})
-        parts = filter(None, [
-            geo.get('city'),
-            geo.get('region'),
-            geo.get('country'),
-        ])
-        return ', '.join(parts) or institution.get('country_code')
+        city, region, country = geo.get('city'), geo.get('region'), geo.get('country')
+        if city and region and country:
+            return f'{city}, {region}, {country}'
+        return ', '.join(filter(None, (city, region, country))) or institution.get('country_code')
     
     def _reconstruct_abstract(self, inverted_index: Optional[Dict]) -> str:
         """Reconstruct abstract from OpenAlex inverted index format."""
@@ -311,18 +495,30 @@ class OpenAlexScraper(BaseScraper):
             return ''
         
         try:
-            # Build word position mapping
-            word_positions = []
+            # Positions normally cover 0..n-1 exactly once, so each word can
+            # be dropped straight into its slot without sorting
+            n = sum(map(len, inverted_index.values()))
+            words = [None] * n
             for word, positions in inverted_index.items():
                 for pos in positions:
-                    word_positions.append((pos, word))
-            
-            # Sort by position and join
-            word_positions.sort(key=lambda x: x[0])
-            return ' '.join(word for _, word in word_positions)
+                    if not 0 <= pos < n or words[pos] is not None:
+                        return self._reconstruct_abstract_sorted(inverted_index)
+                    words[pos] = word
+            return ' '.join(words)
         except Exception:
             return ''
     
+    def _reconstruct_abstract_sorted(self, inverted_index: Dict) -> str:
+        """Reconstruct an abstract whose positions have gaps or repeats."""
+        word_positions = []
+        for word, positions in inverted_index.items():
+            for pos in positions:
+                word_positions.append((pos, word))
+        
+        # Sort by position and join
+        word_positions.sort(key=lambda x: x[0])
+        return ' '.join(word for _, word in word_positions)
+    
     def run_with_keywords(
         self,
         max_results_per_query: int = 50,
@@ -340,31 +536,61 @@ class OpenAlexScraper(BaseScraper):
         """
         from ..config.keywords import keywords
         
-        all_leads = []
-        
-        # Search by concepts
-        self.logger.info("Searching by OpenAlex concepts...")
-        concept_works = self.search_by_concepts(
-            keywords.openalex_concepts,
-            max_results=max_results_per_query,
-        )
+        # One lead per OpenAlex author; leads without an author id are kept as-is
+        leads_by_author: Dict[str, Dict] = {}
+        anonymous_leads = []
+        
+        def add_lead(lead: Optional[Dict]) -> None:
+            if not lead:
+                return
+            author_id = lead.get('openalex_author_id')
+            if not author_id:
+                anonymous_leads.append(lead)
+                return
+            existing = leads_by_author.get(author_id)
+            if existing is None:
+                leads_by_author[author_id] = lead
+                return
+            # Same aggregation the deduplicator applies on merge
+            existing['publications'] = existing.get('publications', 0) + lead.get('publications', 0)
+            existing['cited_by_count'] = max(
+                existing.get('cited_by_count') or 0,
+                lead.get('cited_by_count') or 0,
+            )
+        
+        # The concept and author phases are independent, so run them side by
+        # side; the shared rate limiter still paces the actual requests.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.logger.info("Searching by OpenAlex concepts...")
+            concept_future = executor.submit(
+                self.search_by_concepts,
+                keywords.openalex_concepts,
+                max_results=max_results_per_query,
+            )
+            
+            # Also search for authors directly
+            self.logger.info("Searching for authors by topic...")
+            author_future = executor.submit(
+                self._map_concurrent,
+                lambda term: self.search_authors(term, max_results=20),
+                keywords.core_terms[:5],  # Top 5 core terms
+            )
+            
+            concept_works = concept_future.result()
+            author_results = author_future.result()
         
         if save_raw and concept_works:
             self.save_raw(concept_works, 'concept_works')
         
         for work in concept_works:
-            lead = self.parse_lead(work)
-            if lead:
-                all_leads.append(lead)
-        
-        # Also search for authors directly
-        self.logger.info("Searching for authors by topic...")
-        for term in keywords.core_terms[:5]:  # Top 5 core terms
-            authors = self.search_authors(term, max_results=20)
-            
+            add_lead(self.parse_lead(work))
+        
+        for authors in author_results:
             for author in authors:
-                lead = self.parse_author_lead(author)
-                if lead:
-                    all_leads.append(lead)
+                add_lead(self.parse_author_lead(author))
         
+        all_leads = list(leads_by_author.values()) + anonymous_leads
+        self.logger.info(
+            "Collapsed OpenAlex results to %s unique authors", len(leads_by_author)
+        )
         return all_leads
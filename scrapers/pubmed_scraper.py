@@ -5,12 +5,74 @@ Finds researchers publishing on 3D in-vitro models for drug discovery.
 Free API - register for API key for higher rate limits.
 """
 
-import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional
+import io
+import re
+from functools import lru_cache
+from typing import BinaryIO, Dict, Generator, List, Optional, Tuple
 from datetime import datetime
 
+import requests
+from lxml import etree
+
 from .base_scraper import BaseScraper
 
+# Above this many results, search() uses the history server (WebEnv)
+HISTORY_THRESHOLD = 200
+
+# Articles per efetch request (forms are POSTed, so long id lists are fine)
+EFETCH_BATCH_SIZE = 200
+
+# efetch output references the PubMed DTD; never fetch it or expand entities
+_XML_OPTIONS = {'resolve_entities': False, 'no_network': True, 'huge_tree': True}
+
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Affiliation keywords, matched as one alternation against each lowercased part
+_INSTITUTION_KEYWORDS = ('university', 'institute', 'college', 'hospital', 'center', 'centre', 'school')
+_DEPARTMENT_KEYWORDS = ('department', 'division', 'lab', 'laboratory', 'group', 'section')
+_INSTITUTION_RE = re.compile('|'.join(map(re.escape, _INSTITUTION_KEYWORDS)))
+_DEPARTMENT_RE = re.compile('|'.join(map(re.escape, _DEPARTMENT_KEYWORDS)))
+
+
+@lru_cache(maxsize=4096)
+def _classify_affiliation(affiliation: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Split an affiliation into (institution, department, location) in one pass.
+    
+    Common pattern: "Department, Institution, City, Country". Co-authors
+    usually share affiliations, so results are cached.
+    """
+    if not affiliation:
+        return '', None, None
+    
+    parts = [p.strip() for p in affiliation.split(',')]
+    
+    institution = department = None
+    for part in parts:
+        part_lower = part.lower()
+        if institution is None and _INSTITUTION_RE.search(part_lower):
+            institution = part
+        if department is None and _DEPARTMENT_RE.search(part_lower):
+            department = part
+        if institution is not None and department is not None:
+            break
+    
+    # Fallbacks: institution is usually the second part, department the first
+    if institution is None:
+        institution = parts[1] if len(parts) >= 2 else parts[0]
+    if department is None and len(parts) > 1:
+        department = parts[0]
+    
+    # Location is usually last 1-2 parts
+    location = ', '.join(parts[-2:]) if len(parts) >= 2 else None
+    
+    return institution, department, location
+
+
+def _first(elem, tag: str):
+    """First descendant with ``tag`` (like ``find('.//tag')``), via lxml's C iterator."""
+    return next(elem.iterdescendants(tag), None)
+
 
 class PubMedScraper(BaseScraper):
     """
@@ -39,6 +101,7 @@ class PubMedScraper(BaseScraper):
             name='pubmed',
             base_url=settings.api.pubmed_base_url,
             rate_limit_seconds=rate_limit,
+            cache_ttl=settings.api.response_cache_ttl,
         )
         
         self.api_key = api_key or settings.api.pubmed_api_key
@@ -50,6 +113,19 @@ class PubMedScraper(BaseScraper):
             params['api_key'] = self.api_key
         return params
     
+    def _esearch_params(self, query: str, max_results: int) -> Dict:
+        """Common esearch parameters (relevance order, last 5 years)."""
+        return self._add_api_key({
+            'db': self.db,
+            'term': query,
+            'retmax': max_results,
+            'retmode': 'json',
+            'sort': 'relevance',
+            'datetype': 'pdat',
+            'mindate': '2019',  # Last 5 years
+            'maxdate': datetime.now().strftime('%Y'),
+        })
+    
     def search_ids(self, query: str, max_results: int = 100) -> List[str]:
         """
         Search PubMed and return article IDs.
@@ -61,18 +137,7 @@ class PubMedScraper(BaseScraper):
         Returns:
             List of PubMed IDs (PMIDs)
         """
-        params = self._add_api_key({
-            'db': self.db,
-            'term': query,
-            'retmax': max_results,
-            'retmode': 'json',
-            'sort': 'relevance',
-            'datetype': 'pdat',
-            'mindate': '2019',  # Last 5 years
-            'maxdate': datetime.now().strftime('%Y'),
-        })
-        
-        response = self.fetch('esearch.fcgi', params=params)
+        response = self.fetch('esearch.fcgi', params=self._esearch_params(query, max_results))
         
         if not response:
             return []
@@ -80,10 +145,45 @@ class PubMedScraper(BaseScraper):
         result = response.get('esearchresult', {})
         return result.get('idlist', [])
     
+    def search_history(self, query: str) -> Optional[Tuple[str, str, int]]:
+        """
+        Run esearch on the NCBI history server.
+        
+        The matching ids stay on NCBI's side, so none are downloaded
+        here (``retmax=0``); efetch reads them back by reference.
+        
+        Args:
+            query: PubMed search query
+            
+        Returns:
+            (WebEnv, query_key, count), or None if the search failed
+        """
+        params = self._esearch_params(query, 0)
+        params['usehistory'] = 'y'
+        
+        # A WebEnv expires on NCBI's side, so never reuse a cached one
+        response = self.fetch('esearch.fcgi', params=params, force_refresh=True)
+        
+        if not response:
+            return None
+        
+        result = response.get('esearchresult', {})
+        webenv = result.get('webenv')
+        query_key = result.get('querykey')
+        if not webenv or not query_key:
+            return None
+        
+        return webenv, query_key, int(result.get('count', 0))
+    
     def fetch_articles(self, pmids: List[str]) -> List[Dict]:
         """
         Fetch article details for given PMIDs.
         
+        Batches of ``EFETCH_BATCH_SIZE`` are requested concurrently (up to
+        ``max_concurrency``); the shared token bucket keeps the combined
+        rate within NCBI's limit, and the session retries 429/5xx with
+        backoff. Articles are returned in batch order.
+        
         Args:
             pmids: List of PubMed IDs
             
@@ -93,95 +193,163 @@ class PubMedScraper(BaseScraper):
         if not pmids:
             return []
         
-        # Fetch in batches of 100
-        batch_size = 100
+        batch_size = EFETCH_BATCH_SIZE
+        batches = [pmids[i:i + batch_size] for i in range(0, len(pmids), batch_size)]
+        
+        forms = [{'id': ','.join(batch)} for batch in batches]
+        
         all_articles = []
+        for articles in self._map_concurrent(self._fetch_batch, forms):
+            all_articles.extend(articles)
         
-        for i in range(0, len(pmids), batch_size):
-            batch = pmids[i:i + batch_size]
-            
-            params = self._add_api_key({
-                'db': self.db,
-                'id': ','.join(batch),
-                'retmode': 'xml',
-                'rettype': 'abstract',
-            })
-            
-            response = self.fetch('efetch.fcgi', params=params)
+        return all_articles
+    
+    def fetch_articles_by_history(self, webenv: str, query_key: str, total: int) -> List[Dict]:
+        """
+        Fetch article details for a search stored on the history server.
+        
+        Pages of ``EFETCH_BATCH_SIZE`` are addressed by ``retstart``, so no
+        PMIDs are sent; they run concurrently like ``fetch_articles`` and
+        come back in search order.
+        
+        Args:
+            webenv: WebEnv returned by ``search_history``
+            query_key: query_key returned by ``search_history``
+            total: Number of articles to fetch
             
-            if response and 'raw_content' in response:
-                articles = self._parse_xml_response(response['raw_content'])
-                all_articles.extend(articles)
+        Returns:
+            List of article dictionaries
+        """
+        batch_size = EFETCH_BATCH_SIZE
+        forms = [
+            {
+                'WebEnv': webenv,
+                'query_key': query_key,
+                'retstart': start,
+                'retmax': min(batch_size, total - start),
+            }
+            for start in range(0, total, batch_size)
+        ]
+        
+        all_articles = []
+        for articles in self._map_concurrent(self._fetch_batch, forms):
+            all_articles.extend(articles)
         
         return all_articles
     
+    def _fetch_batch(self, form: Dict) -> List[Dict]:
+        """
+        Fetch and parse one efetch batch.
+        
+        ``form`` selects the articles (an ``id`` list, or a history
+        server reference). It is POSTed (E-utilities accept either) so
+        long id lists never run into URL length limits.
+        """
+        data = self._add_api_key({
+            'db': self.db,
+            **form,
+            'retmode': 'xml',
+            'rettype': 'abstract',
+        })
+        
+        if self.cache_ttl:
+            # The response cache stores whole bodies
+            response = self.fetch('efetch.fcgi', method='POST', data=data)
+            if response and 'raw_content' in response:
+                return self._parse_xml_response(response['raw_content'])
+            return []
+        
+        response = self.fetch_stream('efetch.fcgi', method='POST', data=data)
+        if response is None:
+            return []
+        
+        articles = []
+        try:
+            articles.extend(self._iter_articles(response.raw))
+        except requests.exceptions.RequestException as e:
+            self.logger.error("Could not read efetch response: %s", e)
+        finally:
+            response.close()
+        
+        return articles
+    
     def _parse_xml_response(self, xml_content: str) -> List[Dict]:
         """Parse PubMed XML response into article dictionaries."""
-        articles = []
+        return list(self._iter_articles(io.BytesIO(xml_content.encode('utf-8'))))
+    
+    def _iter_articles(self, source: BinaryIO) -> Generator[Dict, None, None]:
+        """
+        Incrementally parse efetch XML, yielding one article at a time.
         
+        Each PubmedArticle is dropped from the tree once parsed, so only
+        one article's elements are alive at a time.
+        """
         try:
-            root = ET.fromstring(xml_content)
-            
-            for article_elem in root.findall('.//PubmedArticle'):
+            for _, article_elem in etree.iterparse(
+                source, events=('end',), tag='PubmedArticle', **_XML_OPTIONS
+            ):
                 article = self._parse_article(article_elem)
                 if article:
-                    articles.append(article)
+                    yield article
+                
+                article_elem.clear()
+                while article_elem.getprevious() is not None:
+                    del article_elem.getparent()[0]
                     
-        except ET.ParseError as e:
-            self.logger.error(f"XML parse error: {e}")
-        
-        return articles
+        except etree.XMLSyntaxError as e:
+            self.logger.error("XML parse error: %s", e)
     
     def _parse_article(self, article_elem) -> Optional[Dict]:
         """Parse a single PubmedArticle element."""
         try:
-            medline = article_elem.find('.//MedlineCitation')
+            medline = _first(article_elem, 'MedlineCitation')
             if medline is None:
                 return None
             
-            pmid_elem = medline.find('.//PMID')
+            pmid_elem = _first(medline, 'PMID')
             pmid = pmid_elem.text if pmid_elem is not None else ''
             
-            article = medline.find('.//Article')
+            article = _first(medline, 'Article')
             if article is None:
                 return None
             
             # Title
-            title_elem = article.find('.//ArticleTitle')
+            title_elem = _first(article, 'ArticleTitle')
             title = title_elem.text if title_elem is not None else ''
             
             # Abstract
             abstract_parts = []
-            for abstract_text in article.findall('.//AbstractText'):
+            for abstract_text in article.iterdescendants('AbstractText'):
                 if abstract_text.text:
                     abstract_parts.append(abstract_text.text)
             abstract = ' '.join(abstract_parts)
             
             # Authors
             authors = []
-            for author in article.findall('.//Author'):
+            for author in article.iterdescendants('Author'):
                 author_info = self._parse_author(author)
                 if author_info:
                     authors.append(author_info)
             
             # Journal info
-            journal = article.find('.//Journal')
+            journal = _first(article, 'Journal')
             journal_title = ''
             pub_date = ''
             if journal is not None:
-                journal_title_elem = journal.find('.//Title')
+                journal_title_elem = _first(journal, 'Title')
                 journal_title = journal_title_elem.text if journal_title_elem is not None else ''
                 
-                pub_date_elem = journal.find('.//PubDate')
+                pub_date_elem = _first(journal, 'PubDate')
                 if pub_date_elem is not None:
-                    year = pub_date_elem.find('Year')
+                    year = next(pub_date_elem.iterchildren('Year'), None)
                     pub_date = year.text if year is not None else ''
             
             # Keywords/MeSH terms
             keywords = []
-            for mesh in medline.findall('.//MeshHeading/DescriptorName'):
-                if mesh.text:
-                    keywords.append(mesh.text)
+            for heading in medline.iterdescendants('MeshHeading'):
+                for mesh in heading.iterchildren('DescriptorName'):
+                    if mesh.text:
+                        keywords.append(mesh.text)
             
             return {
                 'pmid': pmid,
@@ -194,14 +362,30 @@ class PubMedScraper(BaseScraper):
             }
             
         except Exception as e:
-            self.logger.error(f"Error parsing article: {e}")
+            self.logger.error("Error parsing article: %s", e)
             return None
     
     def _parse_author(self, author_elem) -> Optional[Dict]:
         """Parse author information from XML element."""
         try:
-            last_name = author_elem.find('LastName')
-            first_name = author_elem.find('ForeName')
+            # One pass over the direct children; Affiliation always sits in
+            # an AffiliationInfo child, so the subtree is never searched
+            last_name = first_name = affiliation = None
+            orcid_elem = None
+            for child in author_elem:
+                tag = child.tag
+                if tag == 'LastName':
+                    if last_name is None:
+                        last_name = child
+                elif tag == 'ForeName':
+                    if first_name is None:
+                        first_name = child
+                elif tag == 'AffiliationInfo':
+                    if affiliation is None:
+                        affiliation = next(child.iterchildren('Affiliation'), None)
+                elif tag == 'Identifier':
+                    if child.get('Source') == 'ORCID':
+                        orcid_elem = child
             
             if last_name is None:
                 return None
@@ -213,7 +397,6 @@ class PubMedScraper(BaseScraper):
             }
             
             # Affiliation
-            affiliation = author_elem.find('.//Affiliation')
             if affiliation is not None and affiliation.text:
                 author_info['affiliation'] = affiliation.text
                 
@@ -222,10 +405,9 @@ class PubMedScraper(BaseScraper):
                 if email:
                     author_info['email'] = email
             
-            # ORCID if available
-            for identifier in author_elem.findall('Identifier'):
-                if identifier.get('Source') == 'ORCID':
-                    author_info['orcid'] = identifier.text
+            # ORCID if available (the last one listed wins)
+            if orcid_elem is not None:
+                author_info['orcid'] = orcid_elem.text
             
             return author_info
             
@@ -234,9 +416,7 @@ class PubMedScraper(BaseScraper):
     
     def _extract_email(self, text: str) -> Optional[str]:
         """Extract email address from text."""
-        import re
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(email_pattern, text)
+        match = _EMAIL_RE.search(text)
         return match.group(0) if match else None
     
     def search(self, query: str, max_results: int = 100) -> List[Dict]:
@@ -250,15 +430,28 @@ class PubMedScraper(BaseScraper):
         Returns:
             List of article dictionaries
         """
-        self.logger.info(f"Searching PubMed: {query[:100]}...")
-        
-        # Step 1: Get PMIDs
-        pmids = self.search_ids(query, max_results)
-        self.logger.info(f"Found {len(pmids)} articles")
-        
-        # Step 2: Fetch article details
-        articles = self.fetch_articles(pmids)
-        self.logger.info(f"Fetched details for {len(articles)} articles")
+        self.logger.info("Searching PubMed: %s...", query[:100])
+        
+        # Large result sets stay on the history server rather than
+        # round-tripping every PMID. With the response cache on, the id
+        # path is used instead: its requests can be replayed on re-runs.
+        history = None
+        if max_results > HISTORY_THRESHOLD and not self.cache_ttl:
+            history = self.search_history(query)
+        
+        if history:
+            webenv, query_key, count = history
+            total = min(count, max_results)
+            self.logger.info("Found %s articles", total)
+            articles = self.fetch_articles_by_history(webenv, query_key, total)
+        else:
+            # Step 1: Get PMIDs
+            pmids = self.search_ids(query, max_results)
+            self.logger.info("Found %s articles", len(pmids))
+            
+            # Step 2: Fetch article details
+            articles = self.fetch_articles(pmids)
+        self.logger.info("Fetched details for %s articles", len(articles))
         
         return articles
     
@@ -281,9 +474,9 @@ class PubMedScraper(BaseScraper):
                 email = author.get('email')
                 break
         
-        # Parse affiliation for institution
+        # Parse affiliation for institution, department and location
         affiliation = primary_author.get('affiliation', '')
-        institution = self._parse_institution(affiliation)
+        institution, department, location = _classify_affiliation(affiliation)
         
         return {
             'source': 'pubmed',
@@ -292,8 +485,8 @@ class PubMedScraper(BaseScraper):
             'email': email,
             'title': None,  # Not available from publications
             'institution': institution,
-            'department': self._parse_department(affiliation),
-            'location': self._parse_location(affiliation),
+            'department': department,
+            'location': location,
             'research_focus': raw_data.get('keywords', []),
             'publications': 1,  # This is one publication
             'grants': [],
@@ -306,52 +499,12 @@ class PubMedScraper(BaseScraper):
     
     def _parse_institution(self, affiliation: str) -> str:
         """Extract institution name from affiliation string."""
-        if not affiliation:
-            return ''
-        
-        # Common patterns: "Department, Institution, Location"
-        # Try to extract institution (usually after first comma, before location)
-        parts = [p.strip() for p in affiliation.split(',')]
-        
-        # Look for university/institute keywords
-        for part in parts:
-            part_lower = part.lower()
-            if any(kw in part_lower for kw in ['university', 'institute', 'college', 'hospital', 'center', 'centre', 'school']):
-                return part
-        
-        # Fallback to second part if available
-        if len(parts) >= 2:
-            return parts[1]
-        
-        return parts[0] if parts else ''
+        return _classify_affiliation(affiliation)[0]
     
     def _parse_department(self, affiliation: str) -> Optional[str]:
         """Extract department from affiliation string."""
-        if not affiliation:
-            return None
-        
-        parts = [p.strip() for p in affiliation.split(',')]
-        
-        for part in parts:
-            part_lower = part.lower()
-            if any(kw in part_lower for kw in ['department', 'division', 'lab', 'laboratory', 'group', 'section']):
-                return part
-        
-        # Often first part is department
-        if len(parts) > 1:
-            return parts[0]
-        
-        return None
+        return _classify_affiliation(affiliation)[1]
     
     def _parse_location(self, affiliation: str) -> Optional[str]:
         """Extract location from affiliation string."""
-        if not affiliation:
-            return None
-        
-        parts = [p.strip() for p in affiliation.split(',')]
-        
-        # Location is usually last 1-2 parts
-        if len(parts) >= 2:
-            return ', '.join(parts[-2:])
-        
-        return None
+        return _classify_affiliation(affiliation)[2]
@@ -7,11 +7,22 @@ This file loads the leads data and displays the dashboard.
 import json
 import sys
 from pathlib import Path
-from typing import List, Dict
 
 import streamlit as st
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pandas parses CSV on multiple threads with the pyarrow engine
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _CSV_ENGINE = 'c'
+
 # Page config
 st.set_page_config(
     page_title="BioLeads - Lead Generation Dashboard",
@@ -88,13 +99,45 @@ st.markdown("*B2B Lead Generation for 3D In-Vitro Models*")
 st.markdown("---")
 
 
-def load_leads() -> List[Dict]:
-    """Load leads from the data directory."""
-    # Try to load from session state first
-    if 'leads' in st.session_state and st.session_state.leads:
-        return st.session_state.leads
+def _parse_json(data: bytes):
+    """
+    Decode JSON, with orjson when available.
     
-    # Try to load from file
+    main.py writes leads with ``json.dump``, which emits ``NaN`` for
+    missing floats; orjson rejects that, so such files fall back to json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+@st.cache_data(show_spinner=False)
+def _read_leads_csv(path: str, mtime: float) -> pd.DataFrame:
+    """Parse a leads CSV; ``mtime`` is part of the cache key so edits are picked up."""
+    return pd.read_csv(path, engine=_CSV_ENGINE)
+
+
+@st.cache_data(show_spinner=False)
+def _read_leads_json(path: str, mtime: float) -> pd.DataFrame:
+    """Parse a leads JSON file; ``mtime`` is part of the cache key so edits are picked up."""
+    return pd.DataFrame(_parse_json(Path(path).read_bytes()))
+
+
+def load_leads() -> pd.DataFrame:
+    """
+    Load leads from the data directory, one row per lead.
+    
+    Leads stay in a DataFrame from load to display; the metrics and the
+    table are computed column-wise, so no per-lead dicts are built.
+    """
+    # Leads uploaded in this session take precedence
+    if 'leads_df' in st.session_state and not st.session_state.leads_df.empty:
+        return st.session_state.leads_df
+    
+    # Try to load from file (parsed once per file version, across reruns)
     try:
         # Get the directory where this script is located
         base_path = Path(__file__).parent / 'data' / 'output'
@@ -102,99 +145,92 @@ def load_leads() -> List[Dict]:
         # Try CSV first
         csv_path = base_path / 'leads.csv'
         if csv_path.exists():
-            df = pd.read_csv(csv_path)
-            leads = df.to_dict('records')
-            st.session_state.leads = leads
-            return leads
+            return _read_leads_csv(str(csv_path), csv_path.stat().st_mtime)
         
         # Try JSON
         json_path = base_path / 'leads.json'
         if json_path.exists():
-            with open(json_path, 'r') as f:
-                leads = json.load(f)
-                st.session_state.leads = leads
-                return leads
+            return _read_leads_json(str(json_path), json_path.stat().st_mtime)
     except Exception as e:
         st.error(f"Error loading leads: {e}")
     
-    return []
+    return pd.DataFrame()
 
 
-def safe_str(val):
-    """Safely convert value to string, handling NaN."""
-    if val is None:
-        return ''
-    if isinstance(val, float):
-        import math
-        if math.isnan(val):
-            return ''
-    return str(val) if val else ''
+def str_column(frame: pd.DataFrame, column: str) -> pd.Series:
+    """Column as display strings; missing, NaN and empty values become ''."""
+    if column not in frame:
+        return pd.Series('', index=frame.index, dtype=object)
+    values = frame[column]
+    empty = values.isna() | ~values.astype(bool)
+    return values.astype(str).mask(empty, '')
+
+
+def build_lead_table(frame: pd.DataFrame) -> pd.DataFrame:
+    """Build the ranked dashboard table from a frame of leads."""
+    score = frame['score'].fillna(0) if 'score' in frame else pd.Series(0, index=frame.index)
+    
+    # Handle location, and get country from its last part (plain list
+    # comprehensions beat the .str accessor for these per-string calls)
+    location = str_column(frame, 'location').replace('nan', '')
+    company_hq = pd.Series(
+        [loc.rpartition(',')[2].strip() for loc in location.tolist()],
+        index=frame.index,
+        dtype=object,
+    )
+    
+    table = pd.DataFrame({
+        'Probability Score': ['%.1f%%' % value for value in score.tolist()],
+        'Name': str_column(frame, 'name').replace('', 'N/A'),
+        'Title': str_column(frame, 'title').replace('', 'Researcher'),
+        'Company': str_column(frame, 'institution').replace('', 'N/A'),
+        'Person Location': location.replace('', 'N/A'),
+        'Company HQ': company_hq.replace('', 'N/A'),
+        'Work Mode': 'Research',
+        'Email': str_column(frame, 'email').replace('', '—'),
+    })
+    
+    # Sort leads by score (stable, so ties keep their input order)
+    table = table.loc[score.sort_values(ascending=False, kind='stable').index]
+    table.insert(0, 'Rank', range(1, len(table) + 1))
+    return table.reset_index(drop=True)
 
 
 # Load leads
-leads = load_leads()
+lead_frame = load_leads()
 
-if not leads:
+if lead_frame.empty:
     st.warning("No leads data found. Please run the pipeline first or upload a CSV file.")
     
     # File uploader
     uploaded_file = st.file_uploader("Upload leads CSV", type=['csv'])
     if uploaded_file:
-        df = pd.read_csv(uploaded_file)
-        leads = df.to_dict('records')
-        st.session_state.leads = leads
+        st.session_state.leads_df = pd.read_csv(uploaded_file, engine=_CSV_ENGINE)
         st.rerun()
 else:
+    tier = str_column(lead_frame, 'tier')
+    
     # Display metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Leads", len(leads))
+        st.metric("Total Leads", len(lead_frame))
     with col2:
-        hot = sum(1 for l in leads if safe_str(l.get('tier')) == 'hot')
+        hot = int((tier == 'hot').sum())
         st.metric("🔥 Hot Leads", hot)
     with col3:
-        warm = sum(1 for l in leads if safe_str(l.get('tier')) == 'warm')
+        warm = int((tier == 'warm').sum())
         st.metric("🌡️ Warm Leads", warm)
     with col4:
-        with_email = sum(1 for l in leads if l.get('email') and safe_str(l.get('email')) not in ['', 'nan'])
+        with_email = int((~str_column(lead_frame, 'email').isin(['', 'nan'])).sum())
         st.metric("📧 With Email", with_email)
     
     st.markdown("---")
     
-    # Sort leads by score
-    sorted_leads = sorted(leads, key=lambda x: x.get('score', 0), reverse=True)
-    
-    # Prepare table data
-    table_data = []
-    for rank, lead in enumerate(sorted_leads, 1):
-        # Handle location
-        location = safe_str(lead.get('location', ''))
-        if location == 'nan':
-            location = ''
-        
-        # Get country from location
-        company_hq = ''
-        if location:
-            parts = location.split(',')
-            company_hq = parts[-1].strip() if parts else ''
-        
-        table_data.append({
-            'Rank': rank,
-            'Probability Score': f"{lead.get('score', 0):.1f}%",
-            'Name': safe_str(lead.get('name', 'N/A')),
-            'Title': safe_str(lead.get('title', '')) or 'Researcher',
-            'Company': safe_str(lead.get('institution', 'N/A')),
-            'Person Location': location or 'N/A',
-            'Company HQ': company_hq or 'N/A',
-            'Work Mode': 'Research',
-            'Email': safe_str(lead.get('email', '')) or '—',
-        })
-    
     # Display the table
-    st.subheader(f"📋 Lead Dashboard - {len(leads)} Leads")
+    st.subheader(f"📋 Lead Dashboard - {len(lead_frame)} Leads")
     
-    df = pd.DataFrame(table_data)
+    df = build_lead_table(lead_frame)
     
     st.dataframe(
         df,
@@ -207,10 +243,10 @@ else:
     st.markdown("---")
     col1, col2, col3 = st.columns(3)
     with col1:
-        avg_score = sum(lead.get('score', 0) for lead in leads) / len(leads)
+        avg_score = lead_frame['score'].fillna(0).mean() if 'score' in lead_frame else 0
         st.metric("Average Score", f"{avg_score:.1f}%")
     with col2:
-        st.metric("Leads with Email", f"{with_email}/{len(leads)}")
+        st.metric("Leads with Email", f"{with_email}/{len(lead_frame)}")
     with col3:
         st.metric("Data Sources", "PubMed, NIH, OpenAlex, ClinicalTrials")
     
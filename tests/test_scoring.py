@@ -31,6 +31,19 @@ class TestScoringWeights:
         assert weights.get_role_score('Research Assistant') < 5
         assert weights.get_role_score('Unknown Role') == 0
     
+    def test_match_caches_pickle(self):
+        """Test that weights with warm match caches survive a round trip to a worker."""
+        import pickle
+        from bioleads.scoring import ScoringWeights
+        
+        weights = ScoringWeights()
+        score = weights.get_role_score('Director of Research')
+        
+        restored = pickle.loads(pickle.dumps(weights))
+        
+        assert restored.get_role_score('Director of Research') == score
+        assert restored._role_score.cache_info().currsize == 1
+    
     def test_get_topic_relevance_score(self):
         """Test topic relevance scoring."""
         from bioleads.scoring import ScoringWeights
@@ -120,6 +133,28 @@ class TestPropensityEngine:
         assert score.tier == 'hot'
         assert score.total_score >= 75
     
+    def test_score_cache(self):
+        """Test that cached breakdowns are immutable, bounded and dropped on a weights change."""
+        import dataclasses
+        from bioleads.scoring import PropensityEngine, ScoringWeights
+        from bioleads.scoring import propensity_engine
+        
+        engine = PropensityEngine()
+        lead = {'name': 'Lead 1', 'publications': 20, 'research_focus': ['organoid']}
+        
+        score = engine.score_lead(lead)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            score.total_score = 0
+        
+        engine.weights = ScoringWeights(publication_weight=0.0)
+        assert engine.score_lead(lead).publication_score == 0
+        
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(propensity_engine, 'SCORE_CACHE_SIZE', 2)
+            for n in range(5):
+                engine.score_lead({'publications': n})
+            assert len(engine._score_cache) == 2
+    
     def test_determine_tier(self):
         """Test tier determination."""
         from bioleads.scoring import PropensityEngine
@@ -154,6 +189,90 @@ class TestPropensityEngine:
             assert 'score' in lead
             assert 'tier' in lead
     
+    def test_score_batch_lazy_breakdown(self):
+        """Test batch scoring without stored breakdowns."""
+        from bioleads.scoring import PropensityEngine
+        
+        engine = PropensityEngine()
+        
+        leads = [
+            {'name': 'Lead 1', 'publications': 10, 'research_focus': ['organoid']},
+            {'name': 'Lead 2', 'publications': 1, 'title': 'Director'},
+        ]
+        
+        scored = engine.score_batch(leads, include_breakdown=False)
+        
+        assert all('score_breakdown' not in lead for lead in scored)
+        
+        breakdown = engine.get_breakdown(scored[0])
+        assert breakdown['total_score'] == round(scored[0]['score'], 1)
+        assert breakdown['tier'] == scored[0]['tier']
+
+    def test_score_batch_columnar(self):
+        """Test that large batches without breakdowns match per-lead scores."""
+        from bioleads.scoring import PropensityEngine
+        from bioleads.scoring.propensity_engine import VECTORIZED_MIN_LEADS
+
+        engine = PropensityEngine()
+
+        leads = [
+            {
+                'name': f'Lead {i}',
+                'publications': i % 30,
+                'grants': [{'award_amount': 250000 * (i % 5)}] if i % 3 else [],
+                'research_focus': ['organoid'] if i % 2 else [],
+                'title': 'Director' if i % 7 == 0 else '',
+            }
+            for i in range(VECTORIZED_MIN_LEADS)
+        ]
+
+        scored = engine.score_batch([dict(l) for l in leads], include_breakdown=False)
+
+        expected = sorted((engine.score_lead(l) for l in leads), key=lambda b: b.total_score, reverse=True)
+        assert [l['score'] for l in scored] == pytest.approx([b.total_score for b in expected])
+        assert [l['tier'] for l in scored] == [b.tier for b in expected]
+
+    def test_top_k(self):
+        """Test top-k scoring matches the head of a full batch sort."""
+        from bioleads.scoring import PropensityEngine
+        
+        engine = PropensityEngine()
+        
+        leads = [
+            {'name': 'Lead 1', 'publications': 10, 'research_focus': ['organoid']},
+            {'name': 'Lead 2', 'publications': 5, 'research_focus': ['other']},
+            {'name': 'Lead 3', 'publications': 20, 'title': 'Director'},
+            {'name': 'Lead 4', 'publications': 1},
+        ]
+        
+        expected = [l['name'] for l in engine.score_batch([dict(l) for l in leads])[:2]]
+        top = engine.top_k([dict(l) for l in leads], 2)
+        
+        assert [l['name'] for l in top] == expected
+        assert all('score_breakdown' in l for l in top)
+    
+    def test_score_array(self):
+        """Test structured-array scoring matches per-lead scoring."""
+        from bioleads.scoring import PropensityEngine
+        from bioleads.scoring.propensity_engine import SCORE_TIERS
+        
+        engine = PropensityEngine()
+        
+        leads = [
+            {'name': 'Lead 1', 'publications': 10, 'research_focus': ['organoid']},
+            {'name': 'Lead 2', 'title': 'Director', 'grants': [{'award_amount': 600000}]},
+            {'name': 'Lead 3'},
+        ]
+        
+        scores = engine.score_array(leads)
+        
+        assert len(scores) == 3
+        for lead, row in zip(leads, scores):
+            expected = engine.score_lead(lead)
+            assert row['total'] == pytest.approx(expected.total_score)
+            assert row['grant'] == pytest.approx(expected.grant_score)
+            assert SCORE_TIERS[row['tier']] == expected.tier
+    
     def test_get_tier_summary(self):
         """Test tier summary statistics."""
         from bioleads.scoring import PropensityEngine
@@ -220,6 +339,41 @@ class TestDeduplicator:
         assert dedup._normalize_name('Dr. John Doe') == 'john doe'
         assert dedup._normalize_name('Prof. Jane Smith PhD') == 'jane smith'
         assert dedup._normalize_name('John   Doe') == 'john doe'
+        assert dedup._normalize_name("Mary O'Neil, MD") == "mary o'neil"
+    
+    def test_large_bucket_matrix(self):
+        """Test that cdist-scored buckets merge exactly like the pair loop."""
+        pytest.importorskip('rapidfuzz')
+        from bioleads.pipeline import deduplication
+        
+        size = deduplication.MATRIX_MIN_BUCKET + 2
+        indices = list(range(size))
+        names = ['john doe'] * size
+        insts = ['harvard university', 'harvard univ', '', 'stanford university'] * size
+        
+        pairs = deduplication._resolve_bucket(indices, names, insts, 85, 80)
+        
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(deduplication, 'MATRIX_MIN_BUCKET', size + 1)
+            assert deduplication._resolve_bucket(indices, names, insts, 85, 80) == pairs
+        assert (1, 0) in pairs and (3, 0) not in pairs
+    
+    def test_pool_gate(self):
+        """Test that the process pool is used only for enough pairwise work on several CPUs."""
+        from bioleads.pipeline import Deduplicator, deduplication
+        
+        many_small = [[2 * i, 2 * i + 1] for i in range(10000)]
+        few_large = [list(range(n, n + 1000)) for n in range(0, 1000, 500)]
+        
+        assert not Deduplicator()._use_pool(few_large)
+        
+        dedup = Deduplicator(parallel=True)
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(deduplication.os, 'cpu_count', lambda: 4)
+            assert not dedup._use_pool(many_small)
+            assert dedup._use_pool(few_large)
+            mp.setattr(deduplication.os, 'cpu_count', lambda: 1)
+            assert not dedup._use_pool(few_large)
     
     def test_merge_leads(self):
         """Test lead merging."""
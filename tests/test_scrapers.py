@@ -29,6 +29,199 @@ class TestBaseScraper:
         
         assert scraper.name == 'test'
         assert scraper.rate_limit_seconds == 0.1
+    
+    def test_token_bucket_burst(self):
+        """Test that the token bucket allows a burst, then makes callers wait."""
+        from bioleads.scrapers.base_scraper import TokenBucket
+        
+        bucket = TokenBucket(capacity=2, rate=10, jitter=0)
+        
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+    
+    def test_fetch_all_pages(self):
+        """Test that concurrent pagination yields every page in order."""
+        from bioleads.scrapers.base_scraper import BaseScraper
+        
+        class TestScraper(BaseScraper):
+            def search(self, query, max_results=100):
+                return []
+            
+            def parse_lead(self, raw_data):
+                return raw_data
+        
+        scraper = TestScraper(
+            name='test',
+            base_url='https://example.com',
+            rate_limit_seconds=0,
+        )
+        
+        def fake_fetch(endpoint, params=None):
+            offset = params['offset']
+            items = list(range(offset, min(offset + params['limit'], 25)))
+            return {'total': 25, 'results': items}
+        
+        with patch.object(scraper, 'fetch', side_effect=fake_fetch):
+            assert list(scraper.fetch_all('items', {}, page_size=10)) == list(range(25))
+            assert list(scraper.fetch_all('items', {}, page_size=10, max_results=15)) == list(range(15))
+
+    
+    def test_fetch_all_bounded_window(self):
+        """Test that pages are requested at most max_concurrency ahead of the caller."""
+        from bioleads.scrapers.base_scraper import BaseScraper
+        
+        class TestScraper(BaseScraper):
+            def search(self, query, max_results=100):
+                return []
+            
+            def parse_lead(self, raw_data):
+                return raw_data
+        
+        scraper = TestScraper(
+            name='test',
+            base_url='https://example.com',
+            rate_limit_seconds=0,
+            max_concurrency=2,
+        )
+        requested = []
+        
+        def fake_fetch(endpoint, params=None):
+            requested.append(params['offset'])
+            return {'total': 100, 'results': [params['offset']]}
+        
+        with patch.object(scraper, 'fetch', side_effect=fake_fetch):
+            pages = scraper.fetch_all('items', {}, page_size=1)
+            for consumed, offset in enumerate(pages, 1):
+                assert offset == consumed - 1
+                # The first page, plus at most two requested ahead
+                assert len(requested) <= consumed + 2
+                if consumed == 10:
+                    break
+            pages.close()
+        
+        assert len(requested) <= 12
+    
+    def test_imap_concurrent_close_before_consuming(self):
+        """Test that a map closed before its first result never calls func."""
+        from bioleads.scrapers.base_scraper import BaseScraper
+        
+        class TestScraper(BaseScraper):
+            def search(self, query, max_results=100):
+                return []
+            
+            def parse_lead(self, raw_data):
+                return raw_data
+        
+        scraper = TestScraper(
+            name='test',
+            base_url='https://example.com',
+            rate_limit_seconds=0,
+        )
+        calls = []
+        
+        results = scraper._imap_concurrent(calls.append, range(100))
+        results.close()
+        
+        assert list(results) == []
+        assert calls == []
+        
+        # Stopping fetch_all on the first page requests no further pages
+        with patch.object(scraper, 'fetch', side_effect=lambda endpoint, params=None: (
+            calls.append(params['offset']) or {'total': 500, 'results': [params['offset']]}
+        )):
+            pages = scraper.fetch_all('items', {}, page_size=1)
+            assert next(pages) == 0
+            pages.close()
+        
+        assert calls == [0]
+    
+    def test_fetch_response_cache(self, tmp_path):
+        """Test that repeated requests are answered from the response cache."""
+        from bioleads.scrapers.base_scraper import BaseScraper
+        
+        class TestScraper(BaseScraper):
+            def search(self, query, max_results=100):
+                return []
+            
+            def parse_lead(self, raw_data):
+                return raw_data
+        
+        scraper = TestScraper(
+            name='test',
+            base_url='https://example.com',
+            rate_limit_seconds=0,
+            storage_path=tmp_path,
+            cache_ttl=60,
+        )
+        scraper.session = Mock()
+        scraper.session.request.return_value = Mock(content=b'{"total": 1}', headers={})
+        
+        body = {'criteria': {'terms': ['organoid']}}
+        assert scraper.fetch('search', method='POST', json_data=body) == {'total': 1}
+        assert scraper.fetch('search', method='POST', json_data=body) == {'total': 1}
+        assert scraper.session.request.call_count == 1
+        
+        scraper.fetch('search', method='POST', json_data={'criteria': {}})
+        scraper.fetch('search', method='POST', json_data=body, force_refresh=True)
+        assert scraper.session.request.call_count == 3
+    
+    def test_run_queries_in_order(self):
+        """Test that concurrent queries return leads in query order."""
+        from bioleads.scrapers.base_scraper import BaseScraper
+        
+        class TestScraper(BaseScraper):
+            def search(self, query, max_results=100):
+                return [{'query': query, 'n': n} for n in range(2)]
+            
+            def parse_lead(self, raw_data):
+                return raw_data
+        
+        scraper = TestScraper(
+            name='test',
+            base_url='https://example.com',
+            rate_limit_seconds=0,
+        )
+        
+        leads = scraper.run(['a', 'b', 'c'], save_raw=False)
+        
+        assert [l['query'] for l in leads] == ['a', 'a', 'b', 'b', 'c', 'c']
+        
+        # Results seen in an earlier query are dropped
+        leads = scraper.run(['a', 'b'], save_raw=False, dedupe_key=lambda r: r['n'])
+        
+        assert [(l['query'], l['n']) for l in leads] == [('a', 0), ('a', 1)]
+    
+    def test_run_streams_queries(self):
+        """Test that run searches only a bounded window ahead of its caller."""
+        from bioleads.scrapers.base_scraper import BaseScraper
+        
+        searched = []
+        
+        class TestScraper(BaseScraper):
+            def search(self, query, max_results=100):
+                searched.append(query)
+                return [{'query': query}]
+            
+            def parse_lead(self, raw_data):
+                return raw_data
+        
+        scraper = TestScraper(
+            name='test',
+            base_url='https://example.com',
+            rate_limit_seconds=0,
+            max_concurrency=2,
+        )
+        queries = [f'q{n}' for n in range(20)]
+        
+        leads = scraper.run(queries, save_raw=False)
+        assert next(leads)['query'] == 'q0'
+        assert len(searched) <= 3
+        leads.close()
+        
+        batches = scraper.search_many(queries)
+        assert next(batches) == [{'query': 'q0'}]
+        batches.close()
 
 
 class TestPubMedScraper:
@@ -52,6 +245,85 @@ class TestPubMedScraper:
         assert ids == ['12345', '67890']
         assert mock_fetch.called
     
+    def test_fetch_articles_streams_xml(self):
+        """Test that efetch XML is parsed article by article from the stream."""
+        import io
+        from bioleads.scrapers import PubMedScraper
+        
+        xml = (
+            b'<?xml version="1.0" ?>\n'
+            b'<!DOCTYPE PubmedArticleSet PUBLIC "-//NLM//DTD PubMedArticle//EN" '
+            b'"https://dtd.nlm.nih.gov/ncbi/pubmed/out/pubmed_240101.dtd">\n'
+            b'<PubmedArticleSet>'
+            b'<PubmedArticle><MedlineCitation><PMID>1</PMID><Article>'
+            b'<ArticleTitle>Organoids</ArticleTitle><AuthorList><Author>'
+            b'<LastName>Smith</LastName><ForeName>Jane</ForeName>'
+            b'<AffiliationInfo><Affiliation>Harvard, jsmith@harvard.edu</Affiliation></AffiliationInfo>'
+            b'</Author></AuthorList></Article></MedlineCitation></PubmedArticle>'
+            b'<PubmedArticle><MedlineCitation><PMID>2</PMID><Article>'
+            b'<ArticleTitle>Spheroids</ArticleTitle></Article></MedlineCitation></PubmedArticle>'
+            b'</PubmedArticleSet>'
+        )
+        
+        scraper = PubMedScraper()
+        response = Mock(raw=io.BytesIO(xml))
+        scraper.fetch_stream = Mock(return_value=response)
+        
+        articles = scraper.fetch_articles(['1', '2'])
+        
+        assert [a['pmid'] for a in articles] == ['1', '2']
+        assert articles[0]['authors'][0]['name'] == 'Jane Smith'
+        assert articles[0]['authors'][0]['email'] == 'jsmith@harvard.edu'
+        assert response.close.called
+        request = scraper.fetch_stream.call_args.kwargs
+        assert request['method'] == 'POST'
+        assert request['data']['id'] == '1,2'
+
+    def test_search_ids_response_cache(self, tmp_path):
+        """Test that repeated esearch calls are answered from the response cache."""
+        from bioleads.scrapers import PubMedScraper
+
+        scraper = PubMedScraper()
+        scraper.cache_ttl = 60
+        scraper.cache_path = tmp_path
+        scraper.session = Mock()
+        scraper.session.request.return_value = Mock(
+            content=b'{"esearchresult": {"idlist": ["12345"], "count": "1"}}', headers={},
+        )
+
+        assert scraper.search_ids('organoid') == ['12345']
+        assert scraper.search_ids('organoid') == ['12345']
+        assert scraper.session.request.call_count == 1
+
+    def test_search_uses_history_server(self):
+        """Test that large searches page efetch through WebEnv instead of PMIDs."""
+        import io
+        from bioleads.scrapers import PubMedScraper
+        
+        scraper = PubMedScraper()
+        scraper.fetch = Mock(return_value={
+            'esearchresult': {'count': '250', 'webenv': 'MCID_1', 'querykey': '1', 'idlist': []}
+        })
+        
+        def fake_stream(endpoint, method='GET', data=None, **kwargs):
+            pmid = str(data['retstart'])
+            xml = ('<PubmedArticleSet><PubmedArticle><MedlineCitation><PMID>%s</PMID><Article/>'
+                   '</MedlineCitation></PubmedArticle></PubmedArticleSet>' % pmid)
+            return Mock(raw=io.BytesIO(xml.encode()))
+        
+        scraper.fetch_stream = Mock(side_effect=fake_stream)
+        
+        articles = scraper.search('organoids', max_results=300)
+        
+        esearch = scraper.fetch.call_args.kwargs['params']
+        assert esearch['usehistory'] == 'y'
+        assert esearch['retmax'] == 0
+        assert [a['pmid'] for a in articles] == ['0', '200']
+        
+        forms = [c.kwargs['data'] for c in scraper.fetch_stream.call_args_list]
+        assert all('id' not in f and f['WebEnv'] == 'MCID_1' for f in forms)
+        assert sorted(f['retmax'] for f in forms) == [50, 200]
+    
     def test_parse_lead(self):
         """Test parsing PubMed article to lead format."""
         from bioleads.scrapers import PubMedScraper
@@ -94,6 +366,7 @@ class TestPubMedScraper:
 class TestNIHReporterScraper:
     """Tests for NIH RePORTER scraper."""
     
+    @patch('bioleads.scrapers.nih_reporter_scraper.ijson', None)
     @patch('bioleads.scrapers.nih_reporter_scraper.NIHReporterScraper.fetch')
     def test_search(self, mock_fetch):
         """Test NIH grant search."""
@@ -120,6 +393,55 @@ class TestNIHReporterScraper:
         assert len(grants) == 1
         assert grants[0]['project_num'] == 'R01CA123456'
     
+    def test_search_streams_results(self):
+        """Test that search pages are decoded grant by grant from the stream."""
+        import io
+        pytest.importorskip('ijson')
+        from bioleads.scrapers import NIHReporterScraper
+        
+        body = json.dumps({
+            'meta': {'total': 2, 'properties': {'URL': 'x'}},
+            'results': [
+                {'project_num': 'R01CA1', 'award_amount': 500000, 'principal_investigators': []},
+                {'project_num': 'R01CA2', 'award_amount': 250000.5},
+            ],
+        }).encode('utf-8')
+        
+        scraper = NIHReporterScraper()
+        response = Mock(raw=io.BytesIO(body))
+        scraper.fetch_stream = Mock(return_value=response)
+        
+        grants = scraper.search('organoid', max_results=10)
+        
+        assert [g['project_num'] for g in grants] == ['R01CA1', 'R01CA2']
+        assert grants[1]['award_amount'] == 250000.5
+        assert response.close.called
+        request = scraper.fetch_stream.call_args.kwargs
+        assert request['json_data']['criteria']['advanced_text_search']['search_text'] == 'organoid'
+    
+    def test_search_by_terms_budget(self):
+        """Test that terms repeating earlier grants stop paging early."""
+        from bioleads.scrapers import NIHReporterScraper
+        
+        def fake_page(query, cursor, limit, fiscal_years):
+            # 'organoid' has 40 grants; 'organoids' mostly repeats them
+            offset = cursor[1]
+            if query == 'organoid':
+                nums = range(offset, min(offset + limit, 40))
+            else:
+                nums = list(range(offset, offset + limit - 1)) + [100 + offset]
+            return [{'project_num': f'P{n}'} for n in nums], 40
+        
+        scraper = NIHReporterScraper()
+        
+        with patch.object(scraper, '_search_page', side_effect=fake_page) as page:
+            grants = scraper.search_by_terms(['organoid', 'organoids'], max_results=30)
+        
+        assert len(grants) == 30
+        assert len({g['project_num'] for g in grants}) == 30
+        # 'organoids' is dropped after its first, mostly duplicate page
+        assert [c.args[0] for c in page.call_args_list].count('organoids') == 1
+    
     def test_parse_lead(self):
         """Test parsing NIH grant to lead format."""
         from bioleads.scrapers import NIHReporterScraper
@@ -171,6 +493,26 @@ class TestOpenAlexScraper:
         
         assert abstract == 'This is a test'
     
+    def test_run_parses_repeated_works_once(self):
+        """Test that a work returned by several queries is parsed once."""
+        from bioleads.scrapers import OpenAlexScraper
+        
+        scraper = OpenAlexScraper()
+        work = {
+            'id': 'https://openalex.org/W1',
+            'title': 'Organoids',
+            'abstract_inverted_index': {'Organoid': [0], 'models': [1]},
+            'authorships': [{'author': {'display_name': 'Jane Smith'}, 'institutions': []}],
+        }
+        scraper.search = Mock(return_value=[work])
+        
+        with patch.object(scraper, '_reconstruct_abstract', wraps=scraper._reconstruct_abstract) as rebuild:
+            leads = list(scraper.run(['organoid', 'spheroid'], save_raw=False))
+        
+        assert scraper.search.call_count == 2
+        assert rebuild.call_count == 1
+        assert len(leads) == 1
+    
     def test_get_location(self):
         """Test location extraction from institution."""
         from bioleads.scrapers import OpenAlexScraper
@@ -189,6 +531,105 @@ class TestOpenAlexScraper:
         
         assert 'Boston' in location
         assert 'Massachusetts' in location
+    
+    def test_parse_lead_relevant_concepts_first(self):
+        """Test that target concepts lead the research focus."""
+        from bioleads.scrapers import OpenAlexScraper
+        
+        scraper = OpenAlexScraper()
+        
+        work = {
+            'id': 'W1',
+            'authorships': [{'author': {'id': 'A1', 'display_name': 'Jane Smith'}}],
+            'concepts': [
+                {'id': 'https://openalex.org/C1', 'display_name': 'Biology'},
+                {'id': 'https://openalex.org/C203014093', 'display_name': 'Organoid'},
+                {'id': 'https://openalex.org/C2', 'display_name': 'Medicine'},
+            ],
+        }
+        
+        lead = scraper.parse_lead(work)
+        
+        assert lead['research_focus'] == ['Organoid', 'Biology', 'Medicine']
+    
+    def test_run_with_keywords_dedupes_authors(self):
+        """Test that works by the same author collapse into one lead."""
+        from bioleads.scrapers import OpenAlexScraper
+        
+        scraper = OpenAlexScraper()
+        
+        def work(work_id, author_id, cited):
+            return {
+                'id': work_id,
+                'cited_by_count': cited,
+                'authorships': [{'author': {'id': author_id, 'display_name': author_id}}],
+            }
+        
+        scraper.search_by_concepts = Mock(return_value=[
+            work('W1', 'A1', 10),
+            work('W2', 'A2', 5),
+            work('W3', 'A1', 30),
+        ])
+        scraper.search_authors = Mock(return_value=[])
+        
+        leads = scraper.run_with_keywords(save_raw=False)
+        
+        assert [l['openalex_author_id'] for l in leads] == ['A1', 'A2']
+        assert leads[0]['publications'] == 2
+        assert leads[0]['cited_by_count'] == 30
+        assert 'raw_data' not in leads[0]
+    
+    @patch('bioleads.scrapers.openalex_scraper.ijson', None)
+    def test_search_resumes_from_cursor_state(self, tmp_path):
+        """Test that an interrupted scan resumes from the saved cursor."""
+        from bioleads.scrapers import OpenAlexScraper
+        
+        scraper = OpenAlexScraper()
+        state_path = tmp_path / 'cursor.json'
+        pages = {
+            '*': {'meta': {'next_cursor': 'c2'}, 'results': [{'id': 'W1'}]},
+            'c2': {'meta': {'next_cursor': None}, 'results': [{'id': 'W2'}]},
+        }
+        
+        # Second page fails: the cursor for it is kept on disk
+        scraper.fetch = Mock(side_effect=[pages['*'], None])
+        assert [w['id'] for w in scraper.search('organoid', 10, str(state_path))] == ['W1']
+        assert json.loads(state_path.read_text())['cursor'] == 'c2'
+        
+        # A different query ignores the saved cursor
+        scraper.fetch = Mock(side_effect=lambda endpoint, params: pages[params['cursor']])
+        scraper.search('spheroid', 10, str(state_path))
+        assert scraper.fetch.call_args_list[0].kwargs['params']['cursor'] == '*'
+        
+        scraper.fetch = Mock(side_effect=[pages['*'], None])
+        scraper.search('organoid', 10, str(state_path))
+        scraper.fetch = Mock(side_effect=lambda endpoint, params: pages[params['cursor']])
+        assert [w['id'] for w in scraper.search('organoid', 10, str(state_path))] == ['W2']
+        assert not state_path.exists()
+    
+    @patch('bioleads.scrapers.openalex_scraper.ijson', None)
+    def test_search_by_concepts_batches(self):
+        """Test that concepts are OR-ed into batched requests."""
+        from bioleads.scrapers import OpenAlexScraper
+        
+        scraper = OpenAlexScraper()
+        pages = {
+            'C1|C2': [{'id': 'W1'}, {'id': 'W2'}],
+            'C3': [{'id': 'W2'}, {'id': 'W3'}],
+        }
+        per_page = {}
+        
+        def fake_fetch(endpoint, params):
+            concepts = params['filter'].split(',')[0].split(':')[1]
+            per_page[concepts] = params['per_page']
+            return {'meta': {'next_cursor': None}, 'results': pages[concepts]}
+        
+        scraper.fetch = Mock(side_effect=fake_fetch)
+        
+        works = scraper.search_by_concepts(['C1', 'C2', 'C3'], max_results=5, batch_size=2)
+        
+        assert [w['id'] for w in works] == ['W1', 'W2', 'W3']
+        assert per_page == {'C1|C2': 10, 'C3': 5}
 
 
 class TestClinicalTrialsScraper:
@@ -209,3 +650,85 @@ class TestClinicalTrialsScraper:
         formatted = scraper._format_location(location)
         
         assert formatted == 'Boston, MA, United States'
+    
+    def test_parse_record(self):
+        """Test that the slotted trial record converts to the lead dict."""
+        from bioleads.scrapers import ClinicalTrialsScraper, TrialLead
+        
+        scraper = ClinicalTrialsScraper()
+        
+        raw_data = {
+            'protocolSection': {
+                'identificationModule': {'nctId': 'NCT01234567', 'briefTitle': 'Organoid study'},
+                'sponsorCollaboratorsModule': {'leadSponsor': {'name': 'Acme Bio', 'class': 'INDUSTRY'}},
+                'contactsLocationsModule': {
+                    'overallOfficials': [{'name': 'Dr. Jane Smith', 'role': 'PRINCIPAL_INVESTIGATOR'}],
+                },
+                'conditionsModule': {'conditions': ['Liver Disease'], 'keywords': ['organoid']},
+            },
+        }
+        
+        record = scraper.parse_record(raw_data)
+        
+        assert isinstance(record, TrialLead)
+        assert not hasattr(record, '__dict__')
+        
+        lead = scraper.parse_lead(raw_data)
+        
+        assert lead == record.to_dict()
+        assert lead['institution'] == 'Acme Bio'
+        assert lead['clinical_trial']['title'] == 'Organoid study'
+        assert lead['research_focus'] == ['Liver Disease', 'organoid']
+        assert 'raw_data' not in lead
+    
+    def test_run_with_keywords_raw_ndjson(self, tmp_path):
+        """Test that raw trials stream to NDJSON and empty runs leave no file."""
+        from bioleads.scrapers import ClinicalTrialsScraper
+        
+        scraper = ClinicalTrialsScraper()
+        scraper.storage_path = tmp_path
+        trial = {'protocolSection': {'identificationModule': {'nctId': 'NCT01234567'}}}
+        
+        scraper.search_many = Mock(return_value=iter([[]]))
+        assert list(scraper.run_with_keywords()) == []
+        assert list(scraper.storage_path.glob('all_trials_*')) == []
+        
+        scraper.search_many = Mock(return_value=iter([[trial], [trial]]))
+        list(scraper.run_with_keywords())
+        saved = list(scraper.storage_path.glob('all_trials_*.ndjson'))
+        assert len(saved) == 1
+        assert [json.loads(line) for line in saved[0].read_text().splitlines()] == [trial]
+
+
+class TestConferenceScraper:
+    """Tests for conference scraper."""
+    
+    def test_program_revalidated_and_parsed_once(self, tmp_path):
+        """Test that an unchanged program page is revalidated, not re-parsed."""
+        from bioleads.scrapers.conference_scraper import ConferenceScraper
+        
+        scraper = ConferenceScraper('sot')
+        scraper.storage_path = tmp_path
+        scraper._rate_limit_wait = Mock()
+        
+        html = (
+            '<html><body><div class="session">'
+            '<h3>Liver organoid toxicity</h3>'
+            '<span class="author">Dr. Jane Smith</span>'
+            '</div></body></html>'
+        )
+        fresh = Mock(status_code=200, text=html, headers={'ETag': '"v1"'})
+        unchanged = Mock(status_code=304, text='', headers={})
+        scraper.session = Mock()
+        scraper.session.get.side_effect = [fresh, unchanged]
+        
+        with patch.object(scraper, '_parse_program', wraps=scraper._parse_program) as parse:
+            first = scraper.search('organoid')
+            second = scraper.search('toxicity')
+        
+        assert first == second
+        assert first[0]['presenter'] == 'Dr. Jane Smith'
+        assert parse.call_count == 1
+        
+        revalidate_headers = scraper.session.get.call_args_list[1].kwargs['headers']
+        assert revalidate_headers['If-None-Match'] == '"v1"'